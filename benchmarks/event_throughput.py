@@ -0,0 +1,67 @@
+"""
+Chunk Event Throughput
+======================
+
+Microbenchmark for the per-token hot path: building one event per streamed
+chunk and serializing it for the WebSocket. Compares the validated pydantic
+``CouncilEvent`` with the slotted ``ChunkEvent`` strategies now emit.
+
+Run from the repository root:
+    $ python benchmarks/event_throughput.py --events 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from council.models import ChunkEvent, CouncilEvent, EventType  # noqa: E402
+
+
+def make_council_event(i: int):
+    return CouncilEvent(type=EventType.AGENT_CHUNK, agent="Analyst", round=1, content="tok ")
+
+
+def make_chunk_event(i: int):
+    return ChunkEvent(type=EventType.AGENT_CHUNK, agent="Analyst", round=1, content="tok ")
+
+
+def create_only(make: Callable[[int], object], n: int) -> float:
+    """Events per second for construction alone."""
+    start = time.perf_counter()
+    for i in range(n):
+        make(i)
+    return n / (time.perf_counter() - start)
+
+
+def create_and_send(make: Callable[[int], object], n: int) -> float:
+    """Events per second for construction plus ``to_dict()`` and JSON encoding."""
+    dumps = json.dumps
+    start = time.perf_counter()
+    for i in range(n):
+        dumps(make(i).to_dict())
+    return n / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Chunk event throughput benchmark")
+    parser.add_argument("--events", type=int, default=200_000, help="Events per measurement")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is kept)")
+    args = parser.parse_args()
+
+    print(f"{args.events:,} chunk events, best of {args.repeat}\n")
+    print(f"{'measurement':<22}{'CouncilEvent':>16}{'ChunkEvent':>16}{'speedup':>10}")
+    for name, measure in [("create", create_only), ("create + serialize", create_and_send)]:
+        before = max(measure(make_council_event, args.events) for _ in range(args.repeat))
+        after = max(measure(make_chunk_event, args.events) for _ in range(args.repeat))
+        print(f"{name:<22}{before:>12,.0f}/s{after:>14,.0f}/s{after / before:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -23,15 +23,19 @@ See README.md for full documentation.
 from council.config import load_config, CouncilConfig
 from council.engine import CouncilEngine
 from council.agent import Agent
-from council.lm_studio import LMStudioClient
+from council.lm_studio import LMStudioClient, ModelResidencyManager, ResidencyView
 from council.models import (
     AgentMessage,
+    ChunkEvent,
     CouncilResult,
     CouncilEvent,
     EventType,
     ModelInfo,
     AgentConfig,
     CouncilPreset,
+    DeliveryMode,
+    ExecutionMode,
+    TurnOrder,
 )
 
 __all__ = [
@@ -40,13 +44,19 @@ __all__ = [
     "CouncilEngine",
     "Agent",
     "LMStudioClient",
+    "ModelResidencyManager",
+    "ResidencyView",
     "AgentMessage",
     "CouncilResult",
     "CouncilEvent",
+    "ChunkEvent",
     "EventType",
     "ModelInfo",
     "AgentConfig",
     "CouncilPreset",
+    "TurnOrder",
+    "ExecutionMode",
+    "DeliveryMode",
 ]
 
 __version__ = "1.0.0"
@@ -0,0 +1,667 @@
+"""
+Backend Pool
+============
+
+Spreads council work over several OpenAI-compatible inference servers
+(LM Studio instances on different machines, or anything speaking the same
+API). Each server gets its own ``LMStudioClient`` — with its own residency
+manager, memory budget and request limiter — and the pool routes every call
+for a model to one of the servers that serves it:
+
+    1. Servers currently failing health checks are skipped
+    2. A server that already has the model loaded beats one that doesn't
+    3. Among those, the server with the shortest request queue wins
+
+A background health check drops servers that stop answering and re-adds
+them once they recover.
+
+Hedged requests: when a streamed completion's first token takes longer than
+a high percentile of that model's recorded time-to-first-token, the same
+request is sent to the next-best server that already has the model loaded.
+Whichever server streams first is used and the other request is cancelled,
+so one stalled server doesn't hold up a whole debate round.
+
+Failover: if a server fails a streamed completion before sending anything
+(unreachable, HTTP error), the request moves to another server that serves
+the model, loading it there if needed.
+
+``BackendPool`` exposes the same interface as ``LMStudioClient``; its
+``residency`` and ``limiter`` implement ``ResidencyView`` and
+``LimiterView``, so the engine and strategies use it without knowing how
+many servers there are.
+
+Usage:
+    >>> pool = BackendPool([
+    ...     Backend("box-a", LMStudioClient("http://10.0.0.5:1234/v1")),
+    ...     Backend("box-b", LMStudioClient("http://10.0.0.6:1234/v1"),
+    ...             models={"qwen2.5-7b-instruct"}),
+    ... ])
+    >>> async for chunk in pool.chat_stream("qwen2.5-7b-instruct", messages):
+    ...     print(chunk, end="")
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, AsyncGenerator, Callable, Iterable, Optional
+
+from council.lm_studio import ChatStreamError, LMStudioClient, stream_error_text
+from council.models import CouncilEvent
+from council.profiler import TTFT_SECONDS, ModelProfiler
+
+logger = logging.getLogger(__name__)
+
+
+class Backend:
+    """
+    One inference server in the pool.
+
+    Attributes:
+        name: Display name (e.g., "box-a")
+        client: Client for this server
+        models: Model identifiers this server serves (empty = all models)
+        healthy: Whether the last health check succeeded
+        hedges_sent: Hedged duplicates this server received
+        hedges_won: Hedged duplicates that streamed before the original
+    """
+
+    def __init__(
+        self,
+        name: str,
+        client: LMStudioClient,
+        models: Optional[Iterable[str]] = None,
+    ):
+        self.name = name
+        self.client = client
+        self.models = set(models or ())
+        self.healthy = True
+        self.hedges_sent = 0
+        self.hedges_won = 0
+
+    def serves(self, identifier: str) -> bool:
+        """Whether this server is configured to serve a model."""
+        return not self.models or identifier in self.models
+
+    def queue_length(self) -> int:
+        """Chat completions in flight or waiting on this server."""
+        stats = self.client.limiter.stats()["backend"]
+        return stats["in_flight"] + stats["waiting"]
+
+    def __repr__(self) -> str:
+        return f"Backend(name='{self.name}', url='{self.client.base_url}')"
+
+
+class _StreamAttempt:
+    """One server's attempt at a streamed completion, pumped into a queue."""
+
+    _END = object()
+
+    def __init__(self, backend: Backend, stream: AsyncGenerator[str, None]):
+        self.backend = backend
+        self.started = time.monotonic()
+        self.first_item: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._first_at: Optional[float] = None
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._pump(stream))
+
+    async def _put(self, item: Any):
+        if not self.first_item.done():
+            self._first_at = time.monotonic()
+            self.first_item.set_result(item)
+        await self._queue.put(item)
+
+    async def _pump(self, stream: AsyncGenerator[str, None]):
+        try:
+            async for chunk in stream:
+                await self._put(chunk)
+        except Exception as e:
+            await self._put(e)
+        else:
+            await self._put(self._END)
+
+    def failed(self) -> bool:
+        """Whether the attempt ended with an error before streaming anything."""
+        return isinstance(self.first_item.result(), Exception)
+
+    def error(self) -> Optional[Exception]:
+        """The error the attempt failed with, if it failed."""
+        return self.first_item.result() if self.failed() else None
+
+    def waited(self) -> float:
+        """Seconds until the first item arrived (or so far, if it hasn't)."""
+        return (self._first_at or time.monotonic()) - self.started
+
+    async def cancel(self):
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+
+    async def chunks(self) -> AsyncGenerator[str, None]:
+        while (item := await self._queue.get()) is not self._END:
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+
+class PoolResidency:
+    """
+    Residency view across every server in a pool (a ``ResidencyView``).
+
+    Per-model questions are answered by the server the model would be routed
+    to; whole-pool figures (budget, resident set, simulations) combine the
+    servers' own residency managers.
+    """
+
+    def __init__(self, pool: "BackendPool"):
+        self.pool = pool
+
+    def _managers(self, identifier: Optional[str] = None):
+        return [
+            b.client.residency for b in self.pool.backends
+            if identifier is None or b.serves(identifier)
+        ]
+
+    @property
+    def memory_budget_gb(self) -> float:
+        """Combined budget of all servers (0 if any server is unlimited)."""
+        budgets = [m.memory_budget_gb for m in self._managers()]
+        return 0.0 if any(b <= 0 for b in budgets) else sum(budgets)
+
+    def register_model(
+        self, identifier: str, size: str = "", memory_gb: Optional[float] = None
+    ):
+        for manager in self._managers(identifier):
+            manager.register_model(identifier, size, memory_gb)
+
+    def footprint_gb(self, identifier: str) -> float:
+        return self.pool.route(identifier).client.residency.footprint_gb(identifier)
+
+    def is_resident(self, identifier: str) -> bool:
+        return any(
+            b.client.residency.is_resident(identifier)
+            for b in self.pool.available(identifier)
+        )
+
+    def is_pinned(self, identifier: str) -> bool:
+        return any(m.is_pinned(identifier) for m in self._managers(identifier))
+
+    def resident_gb(self) -> float:
+        """Total footprint of resident models across all servers."""
+        return sum(m.resident_gb() for m in self._managers())
+
+    def touch(self, identifier: str):
+        for manager in self._managers(identifier):
+            manager.touch(identifier)
+
+    def idle_seconds(self) -> dict[str, float]:
+        """Idle time per resident model (least idle copy, if on several servers)."""
+        idle: dict[str, float] = {}
+        for manager in self._managers():
+            for identifier, seconds in manager.idle_seconds().items():
+                idle[identifier] = min(seconds, idle.get(identifier, seconds))
+        return dict(sorted(idle.items(), key=lambda item: -item[1]))
+
+    def resident_identifiers(self) -> list[str]:
+        """Resident models across the pool, least recently used first."""
+        return list(self.idle_seconds())
+
+    def fits(self, identifier: str, protect: Iterable[str] = ()) -> bool:
+        backend = self.pool.route(identifier)
+        return backend.client.residency.fits(identifier, protect)
+
+    def _by_backend(
+        self,
+        sequence: list[str],
+        resident: Optional[list[str]],
+    ) -> Iterable[tuple[Backend, list[str], Optional[list[str]]]]:
+        """Split a sequence and starting set by the server each model routes to now."""
+        homes = {i: self.pool.route(i) for i in sequence + list(resident or [])}
+        for backend in self.pool.backends:
+            mine = [i for i in sequence if homes[i] is backend]
+            start = (
+                None if resident is None
+                else [i for i in resident if homes[i] is backend]
+            )
+            if mine or start:
+                yield backend, mine, start
+
+    def simulate(
+        self,
+        sequence: Iterable[str],
+        resident: Optional[Iterable[str]] = None,
+    ) -> tuple[int, float]:
+        """
+        Replay a sequence against each server's eviction policy.
+
+        Every model is assumed to run on the server it would be routed to
+        now. Loads are summed over servers, as are their peak footprints.
+        """
+        sequence = list(sequence)
+        resident = None if resident is None else list(resident)
+        loads, peak = 0, 0.0
+        for backend, mine, start in self._by_backend(sequence, resident):
+            backend_loads, backend_peak = backend.client.residency.simulate(mine, start)
+            loads += backend_loads
+            peak += backend_peak
+        return loads, round(peak, 2)
+
+    def predict_resident(
+        self,
+        sequence: Iterable[str],
+        resident: Optional[Iterable[str]] = None,
+    ) -> list[str]:
+        """
+        Resident models (LRU first) predicted after a sequence of model uses.
+
+        Each server replays the models routed to it, as in ``simulate()``;
+        the servers' predicted sets are merged in order of last use.
+        """
+        sequence = list(sequence)
+        start = self.resident_identifiers() if resident is None else list(resident)
+        kept: set[str] = set()
+        for backend, mine, backend_start in self._by_backend(sequence, start):
+            kept.update(backend.client.residency.predict_resident(mine, backend_start))
+        last_use = {i: n for n, i in enumerate(start)}
+        last_use.update({i: len(start) + n for n, i in enumerate(sequence)})
+        return sorted(kept, key=lambda i: last_use.get(i, -1))
+
+    async def ensure_resident(
+        self, identifier: str, protect: Iterable[str] = ()
+    ) -> bool:
+        return await self.pool.ensure_model_loaded(identifier, protect)
+
+    def add_listener(self, listener: Callable[[CouncilEvent], None]):
+        for manager in self._managers():
+            manager.add_listener(listener)
+
+    async def unload(self, identifier: str, reason: str) -> bool:
+        """Unload a model from every server it is resident on."""
+        unloaded = True
+        for manager in self._managers(identifier):
+            if manager.is_resident(identifier):
+                unloaded = await manager.unload(identifier, reason) and unloaded
+        return unloaded
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "memory_budget_gb": self.memory_budget_gb,
+            "backends": {
+                b.name: {"healthy": b.healthy, **b.client.residency.snapshot()}
+                for b in self.pool.backends
+            },
+        }
+
+
+class PoolLimiter:
+    """Request limiter view across every server in a pool (a ``LimiterView``)."""
+
+    def __init__(self, pool: "BackendPool"):
+        self.pool = pool
+
+    def set_model_limit(self, identifier: str, limit: Optional[int]):
+        for backend in self.pool.backends:
+            if backend.serves(identifier):
+                backend.client.limiter.set_model_limit(identifier, limit)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "backends": {
+                b.name: b.client.limiter.stats() for b in self.pool.backends
+            },
+        }
+
+
+class BackendPool:
+    """
+    Routes LM Studio client calls across several servers.
+
+    Attributes:
+        backends: Servers in the pool, in config order (the tie-breaker)
+        residency: Residency view across all servers
+        limiter: Request limiter view across all servers
+    """
+
+    def __init__(
+        self,
+        backends: list[Backend],
+        profiler: Optional[ModelProfiler] = None,
+        hedge_percentile: float = 95.0,
+        hedge_min_samples: int = 20,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            backends: Servers to route between (at least one)
+            profiler: Source of TTFT history for hedging (None = never hedge)
+            hedge_percentile: TTFT percentile after which a streamed request
+                              is duplicated on another server (0 = never hedge)
+            hedge_min_samples: TTFT samples needed before a model is hedged
+        """
+        if not backends:
+            raise ValueError("A backend pool needs at least one backend")
+        self.backends = backends
+        self.profiler = profiler
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
+        self.residency = PoolResidency(self)
+        self.limiter = PoolLimiter(self)
+
+    @property
+    def base_url(self) -> str:
+        return ", ".join(b.client.base_url for b in self.backends)
+
+    async def close(self):
+        """Clean up every server's HTTP connections."""
+        for backend in self.backends:
+            await backend.client.close()
+
+    # =========================================================================
+    # Routing
+    # =========================================================================
+
+    def available(self, identifier: str) -> list[Backend]:
+        """Healthy servers that serve a model (all servers serving it if none are healthy)."""
+        serving = [b for b in self.backends if b.serves(identifier)]
+        healthy = [b for b in serving if b.healthy]
+        return healthy or serving or self.backends
+
+    def route(self, identifier: str) -> Backend:
+        """
+        Pick the server for the next call on a model.
+
+        Prefers servers with the model already loaded, then the shortest
+        request queue, then config order.
+        """
+        candidates = self.available(identifier)
+        return min(
+            candidates,
+            key=lambda b: (
+                not b.client.residency.is_resident(identifier),
+                b.queue_length(),
+            ),
+        )
+
+    def hedge_delay(self, identifier: str) -> Optional[float]:
+        """
+        Seconds to wait for a model's first token before hedging.
+
+        Returns:
+            The configured TTFT percentile, or None if hedging is off or the
+            model doesn't have enough recorded history yet.
+        """
+        if not self.profiler or self.hedge_percentile <= 0:
+            return None
+        if self.profiler.sample_count(identifier, TTFT_SECONDS) < self.hedge_min_samples:
+            return None
+        return self.profiler.percentile(identifier, TTFT_SECONDS, self.hedge_percentile)
+
+    def hedge_target(
+        self, identifier: str, exclude: Iterable[Backend]
+    ) -> Optional[Backend]:
+        """
+        Best other server for a hedged duplicate, if any.
+
+        Only servers that already have the model loaded qualify. A duplicate
+        that has to load the model first would almost never win the race, and
+        the load could evict a model another request is about to use.
+        """
+        exclude = set(exclude)
+        others = [
+            b for b in self.available(identifier)
+            if b not in exclude and b.healthy
+            and b.client.residency.is_resident(identifier)
+        ]
+        if not others:
+            return None
+        return min(others, key=lambda b: b.queue_length())
+
+    def failover_target(
+        self, identifier: str, exclude: Iterable[Backend]
+    ) -> Optional[Backend]:
+        """Best server not yet tried for a request that failed elsewhere."""
+        exclude = set(exclude)
+        others = [b for b in self.available(identifier) if b not in exclude]
+        if not others:
+            return None
+        return min(
+            others,
+            key=lambda b: (
+                not b.client.residency.is_resident(identifier),
+                b.queue_length(),
+            ),
+        )
+
+    # =========================================================================
+    # Health
+    # =========================================================================
+
+    async def check_backends(self):
+        """Health-check every server, dropping or re-adding it as needed."""
+        results = await asyncio.gather(
+            *(b.client.health_check() for b in self.backends)
+        )
+        for backend, healthy in zip(self.backends, results):
+            if healthy and not backend.healthy:
+                logger.info(f"Backend '{backend.name}' is back; routing to it again")
+                # Its models may have changed while it was away
+                await backend.client.get_loaded_models()
+            elif not healthy and backend.healthy:
+                logger.warning(f"Backend '{backend.name}' failed its health check; dropping it")
+            backend.healthy = healthy
+
+    async def run_health_checks(self, interval: float):
+        """
+        Health-check the servers every ``interval`` seconds until cancelled.
+
+        Args:
+            interval: Seconds between checks
+        """
+        while True:
+            try:
+                await self.check_backends()
+            except Exception as e:
+                logger.warning(f"Backend health check failed: {e}")
+            await asyncio.sleep(interval)
+
+    def status(self) -> list[dict[str, Any]]:
+        """Per-server health, models and queue length."""
+        return [
+            {
+                "name": b.name,
+                "base_url": b.client.base_url,
+                "healthy": b.healthy,
+                "models": sorted(b.models) or "all",
+                "loaded": b.client.residency.resident_identifiers(),
+                "queue_length": b.queue_length(),
+                "hedges_sent": b.hedges_sent,
+                "hedges_won": b.hedges_won,
+            }
+            for b in self.backends
+        ]
+
+    # =========================================================================
+    # LMStudioClient interface
+    # =========================================================================
+
+    async def list_models(self) -> list[dict[str, Any]]:
+        """Models available on any healthy server (each listed once)."""
+        seen: dict[str, dict[str, Any]] = {}
+        for backend in self.backends:
+            if not backend.healthy:
+                continue
+            for model in await backend.client.list_models():
+                seen.setdefault(model.get("id", ""), model)
+        return list(seen.values())
+
+    async def get_loaded_models(self) -> list[dict[str, Any]]:
+        """Models loaded on any healthy server (each listed once)."""
+        seen: dict[str, dict[str, Any]] = {}
+        for backend in self.backends:
+            if not backend.healthy:
+                continue
+            for model in await backend.client.get_loaded_models():
+                seen.setdefault(model.get("id", ""), model)
+        return list(seen.values())
+
+    async def is_model_loaded(self, model_identifier: str) -> bool:
+        for backend in self.available(model_identifier):
+            if await backend.client.is_model_loaded(model_identifier):
+                return True
+        return False
+
+    async def load_model(self, model_identifier: str) -> bool:
+        return await self.route(model_identifier).client.load_model(model_identifier)
+
+    async def unload_model(self, model_identifier: str) -> bool:
+        """Unload a model from every server that serves it."""
+        results = [
+            await b.client.unload_model(model_identifier)
+            for b in self.backends if b.serves(model_identifier)
+        ]
+        return any(results)
+
+    async def ensure_model_loaded(
+        self, model_identifier: str, protect: Iterable[str] = ()
+    ) -> bool:
+        backend = self.route(model_identifier)
+        return await backend.client.ensure_model_loaded(model_identifier, protect)
+
+    async def _backend_stream(
+        self,
+        backend: Backend,
+        model_identifier: str,
+        messages: list[dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        load: bool = False,
+    ) -> AsyncGenerator[str, None]:
+        """Stream from one server, optionally loading the model there first."""
+        if load and not backend.client.residency.is_resident(model_identifier):
+            if not await backend.client.ensure_model_loaded(model_identifier):
+                raise ChatStreamError(f"could not load the model on '{backend.name}'")
+        async for chunk in backend.client.chat_stream(
+            model_identifier, messages, temperature, max_tokens, raise_errors=True
+        ):
+            yield chunk
+
+    async def chat_stream(
+        self,
+        model_identifier: str,
+        messages: list[dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: int = 2048,
+    ) -> AsyncGenerator[str, None]:
+        """
+        Stream a completion, failing over or hedging across servers.
+
+        If a server fails before streaming anything, the request moves to the
+        next server that serves the model. If the first token takes longer
+        than ``hedge_delay`` and another server has the model loaded, the
+        request is duplicated there; the first server to stream wins and the
+        other request is cancelled. Once every server has failed, or a server
+        fails mid-stream, the stream ends with an ``[Error: ...]`` message
+        like ``LMStudioClient.chat_stream``.
+        """
+        backend = self.route(model_identifier)
+        delay = self.hedge_delay(model_identifier)
+
+        def attempt(target: Backend, load: bool = False) -> _StreamAttempt:
+            tried.append(target)
+            return _StreamAttempt(target, self._backend_stream(
+                target, model_identifier, messages, temperature, max_tokens, load
+            ))
+
+        tried: list[Backend] = []
+        hedges: set[_StreamAttempt] = set()
+        attempts = [attempt(backend)]
+        try:
+            winner: Optional[_StreamAttempt] = None
+            hedged = delay is None
+            while winner is None:
+                done, _ = await asyncio.wait(
+                    [a.first_item for a in attempts],
+                    timeout=None if hedged else delay,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    # Straggling: race a duplicate on another server
+                    hedged = True
+                    target = self.hedge_target(model_identifier, tried)
+                    if target is None:
+                        continue
+                    logger.info(
+                        f"No first token from '{model_identifier}' on "
+                        f"'{backend.name}' after {delay:.2f}s; hedging on '{target.name}'"
+                    )
+                    target.hedges_sent += 1
+                    attempts.append(attempt(target))
+                    hedges.add(attempts[-1])
+                    continue
+                first = next(a for a in attempts if a.first_item.done())
+                if not first.failed():
+                    winner = first
+                    continue
+                attempts.remove(first)
+                logger.warning(
+                    f"'{model_identifier}' failed on '{first.backend.name}': {first.error()}"
+                )
+                if attempts:
+                    # A hedged duplicate is still running; let it finish
+                    continue
+                target = self.failover_target(model_identifier, tried)
+                if target is None:
+                    yield stream_error_text(model_identifier, first.error())
+                    return
+                logger.info(f"Failing '{model_identifier}' over to '{target.name}'")
+                attempts.append(attempt(target, load=True))
+
+            if winner in hedges:
+                winner.backend.hedges_won += 1
+            for loser in attempts:
+                if loser is not winner:
+                    # Cancelled requests never record their own TTFT; keep
+                    # their wait so far in the history as a lower bound
+                    if self.profiler:
+                        self.profiler.record_ttft(model_identifier, loser.waited())
+                    await loser.cancel()
+            attempts = [winner]
+
+            try:
+                async for chunk in winner.chunks():
+                    yield chunk
+            except ChatStreamError as e:
+                yield stream_error_text(model_identifier, e)
+        finally:
+            for pending in attempts:
+                await pending.cancel()
+
+    async def chat_once(
+        self,
+        model_identifier: str,
+        messages: list[dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: int = 2048,
+    ) -> str:
+        backend = self.route(model_identifier)
+        return await backend.client.chat_once(
+            model_identifier, messages, temperature, max_tokens
+        )
+
+    async def chat(
+        self,
+        model_identifier: str,
+        messages: list[dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: int = 2048,
+    ) -> str:
+        backend = self.route(model_identifier)
+        return await backend.client.chat(
+            model_identifier, messages, temperature, max_tokens
+        )
+
+    async def health_check(self) -> bool:
+        """True if at least one server is reachable."""
+        await self.check_backends()
+        return any(b.healthy for b in self.backends)
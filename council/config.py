@@ -29,9 +29,13 @@ from pydantic import BaseModel, Field
 from council.models import (
     AgentConfig,
     CouncilPreset,
+    DeliveryMode,
+    ExecutionMode,
     ModelInfo,
     ModeratorConfig,
+    STRATEGY_EXECUTION_MODES,
     StrategyType,
+    TurnOrder,
 )
 
 
@@ -42,10 +46,74 @@ class LMStudioConfig(BaseModel):
     Attributes:
         base_url: The base URL for LM Studio's API server
         api_key: API key (LM Studio uses a dummy key, defaults to "lm-studio")
+        memory_budget_gb: Max total memory for resident models; least-recently
+                          used models are unloaded to stay under it (0 = unlimited)
+        loaded_state_ttl_seconds: How long the known-loaded model cache is
+                                  trusted before re-querying LM Studio
+        idle_ttl_seconds: Default idle time after which a model no session is
+                          using gets unloaded (0 = never; per-model
+                          ``idle_ttl_seconds`` overrides it)
+        idle_check_interval_seconds: How often the idle reaper runs
+        max_concurrent_requests: Max chat completions in flight at once
+                                 against LM Studio — set to its parallel
+                                 slot count (further requests queue here)
+        max_concurrent_per_model: Default max in flight per model (0 = only
+                                  the backend limit; per-model
+                                  ``max_concurrent`` overrides it)
     """
 
     base_url: str = "http://localhost:1234/v1"
     api_key: str = "lm-studio"
+    memory_budget_gb: float = 0.0
+    loaded_state_ttl_seconds: float = 60.0
+    idle_ttl_seconds: float = 0.0
+    idle_check_interval_seconds: float = 30.0
+    max_concurrent_requests: int = 4
+    max_concurrent_per_model: int = 0
+
+
+class BackendConfig(BaseModel):
+    """
+    One inference server in a multi-server pool.
+
+    Unset limits fall back to the ``lm_studio`` section's values.
+
+    Attributes:
+        name: Display name (e.g., "box-a")
+        base_url: The server's OpenAI-compatible base URL (including /v1)
+        api_key: API key for this server
+        models: Model keys this server serves (empty = all models)
+        memory_budget_gb: Memory budget for this server's resident models
+        max_concurrent_requests: This server's parallel slot count
+    """
+
+    name: str
+    base_url: str
+    api_key: str = "lm-studio"
+    models: list[str] = Field(default_factory=list)
+    memory_budget_gb: Optional[float] = None
+    max_concurrent_requests: Optional[int] = None
+
+
+class BackendsConfig(BaseModel):
+    """
+    Multi-server pool settings.
+
+    With no servers listed, everything runs against ``lm_studio.base_url``.
+
+    Attributes:
+        servers: Inference servers to route between
+        health_check_interval_seconds: How often servers are health-checked
+        hedge_percentile: Send a duplicate request to another server when
+                          the first token takes longer than this percentile
+                          of the model's recorded TTFT (0 = never hedge)
+        hedge_min_samples: TTFT samples needed before a model is hedged
+    """
+
+    servers: list[BackendConfig] = Field(default_factory=list)
+    health_check_interval_seconds: float = 15.0
+    hedge_percentile: float = 95.0
+    hedge_min_samples: int = 20
 
 
 class DefaultsConfig(BaseModel):
@@ -56,11 +124,117 @@ class DefaultsConfig(BaseModel):
         temperature: Sampling temperature (0.0 = deterministic, 1.0 = creative)
         max_tokens: Maximum tokens per agent response
         council: Default council preset to use
+        delivery: How streamed tokens reach WebSocket clients that don't ask
+                  for a delivery mode ("full", "stream" or "coalesced")
+        coalesce_interval_ms: Coalesced delivery: longest a chunk waits to
+                              be merged with the next ones (0 = only merge
+                              chunks already queued)
+        coalesce_max_bytes: Coalesced delivery: send merged text as soon as
+                            it reaches this size (0 = no limit)
     """
 
     temperature: float = 0.7
     max_tokens: int = 2048
     council: str = "general"
+    delivery: DeliveryMode = DeliveryMode.FULL
+    coalesce_interval_ms: float = 30.0
+    coalesce_max_bytes: int = 2048
+
+
+class SchedulerConfig(BaseModel):
+    """
+    Cross-session turn scheduling settings.
+
+    Agent turns from all sessions queue for a limited number of slots and
+    are granted preferring models that are already loaded.
+
+    Attributes:
+        enabled: Route turns through the model-affinity queue
+        max_concurrent_turns: Turns allowed to run at once (None = the
+                              backends' parallel capacity: the sum of their
+                              ``max_concurrent_requests``)
+        max_wait_seconds: A turn waiting longer than this is run next
+                          regardless of model (fairness bound)
+    """
+
+    enabled: bool = True
+    max_concurrent_turns: Optional[int] = None
+    max_wait_seconds: float = 30.0
+
+
+class WarmupConfig(BaseModel):
+    """
+    Startup warmup settings.
+
+    At server startup, the default council's agent and moderator models are
+    loaded (as far as the memory budget allows) and primed with a tiny
+    completion in the background, so the first user doesn't pay cold loads.
+
+    Attributes:
+        enabled: Run warmup at startup
+        council: Preset to warm (defaults to ``defaults.council``)
+        prime: Send a one-token completion to each model after loading
+    """
+
+    enabled: bool = True
+    council: Optional[str] = None
+    prime: bool = True
+
+
+class AdmissionConfig(BaseModel):
+    """
+    Limits on concurrent council sessions (WebSocket ``/ws/council``).
+
+    Sessions beyond ``max_concurrent_sessions`` wait in a bounded queue and
+    are told their position; once the queue is full, new sessions are
+    rejected right away instead of slowing everyone down.
+
+    Attributes:
+        max_concurrent_sessions: Sessions allowed to run at once (0 = unlimited)
+        max_queue: Sessions allowed to wait for a free slot
+    """
+
+    max_concurrent_sessions: int = 2
+    max_queue: int = 10
+
+
+class ResumeConfig(BaseModel):
+    """
+    Replay buffer for resuming ``/ws/council`` sessions after a reconnect.
+
+    Every session event is numbered (``seq``) and the most recent ones are
+    kept per session, so a client that reconnects can ask for the events it
+    missed. A session whose client went away keeps running for
+    ``grace_seconds``; if nobody resumes it by then, it is cancelled.
+
+    Attributes:
+        buffer_events: Most recent events kept per session for replay
+        grace_seconds: How long a detached (or finished) session can still be
+                       resumed (0 = cancel at once on disconnect)
+    """
+
+    buffer_events: int = 2000
+    grace_seconds: float = 30.0
+
+
+class ProfilingConfig(BaseModel):
+    """
+    Per-model performance profiling settings.
+
+    Load duration, time-to-first-token and tokens/sec are recorded for every
+    model and persisted so the numbers survive restarts.
+
+    Attributes:
+        enabled: Record measurements
+        path: JSON file the profile is persisted to
+        ewma_alpha: Smoothing factor for the moving averages (higher = reacts faster)
+        window: Recent samples kept per metric for percentiles
+    """
+
+    enabled: bool = True
+    path: str = ".council_profile.json"
+    ewma_alpha: float = 0.2
+    window: int = 200
 
 
 class CouncilConfig(BaseModel):
@@ -76,12 +250,24 @@ class CouncilConfig(BaseModel):
         models: Dictionary of available models (key → ModelInfo)
         councils: Dictionary of council presets (key → CouncilPreset)
         defaults: Default parameters for council sessions
+        scheduler: Cross-session turn scheduling settings
+        warmup: Startup warmup settings
+        profiling: Per-model performance profiling settings
+        admission: Concurrent session limits and wait queue
+        resume: Replay buffer and grace period for reconnecting clients
+        backends: Inference servers to spread work across (optional)
     """
 
     lm_studio: LMStudioConfig = Field(default_factory=LMStudioConfig)
     models: dict[str, ModelInfo] = Field(default_factory=dict)
     councils: dict[str, CouncilPreset] = Field(default_factory=dict)
     defaults: DefaultsConfig = Field(default_factory=DefaultsConfig)
+    scheduler: SchedulerConfig = Field(default_factory=SchedulerConfig)
+    warmup: WarmupConfig = Field(default_factory=WarmupConfig)
+    profiling: ProfilingConfig = Field(default_factory=ProfilingConfig)
+    admission: AdmissionConfig = Field(default_factory=AdmissionConfig)
+    resume: ResumeConfig = Field(default_factory=ResumeConfig)
+    backends: BackendsConfig = Field(default_factory=BackendsConfig)
 
 
 def load_config(config_path: str = "config.yaml") -> CouncilConfig:
@@ -146,12 +332,21 @@ def load_config(config_path: str = "config.yaml") -> CouncilConfig:
 
         # Parse strategy
         strategy = StrategyType(council_data.get("strategy", "debate"))
+        execution_mode = ExecutionMode(council_data.get("execution_mode", "sequential"))
+        if execution_mode not in STRATEGY_EXECUTION_MODES[strategy]:
+            raise ValueError(
+                f"Council '{key}': execution_mode '{execution_mode.value}' doesn't "
+                f"apply to the {strategy.value} strategy. Supported: "
+                f"{sorted(m.value for m in STRATEGY_EXECUTION_MODES[strategy])}"
+            )
 
         councils[key] = CouncilPreset(
             name=council_data.get("name", key),
             description=council_data.get("description", ""),
             strategy=strategy,
             debate_rounds=council_data.get("debate_rounds", 2),
+            turn_order=TurnOrder(council_data.get("turn_order", "config")),
+            execution_mode=execution_mode,
             agents=agents,
             moderator=moderator,
         )
@@ -159,9 +354,40 @@ def load_config(config_path: str = "config.yaml") -> CouncilConfig:
     # Parse defaults
     defaults = DefaultsConfig(**(raw.get("defaults", {})))
 
+    # Parse scheduler settings
+    scheduler = SchedulerConfig(**(raw.get("scheduler", {})))
+
+    # Parse warmup settings
+    warmup = WarmupConfig(**(raw.get("warmup", {})))
+
+    # Parse profiling settings
+    profiling = ProfilingConfig(**(raw.get("profiling", {})))
+
+    # Parse session admission settings
+    admission = AdmissionConfig(**(raw.get("admission", {})))
+
+    # Parse session resume settings
+    resume = ResumeConfig(**(raw.get("resume") or {}))
+
+    # Parse backend pool settings
+    backends = BackendsConfig(**(raw.get("backends") or {}))
+    for server in backends.servers:
+        unknown = [key for key in server.models if key not in models]
+        if unknown:
+            raise ValueError(
+                f"Backend '{server.name}' lists unknown model(s) {unknown}. "
+                f"Available: {list(models.keys())}"
+            )
+
     return CouncilConfig(
         lm_studio=lm_studio,
         models=models,
         councils=councils,
         defaults=defaults,
+        scheduler=scheduler,
+        warmup=warmup,
+        profiling=profiling,
+        admission=admission,
+        resume=resume,
+        backends=backends,
     )
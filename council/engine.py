@@ -24,12 +24,19 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
-from typing import Any, AsyncGenerator, Optional
+from collections import Counter
+from typing import Any, AsyncGenerator, Iterable, Optional
 
 from council.agent import Agent
 from council.config import CouncilConfig
+from council.backends import Backend, BackendPool
 from council.lm_studio import LMStudioClient
+from council.planner import CouncilPlanner
+from council.profiler import ModelProfiler
+from council.scheduling import ModelAffinityQueue
 from council.models import (
     AgentConfig,
     CouncilEvent,
@@ -68,7 +75,10 @@ class CouncilEngine:
 
     Attributes:
         config: The loaded council configuration
-        client: LM Studio API client
+        client: LM Studio API client (a ``BackendPool`` when several
+                servers are configured)
+        turn_queue: Cross-session model-affinity queue that every agent
+                    turn passes through (None when disabled)
 
     Example:
         >>> engine = CouncilEngine(config)
@@ -85,13 +95,98 @@ class CouncilEngine:
             config: Loaded and validated council configuration
         """
         self.config = config
-        self.client = LMStudioClient(
-            base_url=config.lm_studio.base_url,
-            api_key=config.lm_studio.api_key,
+        self.profiler: Optional[ModelProfiler] = None
+        if config.profiling.enabled:
+            self.profiler = ModelProfiler(
+                config.profiling.path,
+                alpha=config.profiling.ewma_alpha,
+                window=config.profiling.window,
+            )
+
+        self.client: LMStudioClient | BackendPool = self._create_client()
+        for model in config.models.values():
+            self.client.residency.register_model(
+                model.identifier, model.size, model.memory_gb
+            )
+            self.client.limiter.set_model_limit(model.identifier, model.max_concurrent)
+
+        self.planner = CouncilPlanner(config, self.client.residency, self.profiler)
+
+        self.turn_queue: Optional[ModelAffinityQueue] = None
+        if config.scheduler.enabled:
+            max_turns = config.scheduler.max_concurrent_turns
+            self.turn_queue = ModelAffinityQueue(
+                self.client.residency,
+                max_concurrent=max_turns if max_turns is not None else self._request_capacity(),
+                max_wait_seconds=config.scheduler.max_wait_seconds,
+            )
+
+        # Models referenced by in-flight sessions (never reaped while > 0)
+        self._session_models: Counter[str] = Counter()
+
+        # Startup warmup progress (see warmup())
+        self._warmup_status: dict[str, Any] = {
+            "state": "pending" if config.warmup.enabled else "disabled",
+        }
+
+    def _request_capacity(self) -> int:
+        """Chat completions the configured backends can serve at once."""
+        lm = self.config.lm_studio
+        servers = self.config.backends.servers
+        if not servers:
+            return lm.max_concurrent_requests
+        return sum(s.max_concurrent_requests or lm.max_concurrent_requests for s in servers)
+
+    def _create_client(self) -> LMStudioClient | BackendPool:
+        """
+        Build the LM Studio client, or a pool when several servers are configured.
+
+        Returns:
+            A single ``LMStudioClient`` for ``lm_studio.base_url``, or a
+            ``BackendPool`` routing between ``backends.servers``.
+        """
+        lm = self.config.lm_studio
+
+        def make_client(base_url, api_key, budget, max_requests) -> LMStudioClient:
+            return LMStudioClient(
+                base_url=base_url,
+                api_key=api_key,
+                memory_budget_gb=budget,
+                loaded_state_ttl=lm.loaded_state_ttl_seconds,
+                profiler=self.profiler,
+                max_concurrent_requests=max_requests,
+                max_concurrent_per_model=lm.max_concurrent_per_model,
+            )
+
+        servers = self.config.backends.servers
+        if not servers:
+            return make_client(
+                lm.base_url, lm.api_key, lm.memory_budget_gb, lm.max_concurrent_requests
+            )
+
+        backends = []
+        for server in servers:
+            client = make_client(
+                server.base_url,
+                server.api_key,
+                server.memory_budget_gb
+                if server.memory_budget_gb is not None else lm.memory_budget_gb,
+                server.max_concurrent_requests or lm.max_concurrent_requests,
+            )
+            models = [self._resolve_model_identifier(key) for key in server.models]
+            backends.append(Backend(server.name, client, models))
+        logger.info(f"Backend pool: {[b.name for b in backends]}")
+        return BackendPool(
+            backends,
+            profiler=self.profiler,
+            hedge_percentile=self.config.backends.hedge_percentile,
+            hedge_min_samples=self.config.backends.hedge_min_samples,
         )
 
     async def close(self):
         """Clean up resources (HTTP connections, etc.)."""
+        if self.profiler:
+            await self.profiler.flush()
         await self.client.close()
 
     def _resolve_model_identifier(self, model_key: str) -> str:
@@ -225,6 +320,9 @@ class CouncilEngine:
             moderator=moderator,
             temperature=temperature,
             max_tokens=max_tokens,
+            turn_order=preset.turn_order,
+            execution_mode=preset.execution_mode,
+            turn_queue=self.turn_queue,
         )
 
     async def run(
@@ -254,7 +352,9 @@ class CouncilEngine:
                              for individual agents per session. (optional)
 
         Yields:
-            CouncilEvent objects for real-time streaming to the UI.
+            CouncilEvent objects for real-time streaming to the UI. Chunk
+            events (AGENT_CHUNK/MODERATOR_CHUNK) are lightweight ChunkEvent
+            objects with the same attributes and ``to_dict()``.
 
         Raises:
             KeyError: If the council_key is not found in configuration
@@ -311,8 +411,10 @@ class CouncilEngine:
             # Create and execute strategy
             strategy = self._create_strategy(preset, agents, moderator, temp, tokens)
 
-            async for event in strategy.execute(task, debate_rounds=rounds):
-                yield event
+            session_models = [a.model_identifier for a in agents + [moderator]]
+            with self.session_models(session_models):
+                async for event in strategy.execute(task, debate_rounds=rounds):
+                    yield event
 
         except KeyError as e:
             yield CouncilEvent(
@@ -345,6 +447,8 @@ class CouncilEngine:
                 "description": preset.description,
                 "strategy": preset.strategy.value,
                 "debate_rounds": preset.debate_rounds,
+                "turn_order": preset.turn_order.value,
+                "execution_mode": preset.execution_mode.value,
                 "agents": [
                     {"role": a.role, "model": a.model}
                     for a in preset.agents
@@ -388,3 +492,255 @@ class CouncilEngine:
             "connected": connected,
             "models": [m.get("id", "unknown") for m in models],
         }
+
+    def get_residency(self) -> dict[str, Any]:
+        """
+        Get the current model residency state.
+
+        Returns:
+            Dictionary with the memory budget, resident footprint, and
+            resident models ordered from least to most recently used.
+        """
+        return self.client.residency.snapshot()
+
+    def get_model_profile(self) -> dict[str, Any]:
+        """
+        Get the measured per-model performance profile.
+
+        Returns:
+            Dictionary mapping model identifier → metric → aggregates
+            (EWMA, p50, p95, sample count), or ``{}`` when profiling is off.
+        """
+        return self.profiler.snapshot() if self.profiler else {}
+
+    def plan_council(self, council_key: str, warm: bool = False) -> dict[str, Any]:
+        """
+        Predict memory, model swaps and duration for one session of a council.
+
+        Args:
+            council_key: Key of the council preset in config.yaml
+            warm: Start from the models resident right now instead of a
+                  cold start
+
+        Returns:
+            The plan (see ``CouncilPlanner.plan()``).
+
+        Raises:
+            KeyError: If the council key is not found
+        """
+        resident = self.client.residency.resident_identifiers() if warm else None
+        return self.planner.plan(council_key, resident=resident)
+
+    async def warmup(self, council_key: Optional[str] = None):
+        """
+        Load and prime a council's models ahead of the first session.
+
+        Agent models are warmed in config order, then the moderator's. A
+        model is skipped if it wouldn't fit in the memory budget alongside
+        the models already warmed. Each model gets a one-token completion
+        (if ``warmup.prime`` is set) so LM Studio's first real request
+        doesn't pay one-time initialization costs. Progress is available
+        from ``warmup_status()``.
+
+        Args:
+            council_key: Preset to warm (defaults to ``warmup.council`` or
+                         ``defaults.council``)
+        """
+        council_key = (
+            council_key or self.config.warmup.council or self.config.defaults.council
+        )
+        preset = self.config.councils.get(council_key)
+        if preset is None:
+            logger.warning(f"Warmup skipped: council '{council_key}' not found")
+            self._warmup_status = {"state": "failed", "council": council_key}
+            return
+
+        model_keys = [a.model for a in preset.agents]
+        if preset.moderator:
+            model_keys.append(preset.moderator.model)
+        identifiers: list[str] = []
+        for key in model_keys:
+            if key in self.config.models:
+                identifier = self._resolve_model_identifier(key)
+                if identifier not in identifiers:
+                    identifiers.append(identifier)
+
+        models = {i: "pending" for i in identifiers}
+        self._warmup_status = {
+            "state": "running",
+            "council": council_key,
+            "models": models,
+            "completed": 0,
+            "total": len(identifiers),
+        }
+        logger.info(f"Warming up '{council_key}' models: {identifiers}")
+
+        warmed: list[str] = []
+        for identifier in identifiers:
+            if not self.client.residency.fits(identifier, protect=warmed):
+                models[identifier] = "skipped"
+                logger.info(f"Warmup: skipping '{identifier}' (memory budget)")
+            else:
+                try:
+                    async with self.turn_slot(identifier):
+                        models[identifier] = "loading"
+                        loaded = await self.client.ensure_model_loaded(
+                            identifier, protect=warmed
+                        )
+                        if loaded and self.config.warmup.prime:
+                            models[identifier] = "priming"
+                            await self.client.chat_once(
+                                identifier,
+                                [{"role": "user", "content": "Hi"}],
+                                temperature=0.0,
+                                max_tokens=1,
+                            )
+                    models[identifier] = "ready" if loaded else "failed"
+                    if loaded:
+                        warmed.append(identifier)
+                except Exception as e:
+                    models[identifier] = "failed"
+                    logger.warning(f"Warmup of '{identifier}' failed: {e}")
+            self._warmup_status["completed"] += 1
+
+        self._warmup_status["state"] = "done"
+        logger.info(f"Warmup complete: {models}")
+
+    def warmup_status(self) -> dict[str, Any]:
+        """
+        Get startup warmup progress.
+
+        Returns:
+            Dictionary with ``state`` ("disabled", "pending", "running",
+            "done" or "failed") and, once started, per-model status plus
+            completed/total counts.
+        """
+        return self._warmup_status
+
+    @contextlib.contextmanager
+    def session_models(self, identifiers: Iterable[str]):
+        """
+        Mark models as referenced by an in-flight session.
+
+        The idle reaper never unloads a model while any session holds it.
+
+        Example:
+            >>> with engine.session_models(["qwen2.5-7b-instruct"]):
+            ...     ...  # run the session
+        """
+        identifiers = list(identifiers)
+        self._session_models.update(identifiers)
+        try:
+            yield
+        finally:
+            self._session_models.subtract(identifiers)
+            self._session_models += Counter()  # Drop zero counts
+
+    def _idle_ttl(self, model_identifier: str) -> float:
+        """Idle TTL for a model: its own setting, else the global default."""
+        for model in self.config.models.values():
+            if model.identifier == model_identifier and model.idle_ttl_seconds is not None:
+                return model.idle_ttl_seconds
+        return self.config.lm_studio.idle_ttl_seconds
+
+    async def reap_idle_models(self) -> list[str]:
+        """
+        Unload resident models that have been idle longer than their TTL.
+
+        Models referenced by in-flight sessions are skipped, as are models
+        whose TTL is 0. Unloads emit MODEL_UNLOADING / MODEL_UNLOADED to the
+        residency manager's listeners.
+
+        Returns:
+            Identifiers that were unloaded.
+        """
+        reaped = []
+        for identifier, idle in self.client.residency.idle_seconds().items():
+            ttl = self._idle_ttl(identifier)
+            if ttl <= 0 or idle < ttl or self._session_models[identifier] > 0:
+                continue
+            logger.info(f"Model '{identifier}' idle for {idle:.0f}s (TTL {ttl:.0f}s)")
+            if await self.client.residency.unload(identifier, reason="idle"):
+                reaped.append(identifier)
+        return reaped
+
+    async def run_idle_reaper(self):
+        """
+        Periodically unload idle models until cancelled.
+
+        Intended to run as a background task for the server's lifetime.
+        """
+        interval = self.config.lm_studio.idle_check_interval_seconds
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.reap_idle_models()
+            except Exception as e:
+                logger.warning(f"Idle reaper pass failed: {e}")
+
+    async def run_backend_health_checks(self):
+        """
+        Periodically health-check pooled servers until cancelled.
+
+        Servers that stop answering stop receiving requests until they
+        recover. Returns immediately when there is a single server.
+        """
+        if isinstance(self.client, BackendPool):
+            await self.client.run_health_checks(
+                self.config.backends.health_check_interval_seconds
+            )
+
+    def get_backends(self) -> list[dict[str, Any]]:
+        """
+        Get the inference servers work is routed to.
+
+        Returns:
+            Per server: name, URL, health, served and loaded models, and
+            request queue length.
+        """
+        if isinstance(self.client, BackendPool):
+            return self.client.status()
+        return [{
+            "name": "lm_studio",
+            "base_url": self.client.base_url,
+            "healthy": True,
+            "models": "all",
+            "loaded": self.client.residency.resident_identifiers(),
+            "queue_length": Backend("lm_studio", self.client).queue_length(),
+        }]
+
+    def turn_slot(self, model_identifier: str):
+        """
+        Async context manager holding a turn-queue slot for one agent turn.
+
+        A no-op when the cross-session scheduler is disabled.
+
+        Example:
+            >>> async with engine.turn_slot("qwen2.5-7b-instruct"):
+            ...     await engine.client.ensure_model_loaded("qwen2.5-7b-instruct")
+        """
+        if self.turn_queue is None:
+            return contextlib.nullcontext()
+        return self.turn_queue.turn(model_identifier)
+
+    def get_request_limits(self) -> dict[str, Any]:
+        """
+        Get chat-completion concurrency metrics.
+
+        Returns:
+            For the backend and each model: limit, requests in flight,
+            requests waiting, and queue times (avg/p95/max).
+        """
+        return self.client.limiter.stats()
+
+    def get_scheduler_stats(self) -> dict[str, Any]:
+        """
+        Get cross-session turn queue metrics.
+
+        Returns:
+            Queue depth, wait times and model swap counts, or
+            ``{"enabled": False}`` when the queue is disabled.
+        """
+        if self.turn_queue is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.turn_queue.stats()}
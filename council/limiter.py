@@ -0,0 +1,177 @@
+"""
+Request Limiter
+===============
+
+Caps how many chat completions run at once against LM Studio, both for the
+whole backend and for each model.
+
+LM Studio serves a fixed number of parallel requests (its "parallel" slot
+count); requests beyond that are queued server-side with no visibility, or
+fail once memory runs out. The limiter keeps that queue on our side instead,
+where it is measured:
+
+    - ``max_concurrent`` matches the backend's parallel slot count
+    - A per-model limit (optional) keeps one model from taking every slot
+
+A request waits for its model's slot first, then a backend slot, so a
+request held back by its model's limit never occupies a backend slot.
+
+Usage:
+    >>> limiter = RequestLimiter(max_concurrent=4, per_model=2)
+    >>> async with limiter.slot("qwen2.5-7b-instruct"):
+    ...     ...  # send the completion
+    >>> limiter.stats()["backend"]["wait_seconds"]["p95"]
+    0.0
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, Optional, Protocol, runtime_checkable
+
+
+class _LimitStats:
+    """Occupancy and queue-time metrics for one semaphore."""
+
+    __slots__ = ("limit", "in_flight", "waiting", "granted", "total_wait",
+                 "max_wait", "recent_waits")
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.in_flight = 0
+        self.waiting = 0
+        self.granted = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.recent_waits: deque[float] = deque(maxlen=200)
+
+    def record_wait(self, waited: float):
+        self.granted += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+        self.recent_waits.append(waited)
+
+    def to_dict(self) -> dict[str, Any]:
+        recent = sorted(self.recent_waits)
+        p95 = recent[int(0.95 * (len(recent) - 1))] if recent else 0.0
+        return {
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "requests": self.granted,
+            "wait_seconds": {
+                "avg": round(self.total_wait / self.granted, 3) if self.granted else 0.0,
+                "p95": round(p95, 3),
+                "max": round(self.max_wait, 3),
+            },
+        }
+
+
+@runtime_checkable
+class LimiterView(Protocol):
+    """
+    What the engine and server use of a client's ``limiter``.
+
+    Implemented by ``RequestLimiter`` (one server) and
+    ``council.backends.PoolLimiter`` (a pool). Slots are taken inside the
+    clients, per server, so ``slot()`` is not part of it.
+    """
+
+    def set_model_limit(self, identifier: str, limit: Optional[int]) -> None: ...
+
+    def stats(self) -> dict[str, Any]: ...
+
+
+class RequestLimiter:
+    """
+    Per-backend and per-model concurrency limits for chat completions.
+
+    Attributes:
+        max_concurrent: Requests allowed in flight on the backend
+        per_model: Default requests allowed in flight per model (0 = only
+                   the backend limit applies)
+    """
+
+    def __init__(self, max_concurrent: int = 4, per_model: int = 0):
+        """
+        Initialize the limiter.
+
+        Args:
+            max_concurrent: Backend parallel slot count
+            per_model: Default per-model limit (0 = no per-model limit)
+        """
+        self.max_concurrent = max(1, max_concurrent)
+        self.per_model = max(0, per_model)
+        self._backend = asyncio.Semaphore(self.max_concurrent)
+        self._backend_stats = _LimitStats(self.max_concurrent)
+        self._model_limits: dict[str, int] = {}
+        self._models: dict[str, asyncio.Semaphore] = {}
+        self._model_stats: dict[str, _LimitStats] = {}
+
+    def set_model_limit(self, identifier: str, limit: Optional[int]):
+        """
+        Override the per-model limit for one model.
+
+        Must be called before the model's first request.
+
+        Args:
+            identifier: LM Studio model identifier
+            limit: Requests allowed in flight for this model (None = default)
+        """
+        if limit is not None:
+            self._model_limits[identifier] = max(1, limit)
+
+    def _model_semaphore(self, identifier: str) -> Optional[asyncio.Semaphore]:
+        limit = self._model_limits.get(identifier, self.per_model)
+        if not limit:
+            return None
+        if identifier not in self._models:
+            self._models[identifier] = asyncio.Semaphore(limit)
+            self._model_stats[identifier] = _LimitStats(limit)
+        return self._models[identifier]
+
+    @staticmethod
+    async def _acquire(semaphore: asyncio.Semaphore, stats: _LimitStats):
+        started = time.monotonic()
+        stats.waiting += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            stats.waiting -= 1
+        stats.record_wait(time.monotonic() - started)
+        stats.in_flight += 1
+
+    @staticmethod
+    def _release(semaphore: asyncio.Semaphore, stats: _LimitStats):
+        stats.in_flight -= 1
+        semaphore.release()
+
+    @asynccontextmanager
+    async def slot(self, model_identifier: str):
+        """Hold a model slot and a backend slot for one request."""
+        model_semaphore = self._model_semaphore(model_identifier)
+        model_stats = self._model_stats.get(model_identifier)
+        if model_semaphore is not None:
+            await self._acquire(model_semaphore, model_stats)
+        try:
+            await self._acquire(self._backend, self._backend_stats)
+            try:
+                yield
+            finally:
+                self._release(self._backend, self._backend_stats)
+        finally:
+            if model_semaphore is not None:
+                self._release(model_semaphore, model_stats)
+
+    def stats(self) -> dict[str, Any]:
+        """In-flight requests, queue lengths and queue times."""
+        return {
+            "backend": self._backend_stats.to_dict(),
+            "models": {
+                identifier: stats.to_dict()
+                for identifier, stats in self._model_stats.items()
+            },
+        }
@@ -4,6 +4,7 @@ LM Studio API Client
 
 Handles all communication with LM Studio's local server, including:
     - Loading and unloading models
+    - Keeping the resident model set within a memory budget (LRU eviction)
     - Listing available and loaded models
     - Sending chat completion requests (with streaming support)
 
@@ -22,14 +23,617 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any, AsyncGenerator, Optional
+import re
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    Protocol,
+    runtime_checkable,
+)
 
 import httpx
 from openai import AsyncOpenAI
 
+from council.limiter import RequestLimiter
+from council.models import CouncilEvent, EventType
+from council.profiler import ModelProfiler
+
 logger = logging.getLogger(__name__)
 
+# Approximate resident memory of a quantized (~4-bit) model per billion params
+GB_PER_BILLION_PARAMS = 0.6
+# Fixed per-model overhead (KV cache, runtime buffers)
+MODEL_OVERHEAD_GB = 0.5
+# Assumed footprint for models whose size is unknown
+UNKNOWN_MODEL_FOOTPRINT_GB = 5.0
+
+
+def estimate_footprint_gb(size: str) -> float:
+    """
+    Estimate a model's resident memory from its parameter count string.
+
+    Args:
+        size: Parameter count as written in config.yaml (e.g., "3.8B", "500M")
+
+    Returns:
+        Estimated footprint in GB. Falls back to ``UNKNOWN_MODEL_FOOTPRINT_GB``
+        when the size can't be parsed.
+    """
+    match = re.match(r"^\s*(\d+(?:\.\d+)?)\s*([BbMm])", size or "")
+    if not match:
+        return UNKNOWN_MODEL_FOOTPRINT_GB
+    params_billions = float(match.group(1))
+    if match.group(2) in "Mm":
+        params_billions /= 1000
+    return round(params_billions * GB_PER_BILLION_PARAMS + MODEL_OVERHEAD_GB, 2)
+
+
+def _available_memory_gb() -> Optional[float]:
+    """Best-effort reading of available system memory (requires psutil)."""
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.virtual_memory().available / (1024 ** 3)
+
+
+class ChatStreamError(Exception):
+    """A streamed chat completion failed on the server (unreachable, HTTP error, ...)."""
+
+
+def stream_error_text(model_identifier: str, error: BaseException) -> str:
+    """
+    Text a failed streamed completion ends with.
+
+    Strategies look for the ``[Error:`` prefix to tell a failed turn from a
+    real answer.
+    """
+    return (
+        f"\n\n[Error: Could not get response from {model_identifier}. "
+        f"Make sure LM Studio is running and the model is loaded. Error: {error}]"
+    )
+
+
+@runtime_checkable
+class ResidencyView(Protocol):
+    """
+    What the engine, planner, schedulers and strategies use of a client's
+    ``residency``.
+
+    Implemented by ``ModelResidencyManager`` (one server) and
+    ``council.backends.PoolResidency`` (a pool). Bookkeeping that the client
+    does for its own server (``mark_loaded``, ``sync``, ``pin``,
+    ``plan_evictions``, ...) is not part of it.
+    """
+
+    memory_budget_gb: float
+
+    def register_model(
+        self, identifier: str, size: str = "", memory_gb: Optional[float] = None
+    ) -> None: ...
+
+    def footprint_gb(self, identifier: str) -> float: ...
+
+    def is_resident(self, identifier: str) -> bool: ...
+
+    def is_pinned(self, identifier: str) -> bool: ...
+
+    def resident_identifiers(self) -> list[str]: ...
+
+    def resident_gb(self) -> float: ...
+
+    def touch(self, identifier: str) -> None: ...
+
+    def idle_seconds(self) -> dict[str, float]: ...
+
+    def fits(self, identifier: str, protect: Iterable[str] = ()) -> bool: ...
+
+    def simulate(
+        self, sequence: Iterable[str], resident: Optional[Iterable[str]] = None
+    ) -> tuple[int, float]: ...
+
+    def predict_resident(
+        self, sequence: Iterable[str], resident: Optional[Iterable[str]] = None
+    ) -> list[str]: ...
+
+    async def ensure_resident(self, identifier: str, protect: Iterable[str] = ()) -> bool: ...
+
+    def add_listener(self, listener: Callable[[CouncilEvent], None]) -> None: ...
+
+    async def unload(self, identifier: str, reason: str) -> bool: ...
+
+    def snapshot(self) -> dict[str, Any]: ...
+
+
+class ModelResidencyManager:
+    """
+    Keeps the set of models resident in LM Studio within a memory budget.
+
+    Every load decision goes through ``ensure_resident()``: if the model is
+    already resident it is simply marked as most-recently-used, otherwise
+    least-recently-used models are unloaded until the new model fits in the
+    budget, and then the model is loaded.
+
+    Footprints come from (in order of preference):
+        1. An explicit ``memory_gb`` in the model's config entry
+        2. Memory measured while the model was loaded (needs psutil; only
+           taken when no other load overlapped, since it reads system-wide
+           available memory)
+        3. An estimate derived from the model's ``size`` string
+
+    Different models load concurrently. Only choosing eviction victims and
+    reserving room for a load are serialized: a model being loaded counts
+    against the budget until it is resident, and a model being evicted is
+    not picked again by another load.
+
+    Models with a completion in flight are pinned (see ``pin()``) and never
+    evicted. A load that can only fit by evicting a pinned model waits for
+    those completions to finish.
+
+    Attributes:
+        client: The LM Studio client used for load/unload calls
+        memory_budget_gb: Maximum total footprint of resident models.
+                          0 disables eviction entirely.
+    """
+
+    def __init__(self, client: "LMStudioClient", memory_budget_gb: float = 0.0):
+        """
+        Initialize the residency manager.
+
+        Args:
+            client: LM Studio client used to load/unload models
+            memory_budget_gb: Memory budget in GB (0 = unlimited)
+        """
+        self.client = client
+        self.memory_budget_gb = memory_budget_gb
+        self._declared_gb: dict[str, float] = {}
+        self._estimated_gb: dict[str, float] = {}
+        self._measured_gb: dict[str, float] = {}
+        # identifier → last-used monotonic time, ordered LRU → MRU
+        self._resident: OrderedDict[str, float] = OrderedDict()
+        # identifier → when it was last marked loaded or unloaded
+        self._changed_at: dict[str, float] = {}
+        # Guards eviction planning and reservations (never held during I/O)
+        self._lock = asyncio.Lock()
+        # One load at a time per model; different models load in parallel
+        self._load_locks: dict[str, asyncio.Lock] = {}
+        # identifier → footprint reserved while its load is in flight
+        self._loading: dict[str, float] = {}
+        # Models some load is currently unloading to make room
+        self._evicting: set[str] = set()
+        # identifier → completions in flight on it (never evicted while > 0)
+        self._pinned: dict[str, int] = {}
+        # Set (and replaced) whenever a model's last completion finishes
+        self._unpinned = asyncio.Event()
+        self._loads_started = 0
+        self._listeners: list[Callable[[CouncilEvent], None]] = []
+
+    # -------------------------------------------------------------------------
+    # Footprints
+    # -------------------------------------------------------------------------
+
+    def register_model(
+        self,
+        identifier: str,
+        size: str = "",
+        memory_gb: Optional[float] = None,
+    ):
+        """
+        Register a model's declared footprint.
+
+        Args:
+            identifier: LM Studio model identifier
+            size: Parameter count string from config (e.g., "7B")
+            memory_gb: Explicit footprint override in GB (optional)
+        """
+        if memory_gb is not None:
+            self._declared_gb[identifier] = memory_gb
+        else:
+            self._declared_gb.pop(identifier, None)
+        self._estimated_gb[identifier] = estimate_footprint_gb(size)
+
+    def record_footprint(self, identifier: str, memory_gb: float):
+        """
+        Record a measured footprint, which takes precedence over the size
+        estimate (but never over an explicit ``memory_gb``).
+        """
+        if identifier not in self._declared_gb:
+            self._measured_gb[identifier] = round(memory_gb, 2)
+
+    def footprint_gb(self, identifier: str) -> float:
+        """Best known footprint for a model in GB."""
+        if identifier in self._declared_gb:
+            return self._declared_gb[identifier]
+        if identifier in self._measured_gb:
+            return self._measured_gb[identifier]
+        return self._estimated_gb.get(identifier, UNKNOWN_MODEL_FOOTPRINT_GB)
+
+    # -------------------------------------------------------------------------
+    # Resident set bookkeeping
+    # -------------------------------------------------------------------------
+
+    def is_resident(self, identifier: str) -> bool:
+        """Whether the model is believed to be loaded."""
+        return identifier in self._resident
+
+    def resident_identifiers(self) -> list[str]:
+        """Resident models ordered from least to most recently used."""
+        return list(self._resident.keys())
+
+    def resident_gb(self) -> float:
+        """Total footprint of all resident models."""
+        return sum(self.footprint_gb(i) for i in self._resident)
+
+    def touch(self, identifier: str):
+        """Mark a resident model as most recently used."""
+        if identifier in self._resident:
+            self._resident[identifier] = time.monotonic()
+            self._resident.move_to_end(identifier)
+
+    def mark_loaded(self, identifier: str):
+        """Record that a model is now resident (called by the client)."""
+        now = time.monotonic()
+        self._resident[identifier] = now
+        self._resident.move_to_end(identifier)
+        self._changed_at[identifier] = now
+
+    def mark_unloaded(self, identifier: str):
+        """Record that a model is no longer resident (called by the client)."""
+        self._resident.pop(identifier, None)
+        self._changed_at[identifier] = time.monotonic()
+
+    def sync(self, loaded: Iterable[str], as_of: Optional[float] = None):
+        """
+        Reconcile the resident set with LM Studio's reported loaded models.
+
+        Models loaded outside the council (e.g., from the LM Studio UI) still
+        take memory, so they are added as least-recently-used (their idle
+        clock starts now); models LM Studio no longer reports are dropped.
+
+        Args:
+            loaded: Identifiers LM Studio reports as loaded
+            as_of: ``time.monotonic()`` when the report was requested. Loads
+                   and unloads recorded after that are newer than the report
+                   and are kept.
+        """
+        loaded = set(loaded)
+
+        def changed_since(identifier: str) -> bool:
+            return as_of is not None and self._changed_at.get(identifier, float("-inf")) >= as_of
+
+        for identifier in list(self._resident):
+            if identifier not in loaded and not changed_since(identifier):
+                self._resident.pop(identifier)
+        for identifier in loaded - set(self._resident):
+            if changed_since(identifier):
+                continue
+            self._resident[identifier] = time.monotonic()
+            self._resident.move_to_end(identifier, last=False)
+
+    @contextmanager
+    def pin(self, identifier: str) -> Iterator[None]:
+        """
+        Keep a model from being evicted while a completion runs on it.
+
+        Pins nest; the model becomes evictable again (and most recently
+        used) when the last one is released.
+        """
+        self._pinned[identifier] = self._pinned.get(identifier, 0) + 1
+        try:
+            yield
+        finally:
+            self._pinned[identifier] -= 1
+            if not self._pinned[identifier]:
+                del self._pinned[identifier]
+                self.touch(identifier)
+                self._unpinned.set()
+                self._unpinned = asyncio.Event()
+
+    def is_pinned(self, identifier: str) -> bool:
+        """Whether a completion is currently running on a model."""
+        return identifier in self._pinned
+
+    def idle_seconds(self) -> dict[str, float]:
+        """Seconds since each resident model was last used."""
+        now = time.monotonic()
+        return {i: now - last_used for i, last_used in self._resident.items()}
+
+    def fits(self, identifier: str, protect: Iterable[str] = ()) -> bool:
+        """
+        Whether a model could be loaded without evicting protected models.
+
+        Args:
+            identifier: The model to check
+            protect: Resident identifiers that must stay loaded (pinned
+                     models always stay loaded)
+
+        Returns:
+            True if the budget is unlimited, or the model plus all protected
+            and pinned resident models fit within it.
+        """
+        if self.memory_budget_gb <= 0 or identifier in self._resident:
+            return True
+        kept = sum(
+            self.footprint_gb(i)
+            for i in set(protect) | set(self._pinned) if i in self._resident
+        )
+        return kept + self.footprint_gb(identifier) <= self.memory_budget_gb
+
+    def plan_evictions(
+        self, identifier: str, protect: Iterable[str] = ()
+    ) -> list[str]:
+        """
+        Decide which resident models must be unloaded for ``identifier`` to fit.
+
+        Victims are chosen least-recently-used first, skipping any protected
+        identifiers, pinned models and models another load is already
+        evicting or loading. Footprints
+        reserved by other in-flight loads count as used. If the budget can't
+        be met even after evicting every unprotected model, all of them are
+        returned and the load proceeds over budget.
+
+        Args:
+            identifier: The model about to be loaded
+            protect: Identifiers that must not be evicted
+
+        Returns:
+            Identifiers to unload, in eviction order.
+        """
+        if self.memory_budget_gb <= 0 or identifier in self._resident:
+            return []
+
+        protected = self._unevictable(protect)
+        needed = self.footprint_gb(identifier)
+        used = self._committed_gb(identifier)
+        victims: list[str] = []
+        for candidate in self._resident:
+            if used + needed <= self.memory_budget_gb:
+                break
+            if candidate in protected:
+                continue
+            victims.append(candidate)
+            used -= self.footprint_gb(candidate)
+        return victims
+
+    def _unevictable(self, protect: Iterable[str]) -> set[str]:
+        return set(protect) | set(self._pinned) | self._evicting | set(self._loading)
+
+    def _committed_gb(self, identifier: str) -> float:
+        """Resident footprint plus room reserved by other in-flight loads."""
+        return self.resident_gb() + sum(
+            gb for loading, gb in self._loading.items() if loading != identifier
+        )
+
+    def _blocked_by_pins(self, identifier: str, protect: Iterable[str]) -> bool:
+        """Whether ``identifier`` only fits once some pinned model is released."""
+        if self.memory_budget_gb <= 0 or identifier in self._resident:
+            return False
+        if self._committed_gb(identifier) + self.footprint_gb(identifier) <= self.memory_budget_gb:
+            return False
+        others = set(protect) | self._evicting | set(self._loading)
+        return any(i in self._pinned and i not in others for i in self._resident)
+
+    def simulate(
+        self,
+        sequence: Iterable[str],
+        resident: Optional[Iterable[str]] = None,
+    ) -> tuple[int, float]:
+        """
+        Replay a sequence of model uses against the LRU eviction policy.
+
+        Nothing is loaded; this only predicts what ``ensure_resident()``
+        would do, which lets schedulers and planners compare turn orders.
+
+        Args:
+            sequence: Model identifiers in the order they will be used
+            resident: Starting resident set, LRU first (defaults to the
+                      current resident set)
+
+        Returns:
+            Tuple of (number of loads, peak resident footprint in GB).
+        """
+        _, loads, peak = self._replay(sequence, resident)
+        return loads, peak
+
+    def predict_resident(
+        self,
+        sequence: Iterable[str],
+        resident: Optional[Iterable[str]] = None,
+    ) -> list[str]:
+        """
+        Resident set (LRU first) predicted after a sequence of model uses.
+
+        Arguments are the same as for ``simulate()``.
+        """
+        state, _, _ = self._replay(sequence, resident)
+        return state
+
+    def _replay(
+        self,
+        sequence: Iterable[str],
+        resident: Optional[Iterable[str]],
+    ) -> tuple[list[str], int, float]:
+        """Final resident set, loads and peak footprint for ``simulate()``."""
+        state: OrderedDict[str, None] = OrderedDict.fromkeys(
+            self.resident_identifiers() if resident is None else resident
+        )
+        loads = 0
+        peak = sum(self.footprint_gb(i) for i in state)
+        for identifier in sequence:
+            if identifier in state:
+                state.move_to_end(identifier)
+                continue
+            loads += 1
+            needed = self.footprint_gb(identifier)
+            if self.memory_budget_gb > 0:
+                used = sum(self.footprint_gb(i) for i in state)
+                while state and used + needed > self.memory_budget_gb:
+                    victim, _ = state.popitem(last=False)
+                    used -= self.footprint_gb(victim)
+            state[identifier] = None
+            peak = max(peak, sum(self.footprint_gb(i) for i in state))
+        return list(state), loads, round(peak, 2)
+
+    # -------------------------------------------------------------------------
+    # Load path
+    # -------------------------------------------------------------------------
+
+    async def ensure_resident(
+        self, identifier: str, protect: Iterable[str] = ()
+    ) -> bool:
+        """
+        Make sure a model is loaded, evicting LRU models if needed.
+
+        Args:
+            identifier: The model to make resident
+            protect: Identifiers that must not be evicted to make room
+
+        Returns:
+            True if the model is ready to use, False otherwise.
+        """
+        if await self.client.is_model_loaded(identifier):
+            self.mark_loaded(identifier)
+            return True
+
+        async with self._load_locks.setdefault(identifier, asyncio.Lock()):
+            # Another caller may have loaded it while we waited
+            if self.is_resident(identifier):
+                self.touch(identifier)
+                return True
+
+            async with self._lock:
+                # Count the model against the budget while it loads
+                self._loading[identifier] = self.footprint_gb(identifier)
+                self._loads_started += 1
+            try:
+                await self._make_room(identifier, protect)
+
+                # System-wide memory is only attributable to this load
+                # if no other load overlapped it
+                measure = identifier not in self._declared_gb and len(self._loading) == 1
+                loads_started = self._loads_started
+                available_before = _available_memory_gb() if measure else None
+                loaded = await self.client.load_model(identifier)
+                available_after = _available_memory_gb() if measure else None
+                if (
+                    loaded
+                    and self._loads_started == loads_started
+                    and available_before is not None
+                    and available_after is not None
+                ):
+                    measured = available_before - available_after
+                    if measured > 0.1:
+                        self.record_footprint(identifier, measured)
+                return loaded
+            finally:
+                self._loading.pop(identifier, None)
+
+    async def _make_room(self, identifier: str, protect: Iterable[str]):
+        """
+        Unload LRU models until ``identifier`` fits, skipping any that refuse.
+
+        If the rest of the room is held by pinned models, waits for their
+        completions to finish and tries again.
+        """
+        refused: set[str] = set()
+        while True:
+            async with self._lock:
+                victims = self.plan_evictions(identifier, set(protect) | refused)
+                self._evicting.update(victims)
+                blocked = not victims and self._blocked_by_pins(
+                    identifier, set(protect) | refused
+                )
+                unpinned = self._unpinned
+            if blocked:
+                logger.info(f"Waiting for in-flight completions to make room for '{identifier}'")
+                await unpinned.wait()
+                continue
+            if not victims:
+                return
+            try:
+                for victim in victims:
+                    logger.info(
+                        f"Evicting '{victim}' ({self.footprint_gb(victim)} GB) "
+                        f"to make room for '{identifier}'"
+                    )
+                    if not await self.unload(victim, reason="evicted"):
+                        # Still loaded: keep counting it and try the next one
+                        refused.add(victim)
+            finally:
+                self._evicting.difference_update(victims)
+
+    def add_listener(self, listener: Callable[[CouncilEvent], None]):
+        """
+        Register a callback for MODEL_UNLOADING / MODEL_UNLOADED events.
+
+        Unloads are triggered by the manager itself (eviction, idle reaping)
+        rather than by a session, so listeners are how they reach the UI.
+        """
+        self._listeners.append(listener)
+
+    def _notify(self, event: CouncilEvent):
+        for listener in self._listeners:
+            try:
+                listener(event)
+            except Exception as e:
+                logger.warning(f"Residency listener failed: {e}")
+
+    async def unload(self, identifier: str, reason: str) -> bool:
+        """
+        Unload a resident model, notifying listeners before and after.
+
+        If LM Studio refuses, the model stays resident (its memory still
+        counts against the budget) until a later loaded-state refresh
+        shows it gone.
+
+        Args:
+            identifier: The model to unload
+            reason: Why it's being unloaded (e.g., "evicted", "idle")
+
+        Returns:
+            True if LM Studio confirmed the unload.
+        """
+        metadata = {"model": identifier, "reason": reason}
+        self._notify(CouncilEvent(
+            type=EventType.MODEL_UNLOADING,
+            content=f"Unloading model {identifier} ({reason})...",
+            metadata=metadata,
+        ))
+        unloaded = await self.client.unload_model(identifier)
+        if unloaded:
+            self.mark_unloaded(identifier)
+        self._notify(CouncilEvent(
+            type=EventType.MODEL_UNLOADED,
+            content=f"Model {identifier} unloaded",
+            metadata={**metadata, "success": unloaded},
+        ))
+        return unloaded
+
+    def snapshot(self) -> dict[str, Any]:
+        """Current residency state for status endpoints."""
+        return {
+            "memory_budget_gb": self.memory_budget_gb,
+            "resident_gb": round(self.resident_gb(), 2),
+            "resident": [
+                {
+                    "model": i,
+                    "footprint_gb": self.footprint_gb(i),
+                    "idle_seconds": round(idle, 1),
+                }
+                for i, idle in self.idle_seconds().items()
+            ],
+        }
+
 
 class LMStudioClient:
     """
@@ -37,7 +641,8 @@ class LMStudioClient:
 
     This client handles:
         1. **Model Discovery**: List all models available in LM Studio
-        2. **Model Management**: Load/unload models on demand to manage RAM
+        2. **Model Management**: Load/unload models on demand to manage RAM,
+           keeping the resident set within a memory budget
         3. **Chat Completions**: Send messages and get streaming responses
 
     The client uses the OpenAI SDK for chat completions (since LM Studio is
@@ -46,6 +651,9 @@ class LMStudioClient:
     Attributes:
         base_url: Base URL for LM Studio API (e.g., "http://localhost:1234/v1")
         api_key: API key (LM Studio accepts any string, defaults to "lm-studio")
+        residency: Tracks resident models and evicts LRU models over budget
+        profiler: Records per-model load time, TTFT and tokens/sec (optional)
+        limiter: Caps concurrent chat completions per backend and per model
 
     Example:
         >>> client = LMStudioClient("http://localhost:1234/v1", "lm-studio")
@@ -53,16 +661,49 @@ class LMStudioClient:
         >>> print(f"Currently loaded: {loaded}")
     """
 
-    def __init__(self, base_url: str, api_key: str = "lm-studio"):
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str = "lm-studio",
+        memory_budget_gb: float = 0.0,
+        loaded_state_ttl: float = 60.0,
+        profiler: Optional[ModelProfiler] = None,
+        max_concurrent_requests: int = 4,
+        max_concurrent_per_model: int = 0,
+    ):
         """
         Initialize the LM Studio client.
 
         Args:
             base_url: Full base URL including /v1 (e.g., "http://localhost:1234/v1")
             api_key: API key for authentication (LM Studio accepts any string)
+            memory_budget_gb: Memory budget for resident models (0 = unlimited)
+            loaded_state_ttl: Seconds the known-loaded cache is trusted before
+                              it is refreshed from LM Studio
+            profiler: Where to record load and throughput measurements
+                      (None = don't profile)
+            max_concurrent_requests: Max chat completions in flight at once
+                                     (the backend's parallel slot count)
+            max_concurrent_per_model: Default max in flight per model
+                                      (0 = only the backend limit applies)
         """
         self.base_url = base_url
         self.api_key = api_key
+        self.residency = ModelResidencyManager(self, memory_budget_gb)
+        self.profiler = profiler
+
+        # Known-loaded cache: identifiers LM Studio reports as loaded.
+        # None means unknown (never fetched, or invalidated).
+        self.loaded_state_ttl = loaded_state_ttl
+        self._loaded_cache: Optional[set[str]] = None
+        self._loaded_cache_time = 0.0
+        self._loaded_state_supported = True
+
+        # Bounds parallel chat completions against this server
+        self.limiter = RequestLimiter(max_concurrent_requests, max_concurrent_per_model)
+
+        # In-flight load/unload per model identifier: (operation, task)
+        self._model_ops: dict[str, tuple[str, asyncio.Task]] = {}
 
         # OpenAI-compatible client for chat completions
         self.openai_client = AsyncOpenAI(
@@ -122,27 +763,154 @@ class LMStudioClient:
         """
         Get the list of currently loaded (active in memory) models.
 
-        This uses LM Studio's extended API to check which models are
-        currently occupying RAM and ready to serve requests.
+        This uses LM Studio's REST API (``/api/v0/models``), which reports a
+        ``state`` of ``"loaded"`` or ``"not-loaded"`` for every downloaded
+        model. The result also refreshes the client's known-loaded cache.
+
+        Returns:
+            List of loaded model info dicts (empty if the state is unknown).
+        """
+        return await self._refresh_loaded_state() or []
+
+    async def _refresh_loaded_state(self) -> Optional[list[dict[str, Any]]]:
+        """
+        Fetch the loaded subset from LM Studio and update the cache.
 
         Returns:
-            List of loaded model info dicts.
+            Loaded model info dicts, or None if the loaded state couldn't be
+            determined (server unreachable or endpoint unsupported).
         """
+        if not self._loaded_state_supported:
+            return None
+        requested_at = time.monotonic()
         try:
-            response = await self._http_client.get("/v1/models")
+            response = await self._http_client.get("/api/v0/models")
+            if response.status_code == 404:
+                logger.warning(
+                    "LM Studio does not expose /api/v0/models; "
+                    "falling back to local residency tracking."
+                )
+                self._loaded_state_supported = False
+                return None
             response.raise_for_status()
             data = response.json()
-            # LM Studio returns all available models via /v1/models
-            # Loaded models are the ones that are currently active
-            return data.get("data", [])
         except Exception as e:
             logger.error(f"Error getting loaded models: {e}")
-            return []
+            self._invalidate_loaded_cache()
+            return None
+
+        loaded = [m for m in data.get("data", []) if m.get("state") == "loaded"]
+        # Loads/unloads that finished while the request was in flight are
+        # newer than the report, so reconcile rather than overwrite
+        self.residency.sync((m.get("id", "") for m in loaded), as_of=requested_at)
+        self._loaded_cache = set(self.residency.resident_identifiers())
+        self._loaded_cache_time = time.monotonic()
+        return loaded
+
+    def _confirm_loaded(self, model_identifier: str):
+        """Record a model LM Studio has shown to be loaded (e.g., it answered a chat)."""
+        if not self.residency.is_resident(model_identifier):
+            self.residency.mark_loaded(model_identifier)
+        if self._loaded_cache is not None:
+            self._loaded_cache.add(model_identifier)
+
+    async def _confirm_load_fallback(self, model_identifier: str):
+        """
+        Settle a load LM Studio didn't acknowledge.
+
+        The model only counts as resident if LM Studio's loaded state says
+        so. If that state can't be queried, local bookkeeping is all there
+        is, so the model is assumed loaded (LM Studio JIT-loads on the first
+        request). Otherwise the first successful chat confirms it.
+        """
+        self._invalidate_loaded_cache()
+        await self._refresh_loaded_state()
+        if self._loaded_cache is None:
+            self.residency.mark_loaded(model_identifier)
+
+    def _invalidate_loaded_cache(self):
+        """Forget the known-loaded view so the next check re-queries LM Studio."""
+        self._loaded_cache = None
+
+    async def is_model_loaded(self, model_identifier: str) -> bool:
+        """
+        Check whether a model is loaded, without a round trip when possible.
+
+        The known-loaded cache answers while it is younger than
+        ``loaded_state_ttl``; otherwise it is refreshed from LM Studio. If
+        the loaded state can't be queried, the residency manager's own
+        bookkeeping is used instead.
+
+        Args:
+            model_identifier: The model ID to check.
+
+        Returns:
+            True if the model is believed to be loaded.
+        """
+        cache_age = time.monotonic() - self._loaded_cache_time
+        if self._loaded_cache is None or cache_age > self.loaded_state_ttl:
+            await self._refresh_loaded_state()
+        if self._loaded_cache is None:
+            return self.residency.is_resident(model_identifier)
+        return model_identifier in self._loaded_cache
 
     # =========================================================================
     # Model Management (Load / Unload)
     # =========================================================================
 
+    async def _run_model_op(
+        self,
+        op: str,
+        model_identifier: str,
+        request: Callable[[str], Awaitable[bool]],
+    ) -> bool:
+        """
+        Run a load/unload with single-flight semantics per model.
+
+        Callers asking for the same operation as the most recently requested
+        one on that model share its request and all receive its result (or
+        its exception). A different operation is queued behind it, so an
+        unload followed by a load is always issued in that order.
+
+        Args:
+            op: Operation name ("load" or "unload")
+            model_identifier: The model the operation targets
+            request: Coroutine function performing the actual HTTP call
+
+        Returns:
+            The operation's result.
+        """
+        latest = self._model_ops.get(model_identifier)
+        if latest is not None and latest[0] == op:
+            return await asyncio.shield(latest[1])
+
+        # Queue behind whatever was requested last for this model
+        previous = latest[1] if latest is not None else None
+        task = asyncio.create_task(
+            self._run_after(previous, request, model_identifier)
+        )
+        self._model_ops[model_identifier] = (op, task)
+
+        def _done(finished: asyncio.Task):
+            if self._model_ops.get(model_identifier, (None, None))[1] is finished:
+                del self._model_ops[model_identifier]
+            if not finished.cancelled():
+                finished.exception()  # Mark retrieved if every caller went away
+
+        task.add_done_callback(_done)
+        return await asyncio.shield(task)
+
+    @staticmethod
+    async def _run_after(
+        previous: Optional[asyncio.Task],
+        request: Callable[[str], Awaitable[bool]],
+        model_identifier: str,
+    ) -> bool:
+        """Wait for the previous operation on a model (ignoring its outcome), then run."""
+        if previous is not None:
+            await asyncio.wait([previous])
+        return await request(model_identifier)
+
     async def load_model(self, model_identifier: str) -> bool:
         """
         Load a model into memory in LM Studio.
@@ -164,8 +932,15 @@ class LMStudioClient:
             - 3-4 small models (3B-4B) loaded simultaneously
             - 2 medium models (7B-9B) loaded simultaneously
             - 1 large model (14B+) loaded at a time
+
+            Concurrent calls for the same model share a single request.
         """
+        return await self._run_model_op("load", model_identifier, self._request_load)
+
+    async def _request_load(self, model_identifier: str) -> bool:
+        """Issue the load request to LM Studio (see ``load_model()``)."""
         logger.info(f"Loading model: {model_identifier}")
+        started = time.monotonic()
         try:
             # LM Studio's model loading endpoint
             response = await self._http_client.post(
@@ -174,6 +949,11 @@ class LMStudioClient:
             )
             if response.status_code == 200:
                 logger.info(f"Model loaded successfully: {model_identifier}")
+                if self.profiler:
+                    self.profiler.record_load(model_identifier, time.monotonic() - started)
+                self.residency.mark_loaded(model_identifier)
+                if self._loaded_cache is not None:
+                    self._loaded_cache.add(model_identifier)
                 return True
             else:
                 # Some versions of LM Studio might not support this endpoint
@@ -182,13 +962,16 @@ class LMStudioClient:
                     f"Model load endpoint returned {response.status_code}. "
                     f"Model may need to be loaded manually in LM Studio."
                 )
+                await self._confirm_load_fallback(model_identifier)
                 return True  # Optimistically return True — the chat call will fail if not loaded
         except httpx.ConnectError:
             logger.error("Cannot connect to LM Studio for model loading.")
+            self._invalidate_loaded_cache()
             return False
         except Exception as e:
             logger.warning(f"Model load request for '{model_identifier}': {e}")
             # Return True optimistically — some LM Studio versions auto-load on first request
+            await self._confirm_load_fallback(model_identifier)
             return True
 
     async def unload_model(self, model_identifier: str) -> bool:
@@ -204,6 +987,10 @@ class LMStudioClient:
         Returns:
             True if the model was unloaded successfully, False otherwise.
         """
+        return await self._run_model_op("unload", model_identifier, self._request_unload)
+
+    async def _request_unload(self, model_identifier: str) -> bool:
+        """Issue the unload request to LM Studio (see ``unload_model()``)."""
         logger.info(f"Unloading model: {model_identifier}")
         try:
             response = await self._http_client.post(
@@ -212,29 +999,39 @@ class LMStudioClient:
             )
             if response.status_code == 200:
                 logger.info(f"Model unloaded: {model_identifier}")
+                self.residency.mark_unloaded(model_identifier)
+                if self._loaded_cache is not None:
+                    self._loaded_cache.discard(model_identifier)
                 return True
             else:
                 logger.warning(f"Model unload returned {response.status_code}")
+                self._invalidate_loaded_cache()
                 return False
         except Exception as e:
             logger.warning(f"Model unload request for '{model_identifier}': {e}")
+            self._invalidate_loaded_cache()
             return False
 
-    async def ensure_model_loaded(self, model_identifier: str) -> bool:
+    async def ensure_model_loaded(
+        self, model_identifier: str, protect: Iterable[str] = ()
+    ) -> bool:
         """
         Ensure a specific model is loaded, loading it if necessary.
 
-        This is the primary method used by the council engine. It checks
-        if the model is available and tries to load it if not.
+        This is the primary method used by the council engine. All load
+        decisions go through the residency manager, which skips models that
+        are already loaded (answered from the known-loaded cache, so warm
+        turns cost no round trip) and evicts least-recently-used models when
+        the memory budget would be exceeded.
 
         Args:
             model_identifier: The model ID to ensure is loaded.
+            protect: Identifiers that must not be evicted to make room.
 
         Returns:
             True if the model is ready to use, False otherwise.
         """
-        # Try to load — if already loaded, LM Studio handles it gracefully
-        return await self.load_model(model_identifier)
+        return await self.residency.ensure_resident(model_identifier, protect)
 
     # =========================================================================
     # Chat Completions (Streaming)
@@ -286,6 +1083,7 @@ class LMStudioClient:
         messages: list[dict[str, str]],
         temperature: float = 0.7,
         max_tokens: int = 2048,
+        raise_errors: bool = False,
     ) -> AsyncGenerator[str, None]:
         """
         Send a chat completion request and stream the response token by token.
@@ -301,12 +1099,16 @@ class LMStudioClient:
                        {"role": "user", "content": "..."}]
             temperature: Sampling temperature (0.0-1.0). Higher = more creative.
             max_tokens: Maximum tokens to generate in the response.
+            raise_errors: Raise ``ChatStreamError`` on failure instead of
+                          yielding an error message (used by ``BackendPool``
+                          to fail over to another server).
 
         Yields:
-            String chunks (tokens/pieces of text) as they're generated.
+            String chunks (tokens/pieces of text) as they're generated. On
+            failure the stream ends with an ``[Error: ...]`` message.
 
         Raises:
-            Exception: If the model is not loaded or LM Studio is unavailable.
+            ChatStreamError: If the request fails and ``raise_errors`` is set.
 
         Example:
             >>> messages = [
@@ -316,42 +1118,68 @@ class LMStudioClient:
             >>> async for chunk in client.chat_stream("llama-3.2-3b", messages):
             ...     print(chunk, end="", flush=True)
         """
+        self.residency.touch(model_identifier)
+        first_token_at: Optional[float] = None
+        pieces = 0
         try:
-            stream = await self.openai_client.chat.completions.create(
-                model=model_identifier,
-                messages=messages,
-                temperature=temperature,
-                max_tokens=max_tokens,
-                stream=True,
-            )
+            with self.residency.pin(model_identifier):
+                async with self.limiter.slot(model_identifier):
+                    started = time.monotonic()
+                    stream = await self.openai_client.chat.completions.create(
+                        model=model_identifier,
+                        messages=messages,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                        stream=True,
+                    )
 
-            async for chunk in stream:
-                if not chunk.choices:
-                    continue
+                    # Close the HTTP stream as soon as we stop reading (caller
+                    # went away or the task was cancelled) so the server stops
+                    # generating tokens nobody will see
+                    async with stream:
+                        async for chunk in stream:
+                            if not chunk.choices:
+                                continue
 
-                delta = chunk.choices[0].delta
+                            delta = chunk.choices[0].delta
+                            pieces += 1
+                            if first_token_at is None:
+                                first_token_at = time.monotonic()
+                                self._confirm_loaded(model_identifier)
 
-                # Standard OpenAI-compatible content
-                content = self._normalize_text(getattr(delta, "content", None))
-                if content:
-                    yield content
+                            # Standard OpenAI-compatible content
+                            content = self._normalize_text(getattr(delta, "content", None))
+                            if content:
+                                yield content
 
-                # Some LM Studio model backends emit reasoning text in
-                # non-standard fields instead of delta.content.
-                reasoning_content = self._normalize_text(
-                    getattr(delta, "reasoning_content", None)
-                )
-                if reasoning_content:
-                    yield reasoning_content
+                            # Some LM Studio model backends emit reasoning text in
+                            # non-standard fields instead of delta.content.
+                            reasoning_content = self._normalize_text(
+                                getattr(delta, "reasoning_content", None)
+                            )
+                            if reasoning_content:
+                                yield reasoning_content
 
-                reasoning = self._normalize_text(getattr(delta, "reasoning", None))
-                if reasoning:
-                    yield reasoning
+                            reasoning = self._normalize_text(getattr(delta, "reasoning", None))
+                            if reasoning:
+                                yield reasoning
+
+                    # LM Studio streams roughly one token per chunk
+                    if self.profiler and first_token_at is not None:
+                        self.profiler.record_generation(
+                            model_identifier,
+                            ttft_seconds=first_token_at - started,
+                            tokens=pieces,
+                            duration_seconds=time.monotonic() - started,
+                        )
 
         except Exception as e:
             logger.error(f"Chat completion error with model '{model_identifier}': {e}")
-            yield f"\n\n[Error: Could not get response from {model_identifier}. "
-            yield f"Make sure LM Studio is running and the model is loaded. Error: {str(e)}]"
+            # The model may have been unloaded behind our back
+            self._invalidate_loaded_cache()
+            if raise_errors:
+                raise ChatStreamError(str(e)) from e
+            yield stream_error_text(model_identifier, e)
 
     async def chat_once(
         self,
@@ -367,14 +1195,28 @@ class LMStudioClient:
         streaming deltas. This path requests a single non-stream completion and
         extracts text from the final message.
         """
+        self.residency.touch(model_identifier)
         try:
-            completion = await self.openai_client.chat.completions.create(
-                model=model_identifier,
-                messages=messages,
-                temperature=temperature,
-                max_tokens=max_tokens,
-                stream=False,
-            )
+            with self.residency.pin(model_identifier):
+                async with self.limiter.slot(model_identifier):
+                    started = time.monotonic()
+                    completion = await self.openai_client.chat.completions.create(
+                        model=model_identifier,
+                        messages=messages,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                        stream=False,
+                    )
+                    usage = getattr(completion, "usage", None)
+                    if self.profiler and usage is not None and usage.completion_tokens:
+                        self.profiler.record_generation(
+                            model_identifier,
+                            ttft_seconds=None,
+                            tokens=usage.completion_tokens,
+                            duration_seconds=time.monotonic() - started,
+                        )
+
+            self._confirm_loaded(model_identifier)
             if not completion.choices:
                 return ""
 
@@ -394,6 +1236,7 @@ class LMStudioClient:
             logger.error(
                 f"Fallback non-stream completion failed for '{model_identifier}': {e}"
             )
+            self._invalidate_loaded_cache()
             return ""
 
     async def chat(
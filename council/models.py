@@ -13,11 +13,14 @@ Key Models:
     - ``AgentMessage``: A single message from an agent during a session
     - ``CouncilResult``: The complete result of a council session
     - ``CouncilEvent``: A real-time streaming event sent via WebSocket
+    - ``ChunkEvent``: Lightweight stand-in for ``CouncilEvent`` used for
+      per-token chunk events
 """
 
 from __future__ import annotations
 
 import enum
+import time
 from datetime import datetime
 from typing import Any, Optional
 
@@ -74,6 +77,68 @@ class StrategyType(str, enum.Enum):
     VOTE = "vote"           # Independent responses + consensus
 
 
+class TurnOrder(str, enum.Enum):
+    """How agents are ordered within a round."""
+
+    CONFIG = "config"           # Always speak in the order listed in config
+    SWAP_AWARE = "swap_aware"   # Reorder to reuse already-loaded models
+
+
+class ExecutionMode(str, enum.Enum):
+    """Whether agents that don't depend on each other generate at once."""
+
+    SEQUENTIAL = "sequential"       # One agent at a time
+    CONCURRENT = "concurrent"       # Independent agents (votes, debate round 1)
+                                    # generate in parallel
+    SIMULTANEOUS = "simultaneous"   # Debate agents see only earlier rounds,
+                                    # so every round generates in parallel
+    OVERLAPPED = "overlapped"       # Pipeline stages start on a stable prefix
+                                    # of the previous stage's output
+
+
+# Execution modes each strategy implements; presets asking for any other
+# mode are rejected when the config is loaded
+STRATEGY_EXECUTION_MODES: dict[StrategyType, frozenset[ExecutionMode]] = {
+    StrategyType.DEBATE: frozenset({
+        ExecutionMode.SEQUENTIAL, ExecutionMode.CONCURRENT, ExecutionMode.SIMULTANEOUS,
+    }),
+    StrategyType.VOTE: frozenset({
+        ExecutionMode.SEQUENTIAL, ExecutionMode.CONCURRENT, ExecutionMode.SIMULTANEOUS,
+    }),
+    StrategyType.PIPELINE: frozenset({ExecutionMode.SEQUENTIAL, ExecutionMode.OVERLAPPED}),
+}
+
+
+def round_runs_parallel(
+    strategy: StrategyType, execution_mode: ExecutionMode, round_num: int
+) -> bool:
+    """
+    Whether a round's agents generate at once (if their models fit together).
+
+    Shared by the strategies and the planner so plans match what runs:
+    votes are independent, so every vote round is parallel in either
+    parallel mode; debate agents see the rounds before theirs, so only
+    round 1 is parallel in concurrent mode and every round in simultaneous
+    mode. Pipeline stages depend on each other and never run as a round.
+    """
+    if strategy == StrategyType.VOTE:
+        return execution_mode in (ExecutionMode.CONCURRENT, ExecutionMode.SIMULTANEOUS)
+    if strategy == StrategyType.DEBATE:
+        return execution_mode == ExecutionMode.SIMULTANEOUS or (
+            execution_mode == ExecutionMode.CONCURRENT and round_num == 1
+        )
+    return False
+
+
+class DeliveryMode(str, enum.Enum):
+    """How a session's streamed chunks are delivered to a client."""
+
+    FULL = "full"             # Whole turns only (agent_done/moderator_done)
+    STREAM = "stream"         # Every chunk as its own event
+    COALESCED = "coalesced"   # Consecutive chunks of a turn merged per
+                              # short time/size window
+
+
 # =============================================================================
 # Model Configuration
 # =============================================================================
@@ -89,6 +154,13 @@ class ModelInfo(BaseModel):
         strengths: List of tags describing what this model excels at
         context_length: Maximum context window in tokens
         size: Parameter count as a string (e.g., "3.8B", "7B")
+        memory_gb: Resident memory footprint in GB (optional; estimated
+                   from ``size`` when omitted)
+        idle_ttl_seconds: Unload the model after it has been idle this long
+                          (optional; falls back to ``lm_studio.idle_ttl_seconds``)
+        max_concurrent: Max chat completions in flight for this model
+                        (optional; falls back to
+                        ``lm_studio.max_concurrent_per_model``)
     """
 
     name: str
@@ -96,6 +168,9 @@ class ModelInfo(BaseModel):
     strengths: list[str] = Field(default_factory=list)
     context_length: int = 4096
     size: str = ""
+    memory_gb: Optional[float] = None
+    idle_ttl_seconds: Optional[float] = None
+    max_concurrent: Optional[int] = None
 
 
 class AgentConfig(BaseModel):
@@ -146,6 +221,8 @@ class CouncilPreset(BaseModel):
         description: What this council is best suited for
         strategy: The collaboration strategy to use
         debate_rounds: Number of debate rounds (only for debate strategy)
+        turn_order: How agents are ordered within a round (debate/vote)
+        execution_mode: Run independent agents one at a time or in parallel
         agents: List of agent configurations
         moderator: Configuration for the moderator agent
     """
@@ -154,6 +231,8 @@ class CouncilPreset(BaseModel):
     description: str = ""
     strategy: StrategyType = StrategyType.DEBATE
     debate_rounds: int = 2
+    turn_order: TurnOrder = TurnOrder.CONFIG
+    execution_mode: ExecutionMode = ExecutionMode.SEQUENTIAL
     agents: list[AgentConfig] = Field(default_factory=list)
     moderator: Optional[ModeratorConfig] = None
 
@@ -249,3 +328,94 @@ class CouncilEvent(BaseModel):
             "timestamp": self.timestamp.isoformat(),
             "metadata": self.metadata,
         }
+
+
+# Wall-clock time at monotonic zero, for turning chunk timestamps into dates
+_MONOTONIC_EPOCH = time.time() - time.monotonic()
+
+
+class ChunkEvent:
+    """
+    A streamed text chunk, built for the per-token hot path.
+
+    Strategies emit one chunk event per token, thousands per session. This
+    class has the same attributes and ``to_dict()`` output as
+    ``CouncilEvent`` but skips pydantic validation, stores a monotonic clock
+    reading instead of a ``datetime`` (formatted only when serialized) and
+    creates its ``metadata`` dict only when something is written to it.
+    Use ``to_council_event()`` where a validated model is needed.
+
+    Attributes:
+        type: AGENT_CHUNK or MODERATOR_CHUNK
+        agent: Which agent produced the chunk
+        round: Which round the chunk belongs to
+        content: The chunk's text
+        monotonic: ``time.monotonic()`` when the chunk was created
+    """
+
+    __slots__ = ("type", "agent", "round", "content", "monotonic", "_metadata")
+
+    def __init__(
+        self,
+        type: EventType,
+        agent: str = "",
+        round: int = 0,
+        content: str = "",
+        metadata: Optional[dict[str, Any]] = None,
+        monotonic: Optional[float] = None,
+    ):
+        self.type = type
+        self.agent = agent
+        self.round = round
+        self.content = content
+        self.monotonic = time.monotonic() if monotonic is None else monotonic
+        self._metadata = metadata
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        if self._metadata is None:
+            self._metadata = {}
+        return self._metadata
+
+    @property
+    def timestamp(self) -> datetime:
+        return datetime.utcfromtimestamp(_MONOTONIC_EPOCH + self.monotonic)
+
+    def with_content(self, content: str) -> "ChunkEvent":
+        """A copy of this chunk with different text (e.g., merged chunks)."""
+        return ChunkEvent(
+            self.type,
+            self.agent,
+            self.round,
+            content,
+            dict(self._metadata) if self._metadata else None,
+            self.monotonic,
+        )
+
+    def to_dict(self) -> dict:
+        """Convert to the same dictionary as ``CouncilEvent.to_dict()``."""
+        return {
+            "type": self.type.value,
+            "agent": self.agent,
+            "round": self.round,
+            "content": self.content,
+            "timestamp": self.timestamp.isoformat(),
+            "metadata": self._metadata or {},
+        }
+
+    def to_council_event(self) -> CouncilEvent:
+        """Validate into a full ``CouncilEvent``."""
+        return CouncilEvent(
+            type=self.type,
+            agent=self.agent,
+            round=self.round,
+            content=self.content,
+            timestamp=self.timestamp,
+            metadata=dict(self._metadata or {}),
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"ChunkEvent(type={self.type.value}, agent='{self.agent}', "
+            f"round={self.round}, content={self.content!r})"
+        )
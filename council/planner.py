@@ -0,0 +1,314 @@
+"""
+Council Planner
+===============
+
+Predicts what running a council preset will cost on this host before anyone
+runs it: which models it needs, how much memory they occupy at peak, how
+many times models will be swapped in and out under the memory budget, and
+roughly how long a session takes.
+
+The prediction replays the preset's turn sequence (ordered by the same
+``TurnScheduler`` sessions use, followed by the moderator's synthesis)
+against the residency manager's LRU eviction policy. Time estimates use the
+model profiler's measurements where available and fall back to size-based
+guesses otherwise.
+
+Usage:
+    >>> planner = CouncilPlanner(config, client.residency, profiler)
+    >>> plan = planner.plan("research")
+    >>> plan["status"], plan["swaps"], plan["estimated_seconds"]
+    ('thrashing', 4, 312.5)
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Iterable, Optional
+
+from council.agent import Agent
+from council.config import CouncilConfig
+from council.lm_studio import ResidencyView
+from council.models import CouncilPreset, StrategyType, TurnOrder, round_runs_parallel
+from council.profiler import (
+    LOAD_SECONDS,
+    TOKENS_PER_SECOND,
+    TTFT_SECONDS,
+    ModelProfiler,
+)
+from council.scheduling import TurnScheduler
+
+logger = logging.getLogger(__name__)
+
+# Fallbacks for models the profiler hasn't measured yet. Loading is bounded
+# by disk read speed; decoding by memory bandwidth (every token reads the
+# whole model once).
+ASSUMED_LOAD_GB_PER_SECOND = 2.0
+ASSUMED_MEMORY_BANDWIDTH_GB_PER_SECOND = 100.0
+ASSUMED_TTFT_SECONDS = 1.0
+
+# Plan statuses
+STATUS_OK = "ok"                    # Every model stays resident once loaded
+STATUS_THRASHING = "thrashing"      # Models get evicted and reloaded mid-session
+STATUS_INFEASIBLE = "infeasible"    # A single model exceeds the memory budget
+
+
+class CouncilPlanner:
+    """
+    Estimates memory, model swaps and wall-clock time for council presets.
+
+    Attributes:
+        config: Loaded council configuration
+        residency: Residency manager (footprints, budget, eviction policy)
+        profiler: Measured per-model performance (optional)
+    """
+
+    def __init__(
+        self,
+        config: CouncilConfig,
+        residency: ResidencyView,
+        profiler: Optional[ModelProfiler] = None,
+    ):
+        """
+        Initialize the planner.
+
+        Args:
+            config: Loaded council configuration
+            residency: The client's residency manager
+            profiler: Measured per-model performance, if profiling is enabled
+        """
+        self.config = config
+        self.residency = residency
+        self.profiler = profiler
+
+    # -------------------------------------------------------------------------
+    # Turn sequence
+    # -------------------------------------------------------------------------
+
+    def _identifier(self, model_key: str) -> str:
+        return self.config.models[model_key].identifier
+
+    def _agents(self, preset: CouncilPreset) -> list[Agent]:
+        return [
+            Agent(
+                role=a.role,
+                model_key=a.model,
+                model_identifier=self._identifier(a.model),
+                persona=a.persona,
+            )
+            for a in preset.agents
+        ]
+
+    def turn_sequence(
+        self,
+        preset: CouncilPreset,
+        initial: list[str],
+        debate_rounds: Optional[int] = None,
+    ) -> list[str]:
+        """
+        Model identifiers in the order a session of ``preset`` will use them.
+
+        Args:
+            preset: The council preset
+            initial: Resident models at session start, LRU first
+            debate_rounds: Override the preset's round count
+
+        Returns:
+            One identifier per turn, ending with the moderator's.
+        """
+        agents = self._agents(preset)
+        moderator = (
+            [self._identifier(preset.moderator.model)] if preset.moderator else []
+        )
+
+        if preset.strategy == StrategyType.PIPELINE:
+            return [a.model_identifier for a in agents] + moderator
+
+        rounds = 1
+        if preset.strategy == StrategyType.DEBATE:
+            rounds = debate_rounds or preset.debate_rounds
+
+        # Order each round exactly as a session would, from the resident
+        # set predicted for the start of that round
+        scheduler = TurnScheduler(
+            self.residency, enabled=preset.turn_order == TurnOrder.SWAP_AWARE
+        )
+        sequence: list[str] = []
+        for round_num in range(1, rounds + 1):
+            upcoming = moderator if round_num == rounds else []
+            order = scheduler.peek_round(
+                agents,
+                round_num,
+                upcoming,
+                resident=self.residency.predict_resident(sequence, initial),
+            )
+            sequence += [a.model_identifier for a in order]
+        return sequence + moderator
+
+    # -------------------------------------------------------------------------
+    # Estimates
+    # -------------------------------------------------------------------------
+
+    def _measured(self, identifier: str, metric: str) -> Optional[float]:
+        return self.profiler.expected(identifier, metric) if self.profiler else None
+
+    def _load_seconds(self, identifier: str) -> float:
+        measured = self._measured(identifier, LOAD_SECONDS)
+        if measured is not None:
+            return measured
+        return self.residency.footprint_gb(identifier) / ASSUMED_LOAD_GB_PER_SECOND
+
+    def _turn_seconds(self, identifier: str, max_tokens: int) -> float:
+        ttft = self._measured(identifier, TTFT_SECONDS)
+        tps = self._measured(identifier, TOKENS_PER_SECOND)
+        if ttft is None:
+            ttft = ASSUMED_TTFT_SECONDS
+        if not tps:
+            tps = (
+                ASSUMED_MEMORY_BANDWIDTH_GB_PER_SECOND
+                / self.residency.footprint_gb(identifier)
+            )
+        return ttft + max_tokens / tps
+
+    def plan(
+        self,
+        council_key: str,
+        resident: Optional[Iterable[str]] = None,
+        debate_rounds: Optional[int] = None,
+        max_tokens: Optional[int] = None,
+    ) -> dict[str, Any]:
+        """
+        Plan one session of a council preset.
+
+        Args:
+            council_key: Key of the preset in config.yaml
+            resident: Resident models at session start, LRU first
+                      (defaults to none — a cold start)
+            debate_rounds: Override the preset's round count
+            max_tokens: Tokens per turn assumed for the time estimate
+                        (defaults to ``defaults.max_tokens``; an upper bound)
+
+        Returns:
+            Dictionary with the turn sequence, peak resident footprint, load
+            and swap counts, estimated seconds, per-model breakdown, status
+            (ok / thrashing / infeasible) and human-readable warnings.
+
+        Raises:
+            KeyError: If the council key or one of its models is unknown
+        """
+        if council_key not in self.config.councils:
+            raise KeyError(
+                f"Council '{council_key}' not found. "
+                f"Available: {list(self.config.councils.keys())}"
+            )
+        preset = self.config.councils[council_key]
+        max_tokens = max_tokens or self.config.defaults.max_tokens
+        initial = list(resident or [])
+        budget = self.residency.memory_budget_gb
+
+        sequence = self.turn_sequence(preset, initial, debate_rounds)
+        loads, peak_gb = self.residency.simulate(sequence, initial)
+        distinct = list(dict.fromkeys(sequence))
+        cold_loads = sum(1 for i in distinct if i not in initial)
+        swaps = loads - cold_loads
+
+        # Per-model: replay turn by turn to attribute loads
+        per_model: dict[str, dict[str, Any]] = {
+            i: {
+                "footprint_gb": round(self.residency.footprint_gb(i), 2),
+                "turns": sequence.count(i),
+                "loads": 0,
+                "measured": bool(
+                    self.profiler and self.profiler.expected(i, TOKENS_PER_SECOND)
+                ),
+            }
+            for i in distinct
+        }
+        # Rounds whose agents generate in parallel take as long as their
+        # slowest agent, provided the agents' models fit in memory together
+        n_agents = len(preset.agents)
+        parallel_rounds: set[int] = set()
+        voters = {self._identifier(a.model) for a in preset.agents}
+        fits_together = budget <= 0 or sum(
+            self.residency.footprint_gb(i) for i in voters
+        ) <= budget
+        if n_agents > 1 and fits_together:
+            rounds = (len(sequence) - (1 if preset.moderator else 0)) // n_agents
+            parallel_rounds = {
+                round_idx
+                for round_idx in range(rounds)
+                if round_runs_parallel(preset.strategy, preset.execution_mode, round_idx + 1)
+            }
+
+        estimated = 0.0
+        slowest: dict[int, float] = {}
+        for idx, identifier in enumerate(sequence):
+            before, _ = self.residency.simulate(sequence[:idx], initial)
+            after, _ = self.residency.simulate(sequence[: idx + 1], initial)
+            if after > before:
+                per_model[identifier]["loads"] += 1
+                estimated += self._load_seconds(identifier)
+            turn = self._turn_seconds(identifier, max_tokens)
+            round_idx = idx // n_agents if n_agents else 0
+            if round_idx in parallel_rounds:
+                slowest[round_idx] = max(slowest.get(round_idx, 0.0), turn)
+            else:
+                estimated += turn
+        estimated += sum(slowest.values())
+
+        warnings: list[str] = []
+        status = STATUS_OK
+        if budget > 0:
+            too_big = [i for i in distinct if self.residency.footprint_gb(i) > budget]
+            for identifier in too_big:
+                warnings.append(
+                    f"{identifier} needs ~{per_model[identifier]['footprint_gb']} GB, "
+                    f"more than the {budget} GB memory budget on its own"
+                )
+            if too_big:
+                status = STATUS_INFEASIBLE
+            elif swaps > 0:
+                status = STATUS_THRASHING
+                total_gb = round(sum(self.residency.footprint_gb(i) for i in distinct), 2)
+                warnings.append(
+                    f"Models need {total_gb} GB together but the budget is "
+                    f"{budget} GB: expect {swaps} reload(s) per session"
+                )
+
+        return {
+            "council": council_key,
+            "strategy": preset.strategy.value,
+            "turn_order": preset.turn_order.value,
+            "execution_mode": preset.execution_mode.value,
+            "memory_budget_gb": budget,
+            "sequence": sequence,
+            "peak_resident_gb": peak_gb,
+            "loads": loads,
+            "swaps": swaps,
+            "estimated_seconds": round(estimated, 1),
+            "max_tokens_assumed": max_tokens,
+            "models": per_model,
+            "status": status,
+            "warnings": warnings,
+        }
+
+    def log_all(self):
+        """Log a one-line plan summary for every preset (used at startup)."""
+        for key in self.config.councils:
+            try:
+                plan = self.plan(key)
+            except KeyError as e:
+                logger.warning(f"Council '{key}': cannot plan ({e})")
+                continue
+            except Exception:
+                # A planning bug must not keep the server from starting
+                logger.exception(f"Council '{key}': planning failed")
+                continue
+            summary = (
+                f"Council '{key}': {plan['status']}, peak {plan['peak_resident_gb']} GB, "
+                f"{plan['loads']} load(s), {plan['swaps']} swap(s), "
+                f"~{plan['estimated_seconds']:.0f}s per session"
+            )
+            if plan["status"] == STATUS_OK:
+                logger.info(summary)
+            else:
+                logger.warning(f"{summary} — " + "; ".join(plan["warnings"]))
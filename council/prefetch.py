@@ -0,0 +1,108 @@
+"""
+Model Prefetching
+=================
+
+Loads the next turn's model in the background while the current agent is
+still generating, so the load is off the critical path.
+
+Strategies know their whole turn plan up front, so before an agent starts
+streaming they hand the prefetcher the agents that speak next. A prefetch
+only starts if the model fits in the memory budget without evicting the
+model that is currently generating (or anything else the caller protects).
+
+When the next turn begins, ``claim()`` waits for the in-flight prefetch
+(usually already finished), so the turn's own load is a no-op.
+
+Usage:
+    >>> prefetcher = ModelPrefetcher(client)
+    >>> prefetcher.prefetch("qwen2.5-7b-instruct", protect=["gemma-2-9b-it"])
+    >>> # ... generate with gemma ...
+    >>> was_prefetched = await prefetcher.claim("qwen2.5-7b-instruct")
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Iterable
+
+from council.lm_studio import LMStudioClient
+
+logger = logging.getLogger(__name__)
+
+
+class ModelPrefetcher:
+    """
+    Starts background model loads for upcoming turns.
+
+    Attributes:
+        client: LM Studio client whose residency manager performs the loads
+    """
+
+    def __init__(self, client: LMStudioClient):
+        """
+        Initialize the prefetcher.
+
+        Args:
+            client: LM Studio client
+        """
+        self.client = client
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    def prefetch(self, identifier: str, protect: Iterable[str] = ()) -> bool:
+        """
+        Start loading a model in the background if it's worth it.
+
+        Skipped when the model is already resident, already being
+        prefetched, or would only fit by evicting a protected model.
+
+        Args:
+            identifier: Model to load
+            protect: Identifiers that must stay resident (e.g., the model
+                     generating right now)
+
+        Returns:
+            True if a background load was started.
+        """
+        protect = list(protect)
+        residency = self.client.residency
+        in_flight = self._tasks.get(identifier)
+        if (in_flight and not in_flight.done()) or residency.is_resident(identifier):
+            return False
+        if not residency.fits(identifier, protect):
+            logger.debug(f"Not prefetching '{identifier}': exceeds memory budget")
+            return False
+
+        logger.info(f"Prefetching model: {identifier}")
+        self._tasks[identifier] = asyncio.create_task(
+            self._load(identifier, protect)
+        )
+        return True
+
+    async def _load(self, identifier: str, protect: list[str]) -> bool:
+        try:
+            return await self.client.ensure_model_loaded(identifier, protect)
+        except Exception as e:
+            logger.warning(f"Prefetch of '{identifier}' failed: {e}")
+            return False
+
+    def is_pending(self, identifier: str) -> bool:
+        """Whether a prefetch for ``identifier`` has been started and not claimed."""
+        return identifier in self._tasks
+
+    async def claim(self, identifier: str) -> bool:
+        """
+        Wait for an in-flight prefetch of ``identifier``, if any.
+
+        Args:
+            identifier: Model the current turn needs
+
+        Returns:
+            True if a prefetch loaded (or was loading) the model.
+        """
+        task = self._tasks.pop(identifier, None)
+        if task is None:
+            return False
+        loaded = await task
+        # It may have been evicted again since the prefetch finished
+        return loaded and self.client.residency.is_resident(identifier)
@@ -0,0 +1,298 @@
+"""
+Model Profiler
+==============
+
+Records how each model behaves on this host — how long it takes to load,
+its time-to-first-token, and its generation speed — and keeps the numbers
+across restarts in a small JSON file.
+
+For every model identifier and metric the profiler keeps:
+    - An exponentially weighted moving average (EWMA), which tracks recent
+      behavior (e.g., after a driver update or a different quantization)
+    - A bounded window of recent samples for percentiles (p50/p95)
+
+Schedulers and planners read the profile through ``expected()`` and
+``percentile()``; the server exposes it at ``/api/models/profile``.
+
+Samples are recorded from the streaming path, so the file is written at
+most every few seconds, in a worker thread when an event loop is running.
+Call ``flush()`` on shutdown to write the last samples.
+
+Usage:
+    >>> profiler = ModelProfiler(".council_profile.json")
+    >>> profiler.record_load("qwen2.5-7b-instruct", 8.4)
+    >>> profiler.expected("qwen2.5-7b-instruct", "load_seconds")
+    8.4
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Metric names
+LOAD_SECONDS = "load_seconds"
+TTFT_SECONDS = "ttft_seconds"
+TOKENS_PER_SECOND = "tokens_per_second"
+
+# Minimum seconds between writes of the profile file
+SAVE_INTERVAL_SECONDS = 5.0
+
+
+class MetricStats:
+    """
+    EWMA plus a bounded sample window for one metric of one model.
+
+    Attributes:
+        ewma: Exponentially weighted moving average (None until first sample)
+        count: Total number of samples ever recorded
+        samples: Most recent samples, oldest first
+    """
+
+    def __init__(self, alpha: float = 0.2, window: int = 200):
+        self.alpha = alpha
+        self.window = window
+        self.ewma: Optional[float] = None
+        self.count = 0
+        self.samples: list[float] = []
+
+    def add(self, value: float):
+        """Record one sample."""
+        self.ewma = value if self.ewma is None else (
+            self.alpha * value + (1 - self.alpha) * self.ewma
+        )
+        self.count += 1
+        self.samples.append(value)
+        if len(self.samples) > self.window:
+            del self.samples[: len(self.samples) - self.window]
+
+    def percentile(self, p: float) -> Optional[float]:
+        """Nearest-rank percentile (0-100) over the sample window."""
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        rank = min(len(ordered) - 1, max(0, round(p / 100 * (len(ordered) - 1))))
+        return ordered[rank]
+
+    def summary(self) -> dict[str, Any]:
+        """Aggregates for display."""
+        return {
+            "ewma": round(self.ewma, 3) if self.ewma is not None else None,
+            "p50": _round(self.percentile(50)),
+            "p95": _round(self.percentile(95)),
+            "count": self.count,
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"ewma": self.ewma, "count": self.count, "samples": list(self.samples)}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], alpha: float, window: int) -> "MetricStats":
+        stats = cls(alpha, window)
+        stats.ewma = data.get("ewma")
+        stats.count = int(data.get("count", 0))
+        stats.samples = [float(v) for v in data.get("samples", [])][-window:]
+        return stats
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return round(value, 3) if value is not None else None
+
+
+class ModelProfiler:
+    """
+    Per-model load and throughput profile, persisted to a JSON file.
+
+    Attributes:
+        path: File the profile is persisted to (None = in memory only)
+        alpha: EWMA smoothing factor (higher = reacts faster)
+        window: Number of recent samples kept per metric for percentiles
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        alpha: float = 0.2,
+        window: int = 200,
+    ):
+        """
+        Initialize the profiler, loading any previously saved profile.
+
+        Args:
+            path: JSON file to persist to (None disables persistence)
+            alpha: EWMA smoothing factor
+            window: Samples kept per metric for percentiles
+        """
+        self.path = Path(path) if path else None
+        self.alpha = alpha
+        self.window = window
+        self._metrics: dict[str, dict[str, MetricStats]] = {}
+        self._dirty = False
+        self._last_save = 0.0
+        # Background write in progress, if any
+        self._saving: Optional[asyncio.Task] = None
+        # Keeps writers from different threads off each other's temp file
+        self._write_lock = threading.Lock()
+        self._load()
+
+    # -------------------------------------------------------------------------
+    # Recording
+    # -------------------------------------------------------------------------
+
+    def _record(self, identifier: str, metric: str, value: float):
+        per_model = self._metrics.setdefault(identifier, {})
+        stats = per_model.get(metric)
+        if stats is None:
+            stats = per_model[metric] = MetricStats(self.alpha, self.window)
+        stats.add(value)
+        self._dirty = True
+        if time.monotonic() - self._last_save >= SAVE_INTERVAL_SECONDS:
+            self._schedule_save()
+
+    def record_load(self, identifier: str, seconds: float):
+        """Record how long a model load took."""
+        self._record(identifier, LOAD_SECONDS, seconds)
+
+    def record_generation(
+        self,
+        identifier: str,
+        ttft_seconds: Optional[float],
+        tokens: int,
+        duration_seconds: float,
+    ):
+        """
+        Record one completion.
+
+        Args:
+            identifier: Model that generated
+            ttft_seconds: Time to first token (None for non-streamed calls)
+            tokens: Number of tokens generated
+            duration_seconds: Total wall time of the request
+        """
+        if ttft_seconds is not None:
+            self._record(identifier, TTFT_SECONDS, ttft_seconds)
+        # Generation speed excludes the prompt-processing time before the
+        # first token when we know it
+        generating = duration_seconds - (ttft_seconds or 0.0)
+        if tokens > 1 and generating > 0:
+            self._record(identifier, TOKENS_PER_SECOND, tokens / generating)
+
+    def record_ttft(self, identifier: str, seconds: float):
+        """
+        Record a time to first token on its own.
+
+        Used for requests cancelled before finishing, such as the losing side
+        of a hedged request. If it never streamed, ``seconds`` is how long it
+        had waited. That is a lower bound, but dropping it would skew the
+        percentiles towards fast requests.
+        """
+        self._record(identifier, TTFT_SECONDS, seconds)
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def expected(self, identifier: str, metric: str) -> Optional[float]:
+        """EWMA of a metric for a model, or None if never measured."""
+        stats = self._metrics.get(identifier, {}).get(metric)
+        return stats.ewma if stats else None
+
+    def percentile(self, identifier: str, metric: str, p: float) -> Optional[float]:
+        """Percentile (0-100) of a metric for a model, or None if never measured."""
+        stats = self._metrics.get(identifier, {}).get(metric)
+        return stats.percentile(p) if stats else None
+
+    def sample_count(self, identifier: str, metric: str) -> int:
+        """Number of samples of a metric currently in a model's window."""
+        stats = self._metrics.get(identifier, {}).get(metric)
+        return len(stats.samples) if stats else 0
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Aggregated profile of every measured model."""
+        return {
+            identifier: {metric: stats.summary() for metric, stats in metrics.items()}
+            for identifier, metrics in self._metrics.items()
+        }
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+
+    def _load(self):
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            with open(self.path, "r") as f:
+                raw = json.load(f)
+            for identifier, metrics in raw.get("models", {}).items():
+                self._metrics[identifier] = {
+                    metric: MetricStats.from_dict(data, self.alpha, self.window)
+                    for metric, data in metrics.items()
+                }
+            logger.info(f"Loaded model profile for {len(self._metrics)} model(s)")
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable model profile {self.path}: {e}")
+
+    def _schedule_save(self):
+        """Save without blocking the event loop (inline if there is none)."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.save()
+            return
+        if self._saving is not None and not self._saving.done():
+            return
+        self._saving = loop.create_task(self._save_in_thread())
+
+    def save(self):
+        """Write the profile to disk (atomically) if anything changed; blocks."""
+        self._last_save = time.monotonic()
+        if self.path is None or not self._dirty:
+            return
+        self._dirty = False
+        if not self._write(self._to_dict()):
+            self._dirty = True
+
+    async def flush(self):
+        """Write any unsaved samples in a worker thread, after a pending save."""
+        if self._saving is not None:
+            await asyncio.gather(self._saving, return_exceptions=True)
+        await self._save_in_thread()
+
+    async def _save_in_thread(self):
+        self._last_save = time.monotonic()
+        if self.path is None or not self._dirty:
+            return
+        # Snapshot on the loop, where samples are recorded; serialize and
+        # write in a thread
+        self._dirty = False
+        if not await asyncio.to_thread(self._write, self._to_dict()):
+            self._dirty = True
+
+    def _to_dict(self) -> dict[str, Any]:
+        return {
+            "models": {
+                identifier: {m: s.to_dict() for m, s in metrics.items()}
+                for identifier, metrics in self._metrics.items()
+            }
+        }
+
+    def _write(self, data: dict[str, Any]) -> bool:
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            with self._write_lock:
+                with open(tmp_path, "w") as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, self.path)
+            return True
+        except Exception as e:
+            logger.warning(f"Could not save model profile to {self.path}: {e}")
+            return False
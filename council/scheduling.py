@@ -0,0 +1,338 @@
+"""
+Turn Scheduling
+===============
+
+Decides the order in which agent turns run so that models already
+resident in LM Studio are reused before anything is swapped out.
+
+Two schedulers live here:
+    - ``TurnScheduler`` orders agents within a round of one session
+    - ``ModelAffinityQueue`` orders turns across concurrent sessions
+
+With a memory budget that fits only some of a council's models, config
+order (A, B, C every round) forces a load on nearly every turn. The
+swap-aware scheduler instead:
+    - Alternates direction between rounds (A, B, C then C, B, A), so the
+      model that spoke last keeps the floor
+    - Picks, among all orderings of a round, the one the residency
+      manager predicts will need the fewest loads
+
+The turn scheduler only changes *when* an agent speaks. Strategies still build
+each agent's history from what has actually been said so far, so the
+transcript the UI shows is exactly what every agent saw.
+
+Usage:
+    >>> scheduler = TurnScheduler(client.residency, enabled=True)
+    >>> order = scheduler.order_round(agents, round_num=2)
+    >>> scheduler.swaps_avoided
+    3
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, Optional, Sequence
+
+from council.agent import Agent
+from council.lm_studio import ResidencyView
+
+logger = logging.getLogger(__name__)
+
+# Rounds with more agents than this are ordered greedily instead of
+# by evaluating every permutation
+MAX_EXHAUSTIVE_AGENTS = 6
+
+
+class TurnScheduler:
+    """
+    Reorders agent turns within a round to minimize model swaps.
+
+    When disabled, rounds are returned in config order unchanged.
+
+    Attributes:
+        residency: Residency manager used to predict loads
+        enabled: Whether turns are reordered at all
+        swaps_avoided: Loads saved so far versus config order (predicted)
+    """
+
+    def __init__(self, residency: ResidencyView, enabled: bool = False):
+        """
+        Initialize the scheduler.
+
+        Args:
+            residency: The client's residency manager
+            enabled: Reorder turns (True) or keep config order (False)
+        """
+        self.residency = residency
+        self.enabled = enabled
+        # Resident set when the session started, and every model use so far
+        # under config order vs. the chosen order, for measuring the gain
+        self._initial_resident: list[str] | None = None
+        self._config_sequence: list[str] = []
+        self._scheduled_sequence: list[str] = []
+
+    @property
+    def swaps_avoided(self) -> int:
+        """Predicted model loads saved so far compared with config order."""
+        if not self._scheduled_sequence:
+            return 0
+        baseline, _ = self.residency.simulate(
+            self._config_sequence, self._initial_resident
+        )
+        scheduled, _ = self.residency.simulate(
+            self._scheduled_sequence, self._initial_resident
+        )
+        return max(0, baseline - scheduled)
+
+    def _loads(
+        self,
+        order: Sequence[Agent],
+        upcoming: Sequence[str],
+        resident: Optional[list[str]],
+    ) -> int:
+        """Predicted loads for speaking in ``order`` followed by ``upcoming``."""
+        sequence = [a.model_identifier for a in order] + list(upcoming)
+        loads, _ = self.residency.simulate(sequence, resident)
+        return loads
+
+    def _candidates(self, base: list[Agent], resident: Optional[list[str]]):
+        """Orderings to evaluate, best tie-breaker first."""
+        yield base
+        if len(base) <= MAX_EXHAUSTIVE_AGENTS:
+            yield from (list(p) for p in itertools.permutations(base))
+        else:
+            # Greedy: resident models first (most recently used leading),
+            # agents sharing a model kept adjacent
+            if resident is None:
+                resident = self.residency.resident_identifiers()
+            recency = {m: i for i, m in enumerate(resident)}
+            first_use: dict[str, int] = {}
+            for idx, agent in enumerate(base):
+                first_use.setdefault(agent.model_identifier, idx)
+
+            def key(agent: Agent) -> tuple[int, int]:
+                if agent.model_identifier in recency:
+                    return (0, -recency[agent.model_identifier])
+                return (1, first_use[agent.model_identifier])
+
+            yield sorted(base, key=key)
+
+    def peek_round(
+        self,
+        agents: Sequence[Agent],
+        round_num: int = 1,
+        upcoming: Sequence[str] = (),
+        resident: Optional[list[str]] = None,
+    ) -> list[Agent]:
+        """
+        Predict a round's speaking order without recording it.
+
+        Used to look one round ahead (e.g., to prefetch the first speaker's
+        model) and by the planner. Arguments are the same as for
+        ``order_round()``, plus:
+
+        Args:
+            resident: Resident models (LRU first) assumed at the start of
+                      the round (defaults to the current resident set)
+        """
+        agents = list(agents)
+        if not self.enabled or len(agents) < 2:
+            return agents
+
+        base = agents if round_num % 2 == 1 else agents[::-1]
+        best, best_loads = base, self._loads(base, upcoming, resident)
+        for candidate in self._candidates(base, resident):
+            loads = self._loads(candidate, upcoming, resident)
+            if loads < best_loads:
+                best, best_loads = candidate, loads
+        return best
+
+    def order_round(
+        self,
+        agents: Sequence[Agent],
+        round_num: int = 1,
+        upcoming: Sequence[str] = (),
+    ) -> list[Agent]:
+        """
+        Choose the speaking order for one round.
+
+        Args:
+            agents: Agents in config order
+            round_num: 1-indexed round number (even rounds start reversed)
+            upcoming: Model identifiers needed right after this round
+                      (e.g., the moderator's model after the final round)
+
+        Returns:
+            Agents in the order they should speak.
+        """
+        agents = list(agents)
+        if not self.enabled or len(agents) < 2:
+            return agents
+
+        if self._initial_resident is None:
+            self._initial_resident = self.residency.resident_identifiers()
+
+        best = self.peek_round(agents, round_num, upcoming)
+        self._config_sequence += [a.model_identifier for a in agents]
+        self._scheduled_sequence += [a.model_identifier for a in best]
+        if best != agents:
+            logger.info(
+                f"Round {round_num}: speaking order {[a.role for a in best]}"
+            )
+        return best
+
+
+class _TurnJob:
+    """A turn waiting in the affinity queue."""
+
+    __slots__ = ("model_identifier", "enqueued_at", "granted")
+
+    def __init__(self, model_identifier: str):
+        self.model_identifier = model_identifier
+        self.enqueued_at = time.monotonic()
+        self.granted: asyncio.Future = asyncio.get_running_loop().create_future()
+
+
+class ModelAffinityQueue:
+    """
+    Cross-session queue that batches agent turns by model.
+
+    Every agent turn (load + generation) is submitted as a job tagged with
+    its model identifier and runs once the queue grants it a slot. When a
+    slot frees up, the queue prefers waiting jobs whose model is already
+    in use or resident, so turns from different sessions that share a
+    model run back to back instead of forcing a swap each time. A job that
+    has waited longer than ``max_wait_seconds`` is granted next regardless
+    of its model, which bounds how long any session can be starved.
+
+    Attributes:
+        residency: Residency manager used to tell which models are loaded
+        max_concurrent: Number of turns allowed to run at once
+        max_wait_seconds: Aging bound after which a job jumps the queue
+    """
+
+    def __init__(
+        self,
+        residency: ResidencyView,
+        max_concurrent: int = 1,
+        max_wait_seconds: float = 30.0,
+    ):
+        """
+        Initialize the queue.
+
+        Args:
+            residency: The client's residency manager
+            max_concurrent: Number of turns allowed to run at once
+            max_wait_seconds: Aging bound for fairness
+        """
+        self.residency = residency
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_wait_seconds = max_wait_seconds
+        self._waiting: list[_TurnJob] = []
+        self._running: list[str] = []
+        self._last_model: Optional[str] = None
+
+        # Metrics
+        self._granted_total = 0
+        self._swaps = 0
+        self._aged_grants = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._recent_waits: deque[float] = deque(maxlen=200)
+
+    @asynccontextmanager
+    async def turn(self, model_identifier: str):
+        """
+        Hold a slot for one agent turn on ``model_identifier``.
+
+        Usage:
+            >>> async with queue.turn("qwen2.5-7b-instruct"):
+            ...     await client.ensure_model_loaded("qwen2.5-7b-instruct")
+            ...     ...  # generate
+        """
+        job = _TurnJob(model_identifier)
+        self._waiting.append(job)
+        self._dispatch()
+        try:
+            await job.granted
+        except BaseException:
+            if job in self._waiting:
+                self._waiting.remove(job)
+            elif job.granted.done() and not job.granted.cancelled():
+                # Granted just as we were cancelled: give the slot back
+                self._release(model_identifier)
+            raise
+
+        try:
+            yield
+        finally:
+            self._release(model_identifier)
+
+    def _release(self, model_identifier: str):
+        self._running.remove(model_identifier)
+        self._dispatch()
+
+    def _pick(self) -> tuple[_TurnJob, bool]:
+        """Choose the next job to run. Returns (job, granted_by_aging)."""
+        oldest = self._waiting[0]
+        if time.monotonic() - oldest.enqueued_at >= self.max_wait_seconds:
+            return oldest, True
+
+        in_use = set(self._running)
+        if self._last_model:
+            in_use.add(self._last_model)
+        for job in self._waiting:
+            if job.model_identifier in in_use:
+                return job, False
+        for job in self._waiting:
+            if self.residency.is_resident(job.model_identifier):
+                return job, False
+        return oldest, False
+
+    def _dispatch(self):
+        """Grant slots to waiting jobs while capacity allows."""
+        while self._waiting and len(self._running) < self.max_concurrent:
+            job, aged = self._pick()
+            self._waiting.remove(job)
+            if job.granted.cancelled():
+                continue  # Its caller gave up while waiting
+
+            model = job.model_identifier
+            if model != self._last_model and model not in self._running \
+                    and not self.residency.is_resident(model):
+                self._swaps += 1
+            waited = time.monotonic() - job.enqueued_at
+            self._granted_total += 1
+            self._aged_grants += int(aged)
+            self._total_wait += waited
+            self._max_wait = max(self._max_wait, waited)
+            self._recent_waits.append(waited)
+
+            self._running.append(model)
+            self._last_model = model
+            job.granted.set_result(None)
+
+    def stats(self) -> dict[str, Any]:
+        """Queue depth, wait times and swap counts for tuning."""
+        recent = sorted(self._recent_waits)
+        p95 = recent[int(0.95 * (len(recent) - 1))] if recent else 0.0
+        return {
+            "queue_depth": len(self._waiting),
+            "running": list(self._running),
+            "max_concurrent": self.max_concurrent,
+            "max_wait_seconds": self.max_wait_seconds,
+            "turns_granted": self._granted_total,
+            "model_swaps": self._swaps,
+            "aged_grants": self._aged_grants,
+            "wait_seconds": {
+                "avg": round(self._total_wait / self._granted_total, 3)
+                if self._granted_total else 0.0,
+                "p95": round(p95, 3),
+                "max": round(self._max_wait, 3),
+            },
+        }
@@ -18,11 +18,23 @@ All strategies are implemented as async generators that yield
 from __future__ import annotations
 
 import abc
-from typing import AsyncGenerator
+import asyncio
+import contextlib
+import time
+from typing import AsyncGenerator, Mapping, Optional, Sequence
 
 from council.agent import Agent
 from council.lm_studio import LMStudioClient
-from council.models import AgentMessage, CouncilEvent
+from council.models import (
+    AgentMessage,
+    ChunkEvent,
+    CouncilEvent,
+    EventType,
+    ExecutionMode,
+    TurnOrder,
+)
+from council.prefetch import ModelPrefetcher
+from council.scheduling import ModelAffinityQueue, TurnScheduler
 
 
 class BaseStrategy(abc.ABC):
@@ -39,6 +51,10 @@ class BaseStrategy(abc.ABC):
         moderator: The moderator Agent for final synthesis
         temperature: Sampling temperature for model responses
         max_tokens: Maximum tokens per response
+        scheduler: Orders agent turns within a round (swap-aware or config order)
+        prefetcher: Loads upcoming turns' models while the current one generates
+        turn_queue: Cross-session queue each turn waits in (optional)
+        execution_mode: Whether independent agents generate in parallel
     """
 
     def __init__(
@@ -48,6 +64,9 @@ class BaseStrategy(abc.ABC):
         moderator: Agent,
         temperature: float = 0.7,
         max_tokens: int = 2048,
+        turn_order: TurnOrder = TurnOrder.CONFIG,
+        turn_queue: Optional[ModelAffinityQueue] = None,
+        execution_mode: ExecutionMode = ExecutionMode.SEQUENTIAL,
     ):
         """
         Initialize the strategy.
@@ -58,12 +77,137 @@ class BaseStrategy(abc.ABC):
             moderator: The moderator agent for final synthesis
             temperature: Sampling temperature (0.0-1.0)
             max_tokens: Max tokens per agent response
+            turn_order: How agents are ordered within a round
+            turn_queue: Shared model-affinity queue; each turn holds one of
+                        its slots from model load until generation ends
+            execution_mode: Run independent agents one at a time or in
+                            parallel (each strategy acts only on the modes
+                            in ``STRATEGY_EXECUTION_MODES``)
         """
         self.client = client
         self.agents = agents
         self.moderator = moderator
         self.temperature = temperature
         self.max_tokens = max_tokens
+        self.scheduler = TurnScheduler(
+            client.residency,
+            enabled=turn_order == TurnOrder.SWAP_AWARE,
+        )
+        self.prefetcher = ModelPrefetcher(client)
+        self.turn_queue = turn_queue
+        self.execution_mode = execution_mode
+
+    def _turn_slot(self, agent: Agent):
+        """Slot in the shared turn queue for ``agent`` (no-op without a queue)."""
+        if self.turn_queue is None:
+            return contextlib.nullcontext()
+        return self.turn_queue.turn(agent.model_identifier)
+
+    def _fit_together(self, agents: Sequence[Agent]) -> bool:
+        """Whether all of ``agents``' models fit in the memory budget at once."""
+        residency = self.client.residency
+        if residency.memory_budget_gb <= 0:
+            return True
+        models = {a.model_identifier for a in agents}
+        return sum(residency.footprint_gb(m) for m in models) <= residency.memory_budget_gb
+
+    async def _merge_streams(
+        self, streams: Mapping[int, AsyncGenerator[CouncilEvent, None]]
+    ) -> AsyncGenerator[CouncilEvent, None]:
+        """
+        Run several agents' event streams at once and interleave their events.
+
+        Each stream is consumed by its own task; events are yielded in the
+        order they arrive and tagged with ``metadata["agent_index"]`` (the
+        key in ``streams``) so the UI can route them to the right card.
+        If one stream fails, or the consumer stops early, the others are
+        cancelled.
+
+        Args:
+            streams: Agent index → that agent's event stream
+
+        Yields:
+            Events from all streams in arrival order.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        finished = object()
+
+        async def pump(index: int, stream: AsyncGenerator[CouncilEvent, None]):
+            try:
+                async for event in stream:
+                    event.metadata["agent_index"] = index
+                    await queue.put(event)
+            except Exception as e:
+                await queue.put(e)
+            finally:
+                await queue.put(finished)
+
+        tasks = [
+            asyncio.create_task(pump(index, stream))
+            for index, stream in streams.items()
+        ]
+        remaining = len(tasks)
+        try:
+            while remaining:
+                item = await queue.get()
+                if item is finished:
+                    remaining -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run_parallel_turns(
+        self,
+        turns: Sequence[tuple[Agent, list[dict[str, str]]]],
+        round_num: int,
+        responses: dict[int, str],
+        prefetch: Sequence[Agent] = (),
+    ) -> AsyncGenerator[CouncilEvent, None]:
+        """
+        Run several agents' turns at once.
+
+        Every turn runs as its own task; their events are merged in arrival
+        order (see ``_merge_streams()``). The agents' models are protected
+        from eviction while any of them is generating, and each turn holds
+        its own slot in the turn queue. Callers should check
+        ``_fit_together()`` first.
+
+        Args:
+            turns: (agent, chat messages) for each agent, in load order
+            round_num: Current round number (for event metadata)
+            responses: Filled with each agent's full response, keyed by
+                       the agent's position in config order
+            prefetch: Agents speaking after this group; loaded in the
+                      background only if they fit next to the group's models
+
+        Yields:
+            Events from all turns in arrival order.
+        """
+        position = {id(a): i for i, a in enumerate(self.agents)}
+        agents = [agent for agent, _ in turns]
+        models = [a.model_identifier for a in agents]
+        prefetch = [a for a in prefetch if self._fit_together([*agents, a])]
+
+        streams = {
+            position[id(agent)]: self._stream_agent_response(
+                agent,
+                messages,
+                round_num,
+                prefetch=prefetch,
+                protect=models,
+            )
+            for agent, messages in turns
+        }
+
+        async for event in self._merge_streams(streams):
+            if event.type == EventType.AGENT_DONE:
+                responses[event.metadata["agent_index"]] = event.content
+            yield event
 
     @abc.abstractmethod
     async def execute(
@@ -90,120 +234,155 @@ class BaseStrategy(abc.ABC):
         agent: Agent,
         messages: list[dict[str, str]],
         round_num: int = 1,
+        prefetch: Sequence[Agent] = (),
+        protect: Sequence[str] = (),
     ) -> AsyncGenerator[CouncilEvent, None]:
         """
         Stream a single agent's response, yielding events for each chunk.
 
         This helper method handles:
-            1. Ensuring the agent's model is loaded
-            2. Emitting AGENT_START event
-            3. Streaming response chunks as AGENT_CHUNK events
-            4. Emitting AGENT_DONE event with the full response
+            1. Waiting for a slot in the shared turn queue (if enabled)
+            2. Ensuring the agent's model is loaded (or claiming a prefetch)
+            3. Starting background loads for the upcoming turns' models
+            4. Emitting AGENT_START event
+            5. Streaming response chunks as AGENT_CHUNK events
+            6. Emitting AGENT_DONE event with the full response
 
         Args:
             agent: The agent whose turn it is to respond
             messages: The chat messages to send to the model
             round_num: Current round number (for event metadata)
+            prefetch: Agents speaking next, in order; their models are loaded
+                      in the background while this agent generates, as far
+                      as the memory budget allows
+            protect: Models that must not be evicted to make room for this
+                     agent's (e.g., agents generating in parallel)
 
         Yields:
-            CouncilEvent objects (AGENT_START, AGENT_CHUNK, AGENT_DONE)
+            CouncilEvent objects (AGENT_START, AGENT_DONE), with each
+            AGENT_CHUNK as a lightweight ChunkEvent
         """
         from council.models import EventType
 
-        # Ensure model is loaded
-        yield CouncilEvent(
-            type=EventType.MODEL_LOADING,
-            agent=agent.role,
-            content=f"Loading model {agent.model_identifier}...",
-            metadata={"model": agent.model_identifier},
-        )
-
-        await self.client.ensure_model_loaded(agent.model_identifier)
+        # Hold a slot in the cross-session queue for the whole turn, so
+        # turns on already-loaded models can be batched across sessions
+        async with self._turn_slot(agent):
+            # Ensure model is loaded
+            already_loading = self.prefetcher.is_pending(agent.model_identifier)
+            yield CouncilEvent(
+                type=EventType.MODEL_LOADING,
+                agent=agent.role,
+                content=(
+                    f"Waiting for prefetched model {agent.model_identifier}..."
+                    if already_loading
+                    else f"Loading model {agent.model_identifier}..."
+                ),
+                metadata={"model": agent.model_identifier, "prefetched": already_loading},
+            )
 
-        yield CouncilEvent(
-            type=EventType.MODEL_LOADED,
-            agent=agent.role,
-            content=f"Model {agent.model_identifier} ready",
-            metadata={"model": agent.model_identifier},
-        )
+            load_start = time.monotonic()
+            prefetched = await self.prefetcher.claim(agent.model_identifier)
+            await self.client.ensure_model_loaded(agent.model_identifier, protect)
+            load_ms = int((time.monotonic() - load_start) * 1000)
 
-        # Signal agent is starting
-        yield CouncilEvent(
-            type=EventType.AGENT_START,
-            agent=agent.role,
-            round=round_num,
-            metadata={"model": agent.model_key},
-        )
+            yield CouncilEvent(
+                type=EventType.MODEL_LOADED,
+                agent=agent.role,
+                content=(
+                    f"Model {agent.model_identifier} ready (prefetched)"
+                    if prefetched
+                    else f"Model {agent.model_identifier} ready"
+                ),
+                metadata={
+                    "model": agent.model_identifier,
+                    "prefetched": prefetched,
+                    "load_ms": load_ms,
+                },
+            )
 
-        # Stream the response
-        full_response = ""
-        has_error = False
-        try:
-            async for chunk in self.client.chat_stream(
-                model_identifier=agent.model_identifier,
-                messages=messages,
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-            ):
-                # Detect error messages from chat_stream's error handler
-                if chunk.startswith("\n\n[Error:") or chunk.startswith("[Error:"):
-                    has_error = True
-                full_response += chunk
-                yield CouncilEvent(
-                    type=EventType.AGENT_CHUNK,
-                    agent=agent.role,
-                    round=round_num,
-                    content=chunk,
-                )
+            # Load upcoming models while this agent generates
+            protect = [agent.model_identifier, *protect]
+            for upcoming in prefetch:
+                self.prefetcher.prefetch(upcoming.model_identifier, protect)
+                protect.append(upcoming.model_identifier)
 
-            # Fallback: if streaming produced no/clearly-truncated text,
-            # try one non-stream call.
-            normalized_streamed = full_response.strip()
-            streamed_lower = normalized_streamed.lower()
-            looks_truncated = (
-                not normalized_streamed
-                or normalized_streamed in {"<think>", "</think>", "<think></think>"}
-                or (len(normalized_streamed) < 32 and "<think>" in streamed_lower)
+            # Signal agent is starting
+            yield CouncilEvent(
+                type=EventType.AGENT_START,
+                agent=agent.role,
+                round=round_num,
+                metadata={"model": agent.model_key},
             )
-            if not has_error and looks_truncated:
-                fallback_response = await self.client.chat_once(
+
+            # Stream the response
+            full_response = ""
+            has_error = False
+            try:
+                async for chunk in self.client.chat_stream(
                     model_identifier=agent.model_identifier,
                     messages=messages,
                     temperature=self.temperature,
                     max_tokens=self.max_tokens,
-                )
-                if fallback_response:
-                    # If fallback starts with streamed content, append only the missing tail.
-                    content_to_emit = fallback_response
-                    if normalized_streamed and fallback_response.startswith(full_response):
-                        content_to_emit = fallback_response[len(full_response):]
-                    elif normalized_streamed:
-                        # Replace visibly-truncated streamed output with full fallback.
-                        content_to_emit = "\n" + fallback_response
-
-                    full_response = fallback_response
-                    yield CouncilEvent(
+                ):
+                    # Detect error messages from chat_stream's error handler
+                    if chunk.startswith("\n\n[Error:") or chunk.startswith("[Error:"):
+                        has_error = True
+                    full_response += chunk
+                    yield ChunkEvent(
                         type=EventType.AGENT_CHUNK,
                         agent=agent.role,
                         round=round_num,
-                        content=content_to_emit,
+                        content=chunk,
                     )
-        except Exception as e:
-            has_error = True
-            error_msg = f"[Error: {agent.role} failed — {str(e)}]"
-            full_response = error_msg
+
+                # Fallback: if streaming produced no/clearly-truncated text,
+                # try one non-stream call.
+                normalized_streamed = full_response.strip()
+                streamed_lower = normalized_streamed.lower()
+                looks_truncated = (
+                    not normalized_streamed
+                    or normalized_streamed in {"<think>", "</think>", "<think></think>"}
+                    or (len(normalized_streamed) < 32 and "<think>" in streamed_lower)
+                )
+                if not has_error and looks_truncated:
+                    fallback_response = await self.client.chat_once(
+                        model_identifier=agent.model_identifier,
+                        messages=messages,
+                        temperature=self.temperature,
+                        max_tokens=self.max_tokens,
+                    )
+                    if fallback_response:
+                        # If fallback starts with streamed content, append only the missing tail.
+                        content_to_emit = fallback_response
+                        if normalized_streamed and fallback_response.startswith(full_response):
+                            content_to_emit = fallback_response[len(full_response):]
+                        elif normalized_streamed:
+                            # Replace visibly-truncated streamed output with full fallback.
+                            content_to_emit = "\n" + fallback_response
+
+                        full_response = fallback_response
+                        yield ChunkEvent(
+                            type=EventType.AGENT_CHUNK,
+                            agent=agent.role,
+                            round=round_num,
+                            content=content_to_emit,
+                        )
+            except Exception as e:
+                has_error = True
+                error_msg = f"[Error: {agent.role} failed — {str(e)}]"
+                full_response = error_msg
+                yield ChunkEvent(
+                    type=EventType.AGENT_CHUNK,
+                    agent=agent.role,
+                    round=round_num,
+                    content=error_msg,
+                )
+
+            # Signal agent is done
             yield CouncilEvent(
-                type=EventType.AGENT_CHUNK,
+                type=EventType.AGENT_DONE,
                 agent=agent.role,
                 round=round_num,
-                content=error_msg,
+                content=full_response,
+                metadata={"model": agent.model_key, "error": has_error},
             )
-
-        # Signal agent is done
-        yield CouncilEvent(
-            type=EventType.AGENT_DONE,
-            agent=agent.role,
-            round=round_num,
-            content=full_response,
-            metadata={"model": agent.model_key, "error": has_error},
-        )
@@ -23,6 +23,15 @@ Configuration:
     Set ``debate_rounds`` in the council preset to control how many
     rounds of debate occur. More rounds = better quality but slower.
     Recommended: 2 rounds for quick tasks, 3 for important decisions.
+
+    Set ``turn_order: swap_aware`` to let agents speak in whichever order
+    reuses the models already loaded. Each agent still sees everything
+    said before its turn.
+
+    Set ``execution_mode: simultaneous`` for rounds where every agent sees
+    only the previous rounds (not earlier speakers in the same round), so
+    all agents of a round generate in parallel. ``concurrent`` parallelizes
+    only round 1, whose answers are independent anyway.
 """
 
 from __future__ import annotations
@@ -31,7 +40,13 @@ from typing import AsyncGenerator
 
 from council.agent import Agent
 from council.lm_studio import LMStudioClient
-from council.models import CouncilEvent, EventType
+from council.models import (
+    CouncilEvent,
+    EventType,
+    ExecutionMode,
+    StrategyType,
+    round_runs_parallel,
+)
 from council.strategies.base import BaseStrategy
 
 
@@ -69,43 +84,116 @@ class DebateStrategy(BaseStrategy):
         # Each entry: {"role": agent_role, "content": response_text, "round": round_num}
         all_messages: list[dict[str, str]] = []
 
+        simultaneous = self.execution_mode == ExecutionMode.SIMULTANEOUS
+        fallback_announced = False
+
         # ---- Run debate rounds ----
         for round_num in range(1, debate_rounds + 1):
+            # The moderator speaks right after the final round
+            upcoming = (
+                [self.moderator.model_identifier]
+                if round_num == debate_rounds else []
+            )
+            speaking_order = self.scheduler.order_round(
+                self.agents, round_num, upcoming
+            )
+
+            # Agents of a round generate in parallel when none of them
+            # needs to see another's answer from the same round
+            parallel = len(speaking_order) > 1 and round_runs_parallel(
+                StrategyType.DEBATE, self.execution_mode, round_num
+            )
+            if parallel and not self._fit_together(speaking_order):
+                parallel = False
+                if not fallback_announced:
+                    fallback_announced = True
+                    yield CouncilEvent(
+                        type=EventType.STATUS,
+                        content=(
+                            "Agent models don't fit in memory together; "
+                            "agents will speak one at a time"
+                        ),
+                    )
+
             # Signal round start
             yield CouncilEvent(
                 type=EventType.ROUND_START,
                 round=round_num,
                 content=f"Round {round_num} of {debate_rounds}",
-                metadata={"total_rounds": debate_rounds},
+                metadata={
+                    "total_rounds": debate_rounds,
+                    "speaking_order": [a.role for a in speaking_order],
+                    "concurrent": parallel,
+                },
             )
 
-            # Each agent takes their turn in this round
-            for agent in self.agents:
-                # Build messages with appropriate context
-                # Round 1: just the task
-                # Round 2+: task + all previous messages
-                history = all_messages if round_num > 1 else None
-                messages = agent.build_messages(
-                    task=task,
-                    history=history,
-                    round_num=round_num,
-                )
-
-                # Stream the agent's response
-                full_response = ""
-                async for event in self._stream_agent_response(
-                    agent, messages, round_num
+            # Whoever speaks after this round, for prefetching
+            if round_num < debate_rounds:
+                after_round = self.scheduler.peek_round(
+                    self.agents, round_num + 1
+                )[:1]
+            else:
+                after_round = [self.moderator]
+
+            # In simultaneous mode, agents see only the rounds before this one
+            previous_rounds = list(all_messages)
+
+            if parallel:
+                history = previous_rounds if round_num > 1 else None
+                turns = [
+                    (agent, agent.build_messages(
+                        task=task, history=history, round_num=round_num
+                    ))
+                    for agent in speaking_order
+                ]
+                responses: dict[int, str] = {}
+                async for event in self._run_parallel_turns(
+                    turns, round_num, responses, prefetch=after_round
                 ):
-                    if event.type == EventType.AGENT_DONE:
-                        full_response = event.content
                     yield event
 
-                # Record this message for future rounds
-                all_messages.append({
-                    "role": agent.role,
-                    "content": full_response,
-                    "round": round_num,
-                })
+                # Record this round in config order for future rounds
+                all_messages += [
+                    {"role": agent.role, "content": responses.get(idx, ""), "round": round_num}
+                    for idx, agent in enumerate(self.agents)
+                ]
+            else:
+                # Each agent takes their turn in this round
+                for turn_idx, agent in enumerate(speaking_order):
+                    # Build messages with appropriate context
+                    # Round 1: just the task
+                    # Round 2+: task + all previous messages (in speaking order),
+                    #           or only previous rounds' in simultaneous mode
+                    history = None
+                    if round_num > 1:
+                        history = previous_rounds if simultaneous else all_messages
+                    messages = agent.build_messages(
+                        task=task,
+                        history=history,
+                        round_num=round_num,
+                    )
+
+                    # Load the next speaker's model (and, in the final round,
+                    # the moderator's) while this agent generates
+                    next_agents = (speaking_order[turn_idx + 1:turn_idx + 2] or after_round)
+                    if round_num == debate_rounds and self.moderator not in next_agents:
+                        next_agents = next_agents + [self.moderator]
+
+                    # Stream the agent's response
+                    full_response = ""
+                    async for event in self._stream_agent_response(
+                        agent, messages, round_num, prefetch=next_agents
+                    ):
+                        if event.type == EventType.AGENT_DONE:
+                            full_response = event.content
+                        yield event
+
+                    # Record this message for future rounds
+                    all_messages.append({
+                        "role": agent.role,
+                        "content": full_response,
+                        "round": round_num,
+                    })
 
             # Signal round complete
             yield CouncilEvent(
@@ -154,5 +242,6 @@ class DebateStrategy(BaseStrategy):
                 "total_rounds": debate_rounds,
                 "total_agents": len(self.agents),
                 "total_messages": len(all_messages),
+                "model_swaps_avoided": self.scheduler.swaps_avoided,
             },
         )
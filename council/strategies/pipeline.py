@@ -19,17 +19,107 @@ This strategy is best for:
 
 Unlike debate, each agent only sees the output of the PREVIOUS agent
 (not all agents), making it a focused refinement process.
+
+Overlapped mode (``execution_mode: overlapped``):
+    Each stage normally waits for the previous one to finish. In overlapped
+    mode, once the previous stage's output reaches a stable point (a closed
+    code block or a finished paragraph), the next stage starts in the
+    background on that prefix. If the previous stage then finishes without
+    adding anything material (no new code, only a short closing tail), the
+    early start is kept and its buffered events are replayed; otherwise it
+    is discarded and restarted on a later prefix or on the full output.
+    Speculative stages never reach the UI unless they are kept. An early
+    start waits for its own turn-queue slot like any other turn, so it only
+    overlaps when the queue has room for both stages.
 """
 
 from __future__ import annotations
 
-from typing import AsyncGenerator
+import asyncio
+import time
+from typing import AsyncGenerator, Optional
 
 from council.agent import Agent
 from council.lm_studio import LMStudioClient
-from council.models import CouncilEvent, EventType
+from council.models import CouncilEvent, EventType, ExecutionMode
 from council.strategies.base import BaseStrategy
 
+# Don't start the next stage on less output than this
+MIN_SPECULATIVE_PREFIX_CHARS = 400
+
+# A speculative start is discarded once the output it didn't see exceeds
+# this share of the previous stage's full output (or contains code)
+MAX_UNSEEN_TAIL_RATIO = 0.2
+
+# Early starts attempted per stage before falling back to waiting
+MAX_SPECULATIONS_PER_STAGE = 3
+
+CODE_FENCE = "```"
+
+
+def stable_prefix(text: str) -> Optional[str]:
+    """
+    Longest prefix of ``text`` that ends at a stable point.
+
+    Stable points are the end of a closed code block and blank lines
+    outside code blocks. Returns None if that prefix is too short.
+    """
+    boundary = 0
+    position = 0
+    in_fence = False
+    for line in text.splitlines(keepends=True):
+        position += len(line)
+        if not line.endswith("\n"):
+            break  # Still being written
+        if line.lstrip().startswith(CODE_FENCE):
+            in_fence = not in_fence
+            if not in_fence:
+                boundary = position
+        elif not in_fence and not line.strip():
+            boundary = position
+    if boundary < MIN_SPECULATIVE_PREFIX_CHARS:
+        return None
+    return text[:boundary]
+
+
+def diverged(prefix: str, output: str) -> bool:
+    """Whether ``output`` adds something material beyond ``prefix``."""
+    if not output.startswith(prefix):
+        return True
+    tail = output[len(prefix):]
+    if CODE_FENCE in tail:
+        return True
+    return len(tail.strip()) > MAX_UNSEEN_TAIL_RATIO * len(output)
+
+
+class _Speculation:
+    """A pipeline stage started early; its events are buffered until kept."""
+
+    def __init__(self, stream: AsyncGenerator[CouncilEvent, None], prefix: str):
+        self.prefix = prefix
+        self.started = time.monotonic()
+        self.finished: Optional[float] = None
+        self._events: asyncio.Queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run(stream))
+
+    async def _run(self, stream: AsyncGenerator[CouncilEvent, None]):
+        try:
+            async for event in stream:
+                await self._events.put(event)
+        finally:
+            self.finished = time.monotonic()
+            await self._events.put(None)
+
+    async def cancel(self):
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+
+    async def events(self) -> AsyncGenerator[CouncilEvent, None]:
+        """Replay buffered events, then follow the stage live."""
+        while (event := await self._events.get()) is not None:
+            yield event
+        await self._task  # Surface errors from the stage
+
 
 class PipelineStrategy(BaseStrategy):
     """
@@ -54,59 +144,111 @@ class PipelineStrategy(BaseStrategy):
         all_messages: list[dict[str, str]] = []
         previous_output = ""
 
+        overlapped = self.execution_mode == ExecutionMode.OVERLAPPED
+        overlapped_seconds = 0.0
+        kept = discarded = 0
+
         # Signal single "round" for pipeline
         yield CouncilEvent(
             type=EventType.ROUND_START,
             round=1,
             content="Pipeline processing",
-            metadata={"total_agents": len(self.agents)},
+            metadata={"total_agents": len(self.agents), "overlapped": overlapped},
         )
 
-        # Process each agent in sequence
-        for step_num, agent in enumerate(self.agents, 1):
-            # Build context based on position in pipeline
-            if step_num == 1:
-                # First agent: just the task
-                strategy_context = (
-                    f"You are step {step_num} of {len(self.agents)} in a pipeline. "
-                    f"You are the first to respond. Create the initial solution."
-                )
-                messages = agent.build_messages(
-                    task=task,
-                    round_num=1,
-                    strategy_context=strategy_context,
-                )
-            else:
-                # Subsequent agents: task + previous agent's output
-                strategy_context = (
-                    f"You are step {step_num} of {len(self.agents)} in a pipeline. "
-                    f"The previous agent ({self.agents[step_num - 2].role}) "
-                    f"produced the following output. Build upon, review, or "
-                    f"refine their work according to your role.\n\n"
-                    f"Previous agent's output:\n{previous_output}"
-                )
-                messages = agent.build_messages(
-                    task=task,
-                    round_num=1,
-                    strategy_context=strategy_context,
+        # Early start of the current stage (kept from the previous one)
+        # and of the next stage (still on trial)
+        speculation: Optional[_Speculation] = None
+        next_speculation: Optional[_Speculation] = None
+
+        try:
+            # Process each agent in sequence
+            for step_num, agent in enumerate(self.agents, 1):
+                next_agent = self.agents[step_num] if step_num < len(self.agents) else None
+
+                # Load the next stage's and the moderator's models meanwhile
+                next_agents = self.agents[step_num:step_num + 1] + [self.moderator]
+
+                if speculation is not None:
+                    stream = speculation.events()
+                else:
+                    stream = self._stream_agent_response(
+                        agent,
+                        self._stage_messages(task, step_num, previous_output),
+                        round_num=step_num,
+                        prefetch=next_agents,
+                    )
+
+                # The next stage may start early if both models fit together
+                can_overlap = (
+                    overlapped
+                    and next_agent is not None
+                    and self._fit_together([agent, next_agent])
                 )
+                next_speculation = None
+                attempts = 0
+                streamed = ""
 
-            # Stream the agent's response
-            full_response = ""
-            async for event in self._stream_agent_response(
-                agent, messages, round_num=step_num
-            ):
-                if event.type == EventType.AGENT_DONE:
-                    full_response = event.content
-                yield event
-
-            # Store for next agent and moderator
-            previous_output = full_response
-            all_messages.append({
-                "role": agent.role,
-                "content": full_response,
-                "round": step_num,
-            })
+                # Stream the agent's response
+                full_response = ""
+                async for event in stream:
+                    if event.type == EventType.AGENT_DONE:
+                        full_response = event.content
+                    yield event
+
+                    if not can_overlap or event.type != EventType.AGENT_CHUNK:
+                        continue
+                    streamed += event.content
+
+                    # Drop an early start that has already missed too much
+                    if next_speculation and diverged(next_speculation.prefix, streamed):
+                        await next_speculation.cancel()
+                        next_speculation = None
+                        discarded += 1
+
+                    if next_speculation is None and attempts < MAX_SPECULATIONS_PER_STAGE \
+                            and "\n" in event.content:
+                        prefix = stable_prefix(streamed)
+                        if prefix:
+                            attempts += 1
+                            next_speculation = _Speculation(
+                                self._stream_agent_response(
+                                    next_agent,
+                                    self._stage_messages(task, step_num + 1, prefix),
+                                    round_num=step_num + 1,
+                                    prefetch=self.agents[step_num + 1:step_num + 2] + [self.moderator],
+                                    protect=[agent.model_identifier],
+                                ),
+                                prefix,
+                            )
+
+                # Keep the early start only if nothing material came after its prefix
+                finished = time.monotonic()
+                if next_speculation is not None:
+                    if diverged(next_speculation.prefix, full_response):
+                        await next_speculation.cancel()
+                        next_speculation = None
+                        discarded += 1
+                    else:
+                        kept += 1
+                        overlapped_seconds += (
+                            min(finished, next_speculation.finished or finished)
+                            - next_speculation.started
+                        )
+                speculation = next_speculation
+
+                # Store for next agent and moderator
+                previous_output = full_response
+                all_messages.append({
+                    "role": agent.role,
+                    "content": full_response,
+                    "round": step_num,
+                })
+        finally:
+            # Don't leave early starts running if the session stops
+            for pending in (speculation, next_speculation):
+                if pending is not None:
+                    await pending.cancel()
 
         yield CouncilEvent(
             type=EventType.ROUND_DONE,
@@ -149,5 +291,34 @@ class PipelineStrategy(BaseStrategy):
             metadata={
                 "total_steps": len(self.agents),
                 "total_messages": len(all_messages),
+                "overlapped_seconds": round(overlapped_seconds, 2),
+                "speculations_kept": kept,
+                "speculations_discarded": discarded,
             },
         )
+
+    def _stage_messages(
+        self, task: str, step_num: int, previous_output: str
+    ) -> list[dict[str, str]]:
+        """Build the chat messages for one pipeline stage."""
+        agent = self.agents[step_num - 1]
+        if step_num == 1:
+            # First agent: just the task
+            strategy_context = (
+                f"You are step {step_num} of {len(self.agents)} in a pipeline. "
+                f"You are the first to respond. Create the initial solution."
+            )
+        else:
+            # Subsequent agents: task + previous agent's output
+            strategy_context = (
+                f"You are step {step_num} of {len(self.agents)} in a pipeline. "
+                f"The previous agent ({self.agents[step_num - 2].role}) "
+                f"produced the following output. Build upon, review, or "
+                f"refine their work according to your role.\n\n"
+                f"Previous agent's output:\n{previous_output}"
+            )
+        return agent.build_messages(
+            task=task,
+            round_num=1,
+            strategy_context=strategy_context,
+        )
@@ -19,7 +19,9 @@ This strategy is best for:
     - Getting diverse perspectives without debate bias
 
 It's the fastest strategy since there's only one round and no
-inter-agent context building.
+inter-agent context building. With ``execution_mode: concurrent`` the
+votes are generated in parallel, so the round takes as long as the
+slowest voter rather than the sum of all of them.
 """
 
 from __future__ import annotations
@@ -28,7 +30,7 @@ from typing import AsyncGenerator
 
 from council.agent import Agent
 from council.lm_studio import LMStudioClient
-from council.models import CouncilEvent, EventType
+from council.models import CouncilEvent, EventType, StrategyType, round_runs_parallel
 from council.strategies.base import BaseStrategy
 
 
@@ -53,36 +55,50 @@ class VoteStrategy(BaseStrategy):
         Yields:
             CouncilEvent objects for real-time streaming.
         """
-        all_messages: list[dict[str, str]] = []
+        # Votes are independent, so order only matters for model reuse
+        voting_order = self.scheduler.order_round(
+            self.agents, round_num=1, upcoming=[self.moderator.model_identifier]
+        )
+
+        concurrent = len(voting_order) > 1 and round_runs_parallel(
+            StrategyType.VOTE, self.execution_mode, 1
+        )
+        if concurrent and not self._fit_together(voting_order):
+            concurrent = False
+            yield CouncilEvent(
+                type=EventType.STATUS,
+                content=(
+                    "Voter models don't fit in memory together; "
+                    "collecting votes one at a time"
+                ),
+            )
 
         yield CouncilEvent(
             type=EventType.ROUND_START,
             round=1,
             content="Collecting independent votes",
-            metadata={"total_agents": len(self.agents)},
+            metadata={
+                "total_agents": len(self.agents),
+                "speaking_order": [a.role for a in voting_order],
+                "concurrent": concurrent,
+            },
         )
 
-        # Each agent responds independently (no history shared)
-        for agent in self.agents:
-            messages = agent.build_messages(
-                task=task,
-                history=None,  # No history — independent responses
-                round_num=1,
-            )
-
-            full_response = ""
-            async for event in self._stream_agent_response(
-                agent, messages, round_num=1
-            ):
-                if event.type == EventType.AGENT_DONE:
-                    full_response = event.content
+        # Responses keyed by the voter's position in config order
+        responses: dict[int, str] = {}
+        if concurrent:
+            async for event in self._vote_concurrently(task, voting_order, responses):
+                yield event
+        else:
+            async for event in self._vote_sequentially(task, voting_order, responses):
                 yield event
 
-            all_messages.append({
-                "role": agent.role,
-                "content": full_response,
-                "round": 1,
-            })
+        # Present votes to the moderator in config order regardless of
+        # the order they were cast
+        all_messages = [
+            {"role": agent.role, "content": responses.get(idx, ""), "round": 1}
+            for idx, agent in enumerate(self.agents)
+        ]
 
         yield CouncilEvent(
             type=EventType.ROUND_DONE,
@@ -126,5 +142,47 @@ class VoteStrategy(BaseStrategy):
             metadata={
                 "total_agents": len(self.agents),
                 "total_messages": len(all_messages),
+                "model_swaps_avoided": self.scheduler.swaps_avoided,
             },
         )
+
+    async def _vote_sequentially(
+        self,
+        task: str,
+        voting_order: list[Agent],
+        responses: dict[int, str],
+    ) -> AsyncGenerator[CouncilEvent, None]:
+        """Collect votes one agent at a time, in ``voting_order``."""
+        position = {id(a): i for i, a in enumerate(self.agents)}
+        for turn_idx, agent in enumerate(voting_order):
+            messages = agent.build_messages(
+                task=task,
+                history=None,  # No history — independent responses
+                round_num=1,
+            )
+
+            # Load the next voter's and the moderator's models meanwhile
+            next_agents = voting_order[turn_idx + 1:turn_idx + 2] + [self.moderator]
+
+            async for event in self._stream_agent_response(
+                agent, messages, round_num=1, prefetch=next_agents
+            ):
+                if event.type == EventType.AGENT_DONE:
+                    responses[position[id(agent)]] = event.content
+                yield event
+
+    async def _vote_concurrently(
+        self,
+        task: str,
+        voting_order: list[Agent],
+        responses: dict[int, str],
+    ) -> AsyncGenerator[CouncilEvent, None]:
+        """Collect all votes in parallel, then hand over to the moderator."""
+        turns = [
+            (agent, agent.build_messages(task=task, history=None, round_num=1))
+            for agent in voting_order
+        ]
+        async for event in self._run_parallel_turns(
+            turns, round_num=1, responses=responses, prefetch=[self.moderator]
+        ):
+            yield event
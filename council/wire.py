@@ -0,0 +1,234 @@
+"""
+Compact Wire Protocol
+=====================
+
+Binary encoding of council events for ``/ws/council`` clients that ask for
+it with the ``council.compact.v1`` WebSocket subprotocol. The default JSON
+protocol repeats every key (``type``, ``agent``, ``round``, ...) in every
+event, which for token-sized chunks costs more bytes than the text itself.
+
+Every server message is one binary frame:
+
+    EVENT   | code u8 | flags u8 | session u16 | agent u16 | round u16 |
+            | [seq u32] | [content: len u32 + bytes] | [metadata: len u32 + JSON] |
+    DEFINE  | 0 u8 | kind u8 | ref u16 | UTF-8 name |
+
+    - ``code`` is the event type's number (see ``EVENT_CODES``; 0 = DEFINE)
+    - ``session`` and ``agent`` are references to names sent once in a
+      DEFINE frame just before their first use (0 = empty). Each table
+      holds at most ``MAX_REFS`` names; once it is full, the least
+      recently used name's ref is reused, and a new DEFINE for a ref
+      replaces the name it stood for
+    - ``flags`` mark which optional parts follow and whether the content
+      is zlib-compressed (done for long texts such as ``agent_done``)
+    - ``seq`` is the event's number within its session, used to resume
+      after a reconnect (absent for events not tied to a session)
+    - All integers are big-endian; timestamps are not sent
+
+Client messages stay JSON text. For transport-level compression, also
+offer ``permessage-deflate`` when connecting (the server accepts it).
+
+Usage:
+    >>> encoder = CompactEncoder()
+    >>> frames = encoder.encode(event.to_dict(), session_id="run-1")
+    >>> decoder = CompactDecoder()
+    >>> events = [e for f in frames if (e := decoder.decode(f))]
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+import zlib
+from collections import OrderedDict
+from typing import Any, Optional
+
+from council.models import EventType
+
+SUBPROTOCOL = "council.compact.v1"
+
+# Stable numbers for event types; never renumber, only append
+EVENT_CODES: dict[EventType, int] = {
+    EventType.ROUND_START: 1,
+    EventType.ROUND_DONE: 2,
+    EventType.AGENT_START: 3,
+    EventType.AGENT_CHUNK: 4,
+    EventType.AGENT_DONE: 5,
+    EventType.MODERATOR_START: 6,
+    EventType.MODERATOR_CHUNK: 7,
+    EventType.MODERATOR_DONE: 8,
+    EventType.COUNCIL_DONE: 9,
+    EventType.ERROR: 10,
+    EventType.MODEL_LOADING: 11,
+    EventType.MODEL_LOADED: 12,
+    EventType.MODEL_UNLOADING: 13,
+    EventType.MODEL_UNLOADED: 14,
+    EventType.STATUS: 15,
+}
+EVENT_TYPES = {code: event_type for event_type, code in EVENT_CODES.items()}
+
+DEFINE = 0
+DEFINE_SESSION = 0
+DEFINE_AGENT = 1
+
+FLAG_CONTENT = 0x01
+FLAG_METADATA = 0x02
+FLAG_COMPRESSED = 0x04
+FLAG_SEQ = 0x08
+
+# Names per reference table (refs are u16 and 0 means "empty")
+MAX_REFS = 0xFFFF
+
+# Content at least this long is zlib-compressed (if that makes it smaller)
+COMPRESS_MIN_BYTES = 512
+
+_EVENT_HEADER = struct.Struct("!BBHHH")
+_DEFINE_HEADER = struct.Struct("!BBH")
+_LENGTH = struct.Struct("!I")
+_SEQ = struct.Struct("!I")
+
+MAX_ROUND = 0xFFFF
+MAX_SEQ = 0xFFFFFFFF
+
+
+class CompactEncoder:
+    """
+    Encodes events for one connection, interning session IDs and agent names.
+
+    Attributes:
+        max_refs: Names kept per kind before refs are reused
+        refs: Names currently defined, per kind (DEFINE_SESSION/DEFINE_AGENT),
+              least recently used first
+    """
+
+    def __init__(self, max_refs: int = MAX_REFS):
+        self.max_refs = max_refs
+        self.refs: dict[int, OrderedDict[str, int]] = {
+            DEFINE_SESSION: OrderedDict(),
+            DEFINE_AGENT: OrderedDict(),
+        }
+
+    def _ref(self, kind: int, name: str, frames: list[bytes]) -> int:
+        if not name:
+            return 0
+        refs = self.refs[kind]
+        ref = refs.get(name)
+        if ref is not None:
+            refs.move_to_end(name)
+            return ref
+        if len(refs) < self.max_refs:
+            ref = len(refs) + 1
+        else:
+            # Table full: take over the least recently used name's ref; the
+            # DEFINE below tells the client what it means now
+            _, ref = refs.popitem(last=False)
+        refs[name] = ref
+        frames.append(_DEFINE_HEADER.pack(DEFINE, kind, ref) + name.encode())
+        return ref
+
+    def encode(self, event: dict[str, Any], session_id: str = "") -> list[bytes]:
+        """
+        Encode one event.
+
+        Args:
+            event: The event as a dict (``CouncilEvent.to_dict()`` shape)
+            session_id: Session the event belongs to ("" = none)
+
+        Returns:
+            Frames to send in order: DEFINE frames for new names, then the
+            event itself.
+
+        Raises:
+            ValueError: If ``round`` or ``seq`` doesn't fit its field. Nothing
+                        is interned in that case, so the connection can go on.
+        """
+        round_num = event.get("round", 0)
+        seq = event.get("seq")
+        if not 0 <= round_num <= MAX_ROUND:
+            raise ValueError(f"round {round_num} doesn't fit the compact protocol (0-{MAX_ROUND})")
+        if seq is not None and not 0 <= seq <= MAX_SEQ:
+            raise ValueError(f"seq {seq} doesn't fit the compact protocol (0-{MAX_SEQ})")
+
+        frames: list[bytes] = []
+        session_ref = self._ref(DEFINE_SESSION, session_id, frames)
+        agent_ref = self._ref(DEFINE_AGENT, event.get("agent", ""), frames)
+
+        flags = 0
+        body = b""
+        if seq is not None:
+            flags |= FLAG_SEQ
+            body += _SEQ.pack(seq)
+        content = event.get("content", "")
+        if content:
+            data = content.encode()
+            if len(data) >= COMPRESS_MIN_BYTES:
+                compressed = zlib.compress(data)
+                if len(compressed) < len(data):
+                    data = compressed
+                    flags |= FLAG_COMPRESSED
+            flags |= FLAG_CONTENT
+            body += _LENGTH.pack(len(data)) + data
+        metadata = event.get("metadata")
+        if metadata:
+            data = json.dumps(metadata, separators=(",", ":")).encode()
+            flags |= FLAG_METADATA
+            body += _LENGTH.pack(len(data)) + data
+
+        code = EVENT_CODES[EventType(event["type"])]
+        frames.append(
+            _EVENT_HEADER.pack(code, flags, session_ref, agent_ref, round_num) + body
+        )
+        return frames
+
+
+class CompactDecoder:
+    """Decodes one connection's frames back into event dicts (for clients and tests)."""
+
+    def __init__(self):
+        self.names: dict[int, dict[int, str]] = {DEFINE_SESSION: {}, DEFINE_AGENT: {}}
+
+    def decode(self, frame: bytes) -> Optional[dict[str, Any]]:
+        """
+        Decode one frame.
+
+        Returns:
+            The event (``type``, ``session_id``, ``agent``, ``round``,
+            ``content``, ``metadata`` and ``seq`` if present), or None for
+            a DEFINE frame.
+        """
+        if frame[0] == DEFINE:
+            _, kind, ref = _DEFINE_HEADER.unpack_from(frame)
+            self.names[kind][ref] = frame[_DEFINE_HEADER.size:].decode()
+            return None
+
+        code, flags, session_ref, agent_ref, round_num = _EVENT_HEADER.unpack_from(frame)
+        offset = _EVENT_HEADER.size
+        content, metadata = "", {}
+        seq = None
+        if flags & FLAG_SEQ:
+            (seq,) = _SEQ.unpack_from(frame, offset)
+            offset += _SEQ.size
+        if flags & FLAG_CONTENT:
+            (length,) = _LENGTH.unpack_from(frame, offset)
+            offset += _LENGTH.size
+            data = frame[offset:offset + length]
+            offset += length
+            if flags & FLAG_COMPRESSED:
+                data = zlib.decompress(data)
+            content = data.decode()
+        if flags & FLAG_METADATA:
+            (length,) = _LENGTH.unpack_from(frame, offset)
+            offset += _LENGTH.size
+            metadata = json.loads(frame[offset:offset + length])
+
+        event = {
+            "type": EVENT_TYPES[code].value,
+            "session_id": self.names[DEFINE_SESSION].get(session_ref, ""),
+            "agent": self.names[DEFINE_AGENT].get(agent_ref, ""),
+            "round": round_num,
+            "content": content,
+            "metadata": metadata,
+        }
+        if seq is not None:
+            event["seq"] = seq
+        return event
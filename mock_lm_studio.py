@@ -0,0 +1,168 @@
+"""
+Mock LM Studio Server
+=====================
+
+A tiny stand-in for LM Studio's local server, for trying out multi-server
+pools (``backends`` in config.yaml), load balancing and failover without
+real models or GPUs.
+
+It implements the endpoints Agent Council uses:
+    - ``GET  /v1/models`` and ``GET /api/v0/models`` (with loaded state)
+    - ``POST /v1/models/load`` and ``POST /v1/models/unload``
+    - ``POST /v1/chat/completions`` (streaming and non-streaming)
+
+Responses are canned text generated at a configurable token rate; any
+model that gets a chat request is loaded just in time, like LM Studio does.
+
+Start two mock servers:
+    $ python mock_lm_studio.py --port 1241 --name box-a
+    $ python mock_lm_studio.py --port 1242 --name box-b --token-delay 0.05
+
+Then list them under ``backends.servers`` in config.yaml and start the
+Agent Council server. Stop one mock server to watch the pool drop it, and
+start it again to watch it come back. Give one server a long
+``--first-token-delay`` to watch requests to it get hedged on the other.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any, AsyncGenerator
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+
+def create_app(
+    name: str = "mock",
+    models: list[str] | None = None,
+    token_delay: float = 0.02,
+    load_delay: float = 0.5,
+    first_token_delay: float = 0.0,
+) -> FastAPI:
+    """
+    Build the mock server app.
+
+    Args:
+        name: Server name, included in every response
+        models: Model identifiers to advertise (empty = accept any model)
+        token_delay: Seconds between streamed tokens
+        load_delay: Seconds a model load takes
+        first_token_delay: Extra seconds before the first streamed token
+
+    Returns:
+        The FastAPI app.
+    """
+    app = FastAPI(title=f"Mock LM Studio ({name})")
+    advertised = list(models or [])
+    loaded: set[str] = set()
+
+    def known_models() -> list[str]:
+        return sorted(set(advertised) | loaded)
+
+    @app.get("/v1/models")
+    async def list_models():
+        return {"object": "list", "data": [{"id": m, "object": "model"} for m in known_models()]}
+
+    @app.get("/api/v0/models")
+    async def list_models_with_state():
+        return {
+            "object": "list",
+            "data": [
+                {"id": m, "object": "model", "state": "loaded" if m in loaded else "not-loaded"}
+                for m in known_models()
+            ],
+        }
+
+    @app.post("/v1/models/load")
+    async def load_model(request: Request):
+        model = (await request.json()).get("model", "")
+        if model not in loaded:
+            await asyncio.sleep(load_delay)
+            loaded.add(model)
+        return {"model": model, "status": "loaded"}
+
+    @app.post("/v1/models/unload")
+    async def unload_model(request: Request):
+        model = (await request.json()).get("model", "")
+        loaded.discard(model)
+        return {"model": model, "status": "unloaded"}
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body: dict[str, Any] = await request.json()
+        model = body.get("model", "")
+        if model not in loaded:
+            await asyncio.sleep(load_delay)
+            loaded.add(model)
+
+        max_tokens = int(body.get("max_tokens") or 64)
+        words = (f"[{name}] This is a mock answer from {model}. " * 8).split(" ")
+        tokens = [w + " " for w in words if w][: max(1, min(max_tokens, 48))]
+        created = int(time.time())
+
+        if not body.get("stream"):
+            await asyncio.sleep(token_delay * len(tokens))
+            return JSONResponse({
+                "id": "mock-completion",
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": "".join(tokens)},
+                    "finish_reason": "stop",
+                }],
+                "usage": {
+                    "prompt_tokens": 0,
+                    "completion_tokens": len(tokens),
+                    "total_tokens": len(tokens),
+                },
+            })
+
+        async def stream() -> AsyncGenerator[str, None]:
+            await asyncio.sleep(first_token_delay)
+            for token in tokens:
+                await asyncio.sleep(token_delay)
+                chunk = {
+                    "id": "mock-completion",
+                    "object": "chat.completion.chunk",
+                    "created": created,
+                    "model": model,
+                    "choices": [{"index": 0, "delta": {"content": token}, "finish_reason": None}],
+                }
+                yield f"data: {json.dumps(chunk)}\n\n"
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(stream(), media_type="text/event-stream")
+
+    return app
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Mock LM Studio server for testing")
+    parser.add_argument("--port", type=int, default=1241)
+    parser.add_argument("--name", default="mock")
+    parser.add_argument("--models", default="", help="Comma-separated model identifiers to advertise")
+    parser.add_argument("--token-delay", type=float, default=0.02)
+    parser.add_argument("--load-delay", type=float, default=0.5)
+    parser.add_argument("--first-token-delay", type=float, default=0.0)
+    args = parser.parse_args()
+
+    uvicorn.run(
+        create_app(
+            name=args.name,
+            models=[m for m in args.models.split(",") if m],
+            token_delay=args.token_delay,
+            load_delay=args.load_delay,
+            first_token_delay=args.first_token_delay,
+        ),
+        host="127.0.0.1",
+        port=args.port,
+        log_level="warning",
+    )
@@ -24,18 +24,25 @@ import asyncio
 import json
 import logging
 import os
+import secrets
+import time
+import uuid
+from collections import deque
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, Awaitable, Callable, Literal, Optional
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, HTMLResponse
+from fastapi.responses import FileResponse, HTMLResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from council.config import load_config
+from council.delivery import deliver
 from council.engine import CouncilEngine
+from council.models import CouncilEvent, DeliveryMode
+from council.wire import SUBPROTOCOL as COMPACT_SUBPROTOCOL, CompactEncoder
 
 # =============================================================================
 # Logging Configuration
@@ -60,6 +67,367 @@ config = load_config(
 # Create the council engine
 engine = CouncilEngine(config)
 
+class _EventSender:
+    """Writes events to one council WebSocket in its negotiated protocol."""
+
+    def __init__(self, websocket: WebSocket, compact: bool):
+        self.websocket = websocket
+        # Sessions (and engine broadcasts) send concurrently; keep frames
+        # whole and DEFINE frames ahead of the events that use them
+        self.lock = asyncio.Lock()
+        self.encoder = CompactEncoder() if compact else None
+
+    async def send(self, payload: dict[str, Any], session_id: str = ""):
+        async with self.lock:
+            if self.encoder is None:
+                await self.websocket.send_json({**payload, "session_id": session_id})
+                return
+            try:
+                frames = self.encoder.encode(payload, session_id)
+            except ValueError as e:
+                # Drop the one event rather than the connection
+                logger.warning(f"Cannot send {payload.get('type')} event in compact form: {e}")
+                return
+            for frame in frames:
+                await self.websocket.send_bytes(frame)
+
+
+# Connected council WebSockets, for events not tied to a session
+connected_websockets: dict[WebSocket, _EventSender] = {}
+
+
+def broadcast_event(event: CouncilEvent):
+    """Send an engine-level event (e.g., a model unload) to every client."""
+    payload = event.to_dict()
+    for sender in list(connected_websockets.values()):
+        asyncio.create_task(_send_quietly(sender, payload))
+
+
+async def _send_quietly(sender: _EventSender, payload: dict[str, Any]):
+    try:
+        await sender.send(payload)
+    except Exception:
+        connected_websockets.pop(sender.websocket, None)
+
+
+engine.client.residency.add_listener(broadcast_event)
+
+
+# =============================================================================
+# Session Admission
+# =============================================================================
+
+
+class SessionRejected(Exception):
+    """Raised when a session can't be admitted because the queue is full."""
+
+
+class _SessionWaiter:
+    """A session waiting for admission; receives queue positions, then None."""
+
+    __slots__ = ("updates", "enqueued_at")
+
+    def __init__(self):
+        self.updates: asyncio.Queue[Optional[int]] = asyncio.Queue()
+        self.enqueued_at = time.monotonic()
+
+
+class AdmissionController:
+    """
+    Limits concurrent council sessions with a bounded FIFO wait queue.
+
+    Attributes:
+        max_sessions: Sessions allowed to run at once (0 = unlimited)
+        max_queue: Sessions allowed to wait for a free slot
+    """
+
+    def __init__(self, max_sessions: int, max_queue: int):
+        self.max_sessions = max_sessions
+        self.max_queue = max_queue
+        self._active = 0
+        self._waiting: deque[_SessionWaiter] = deque()
+
+        # Metrics
+        self._admitted = 0
+        self._rejected = 0
+        self._queued = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._recent_waits: deque[float] = deque(maxlen=200)
+
+    def _has_capacity(self) -> bool:
+        return self.max_sessions <= 0 or self._active < self.max_sessions
+
+    def _announce_positions(self):
+        for position, waiter in enumerate(self._waiting, 1):
+            waiter.updates.put_nowait(position)
+
+    def _release(self):
+        self._active -= 1
+        while self._waiting and self._has_capacity():
+            waiter = self._waiting.popleft()
+            self._active += 1
+            waiter.updates.put_nowait(None)
+        self._announce_positions()
+
+    @asynccontextmanager
+    async def admit(self, on_queued: Callable[[int], Awaitable[None]]):
+        """
+        Hold a session slot, waiting in the queue if none is free.
+
+        Args:
+            on_queued: Called with the session's 1-based queue position
+                       whenever it changes while waiting
+
+        Raises:
+            SessionRejected: If the wait queue is full
+        """
+        waited = 0.0
+        if self._has_capacity() and not self._waiting:
+            self._active += 1
+        elif len(self._waiting) >= self.max_queue:
+            self._rejected += 1
+            raise SessionRejected(
+                f"Server busy: {self._active} session(s) running and "
+                f"{len(self._waiting)} waiting. Please try again shortly."
+            )
+        else:
+            waiter = _SessionWaiter()
+            self._waiting.append(waiter)
+            self._queued += 1
+            waiter.updates.put_nowait(len(self._waiting))
+            try:
+                while (position := await waiter.updates.get()) is not None:
+                    await on_queued(position)
+            except BaseException:
+                if waiter in self._waiting:
+                    self._waiting.remove(waiter)
+                    self._announce_positions()
+                else:
+                    # Admitted just as we gave up: pass the slot on
+                    self._release()
+                raise
+            waited = time.monotonic() - waiter.enqueued_at
+
+        self._admitted += 1
+        self._total_wait += waited
+        self._max_wait = max(self._max_wait, waited)
+        self._recent_waits.append(waited)
+        try:
+            yield
+        finally:
+            self._release()
+
+    def stats(self) -> dict[str, Any]:
+        """Running and waiting sessions, rejections and queue times."""
+        recent = sorted(self._recent_waits)
+        p95 = recent[int(0.95 * (len(recent) - 1))] if recent else 0.0
+        return {
+            "active_sessions": self._active,
+            "queue_depth": len(self._waiting),
+            "max_concurrent_sessions": self.max_sessions,
+            "max_queue": self.max_queue,
+            "admitted": self._admitted,
+            "queued": self._queued,
+            "rejected": self._rejected,
+            "wait_seconds": {
+                "avg": round(self._total_wait / self._admitted, 3)
+                if self._admitted else 0.0,
+                "p95": round(p95, 3),
+                "max": round(self._max_wait, 3),
+            },
+        }
+
+
+admission = AdmissionController(
+    config.admission.max_concurrent_sessions,
+    config.admission.max_queue,
+)
+
+
+# =============================================================================
+# Resumable Sessions
+# =============================================================================
+
+
+class _SessionChannel:
+    """
+    The event stream of one ``/ws/council`` session, independent of sockets.
+
+    Events are numbered (``seq``), kept in a ring buffer and sent to the
+    connection the session is attached to, if any. While detached, the
+    session keeps running and its events are only buffered; a client can
+    re-attach with the last ``seq`` it saw and get the rest replayed.
+
+    Attributes:
+        session_id: The session's ID
+        resume_token: Secret a client must present to resume the session
+        task: The task running the session
+        sender: Connection the events go to (None while detached)
+        last_seq: Number of the latest event
+        buffer: The most recent events, oldest first
+    """
+
+    def __init__(self, registry: "SessionRegistry", session_id: str):
+        self.registry = registry
+        self.session_id = session_id
+        # Session IDs are chosen by clients and can be guessed; the token
+        # is only ever sent to the connection that started the session
+        self.resume_token = secrets.token_urlsafe(24)
+        self.task: Optional[asyncio.Task] = None
+        self.sender: Optional[_EventSender] = None
+        self.last_seq = 0
+        self.buffer: deque[dict[str, Any]] = deque(maxlen=registry.buffer_events)
+        # Keeps replays and live sends in order
+        self._lock = asyncio.Lock()
+        self._expiry: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def running(self) -> bool:
+        return self.task is not None and not self.task.done()
+
+    async def publish(self, payload: dict[str, Any]):
+        """Number an event, buffer it and send it to the attached client."""
+        async with self._lock:
+            self.last_seq += 1
+            payload = {**payload, "seq": self.last_seq}
+            self.buffer.append(payload)
+            sender = self.sender
+            if sender is None:
+                return
+            try:
+                await sender.send(payload, self.session_id)
+            except Exception:
+                # The socket just went away: keep running until the client
+                # resumes or the grace period ends
+                self.detach(sender)
+
+    async def attach(self, sender: _EventSender, after_seq: int) -> tuple[int, int]:
+        """
+        Send the session's events to a connection from ``after_seq`` on.
+
+        Replaces any previous connection (e.g., one whose close hasn't been
+        noticed yet).
+
+        Returns:
+            How many events were replayed, and how many the client missed
+            that have already left the buffer.
+        """
+        async with self._lock:
+            self._cancel_expiry()
+            oldest = self.buffer[0]["seq"] if self.buffer else self.last_seq + 1
+            lost = max(0, min(oldest, self.last_seq + 1) - after_seq - 1)
+            missed = [payload for payload in self.buffer if payload["seq"] > after_seq]
+            await sender.send({
+                "type": "status",
+                "agent": "",
+                "round": 0,
+                "content": f"Resumed session '{self.session_id}'",
+                "timestamp": "",
+                "metadata": {"resumed": True, "replayed": len(missed), "lost": lost},
+            }, self.session_id)
+            for payload in missed:
+                await sender.send(payload, self.session_id)
+            self.sender = sender
+            if not self.running:
+                self._schedule_expiry()
+        return len(missed), lost
+
+    def detach(self, sender: _EventSender):
+        """Stop sending to a connection; the session waits to be resumed."""
+        if self.sender is not sender:
+            return
+        self.sender = None
+        if self.running:
+            logger.info(
+                f"Session '{self.session_id}' detached; resumable for "
+                f"{self.registry.grace_seconds:g}s"
+            )
+        self._schedule_expiry()
+
+    def finished(self, task: asyncio.Task):
+        """Done callback of the session task."""
+        if not task.cancelled() and task.exception():
+            logger.info(f"Session '{self.session_id}' ended early: {task.exception()!r}")
+        # Keep the tail around briefly for clients that dropped at the end
+        self._schedule_expiry()
+
+    def _schedule_expiry(self):
+        self._cancel_expiry()
+        self._expiry = asyncio.get_running_loop().call_later(
+            self.registry.grace_seconds, self._expire
+        )
+
+    def _cancel_expiry(self):
+        if self._expiry is not None:
+            self._expiry.cancel()
+            self._expiry = None
+
+    def _expire(self):
+        self._expiry = None
+        if self.sender is not None and self.running:
+            return
+        if self.running:
+            # Free the backend: cancelling closes the open requests
+            logger.info(f"Cancelling session '{self.session_id}': not resumed in time")
+            self.task.cancel()
+        self.registry.sessions.pop(self.session_id, None)
+
+
+class SessionRegistry:
+    """
+    WebSocket sessions by ID, kept for resuming after a reconnect.
+
+    Attributes:
+        buffer_events: Events kept per session for replay
+        grace_seconds: How long a detached or finished session stays resumable
+        sessions: Live and recently finished sessions, by ID
+    """
+
+    def __init__(self, buffer_events: int, grace_seconds: float):
+        self.buffer_events = buffer_events
+        self.grace_seconds = grace_seconds
+        self.sessions: dict[str, _SessionChannel] = {}
+
+    def open(self, session_id: str) -> Optional[_SessionChannel]:
+        """Register a new session (None if the ID is already in use)."""
+        if session_id in self.sessions:
+            return None
+        channel = self.sessions[session_id] = _SessionChannel(self, session_id)
+        return channel
+
+    def get(self, session_id: str) -> Optional[_SessionChannel]:
+        return self.sessions.get(session_id)
+
+    def claim(self, session_id: str, resume_token: str) -> Optional[_SessionChannel]:
+        """A session to resume (None if unknown, expired or the token is wrong)."""
+        channel = self.sessions.get(session_id)
+        if channel is None or not secrets.compare_digest(
+            channel.resume_token.encode(), resume_token.encode()
+        ):
+            return None
+        return channel
+
+    def stats(self) -> dict[str, Any]:
+        """Resumable sessions and how many of them have no client."""
+        channels = list(self.sessions.values())
+        return {
+            "sessions": len(channels),
+            "running": sum(channel.running for channel in channels),
+            "detached": sum(
+                channel.running and channel.sender is None for channel in channels
+            ),
+            "buffered_events": sum(len(channel.buffer) for channel in channels),
+            "buffer_events": self.buffer_events,
+            "grace_seconds": self.grace_seconds,
+        }
+
+
+session_registry = SessionRegistry(
+    config.resume.buffer_events,
+    config.resume.grace_seconds,
+)
+
 
 # Lifespan context manager (modern replacement for on_event)
 @asynccontextmanager
@@ -79,9 +447,31 @@ async def lifespan(app: FastAPI):
             "on port 1234 (Developer tab → Start Server)."
         )
 
+    # Flag presets whose models can't co-reside before anyone runs them
+    engine.planner.log_all()
+
+    background_tasks = []
+
+    # Warm the default council in the background so startup isn't blocked
+    if config.warmup.enabled:
+        background_tasks.append(asyncio.create_task(engine.warmup()))
+
+    # Unload models nobody has used for a while
+    background_tasks.append(asyncio.create_task(engine.run_idle_reaper()))
+
+    # Drop and re-add pooled servers as they fail and recover
+    background_tasks.append(asyncio.create_task(engine.run_backend_health_checks()))
+
     yield  # App runs here
 
     # --- Shutdown ---
+    for task in background_tasks:
+        if not task.done():
+            task.cancel()
+    # Stop sessions still running or waiting to be resumed
+    for channel in list(session_registry.sessions.values()):
+        if channel.running:
+            channel.task.cancel()
     await engine.close()
     logger.info("Agent Council server shut down.")
 
@@ -114,7 +504,6 @@ if static_dir.exists():
 
 # Middleware to disable caching on static files during development
 from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
 
 class NoCacheMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next):
@@ -309,7 +698,8 @@ async def health_check():
     Health check endpoint.
 
     Returns:
-        Server status, LM Studio connectivity, and real system metrics.
+        Server status, LM Studio connectivity, startup warmup progress,
+        and real system metrics.
     """
     import psutil
 
@@ -342,6 +732,7 @@ async def health_check():
     return {
         "status": "ok",
         "lm_studio": lm_status,
+        "warmup": engine.warmup_status(),
         "system": {
             "cpu":  round(cpu_pct, 1),
             "ram":  round(ram_pct, 1),
@@ -362,6 +753,26 @@ async def list_councils():
     return await engine.get_available_councils()
 
 
+@app.get("/api/councils/{council_key}/plan")
+async def plan_council(council_key: str, warm: bool = False):
+    """
+    Predict what one session of a council will cost on this host.
+
+    Args:
+        council_key: The council preset to plan.
+        warm: Plan from the currently loaded models instead of a cold start.
+
+    Returns:
+        Peak resident memory, expected loads and swaps, estimated
+        wall-clock seconds, a per-model breakdown, and a status of
+        ``ok``, ``thrashing`` or ``infeasible`` with warnings.
+    """
+    try:
+        return engine.plan_council(council_key, warm=warm)
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=str(e).strip("'\""))
+
+
 @app.get("/api/models")
 async def list_models():
     """
@@ -379,13 +790,97 @@ async def list_lm_studio_models():
     List models currently available in LM Studio.
 
     This queries LM Studio directly to see what models are downloaded
-    and/or loaded.
+    and which of them are currently loaded.
 
     Returns:
-        List of model info from LM Studio.
+        List of model info from LM Studio, plus the loaded subset.
     """
     models = await engine.client.list_models()
-    return {"models": models}
+    loaded = await engine.client.get_loaded_models()
+    return {"models": models, "loaded": [m.get("id", "") for m in loaded]}
+
+
+@app.get("/api/models/residency")
+async def model_residency():
+    """
+    Show which models the residency manager believes are loaded.
+
+    Returns:
+        Memory budget, resident footprint, and resident models (LRU first).
+    """
+    return engine.get_residency()
+
+
+@app.get("/api/models/profile")
+async def model_profile():
+    """
+    Show measured per-model performance.
+
+    Returns:
+        For each model: load time, time-to-first-token and tokens/sec
+        aggregates (EWMA, p50, p95, sample count).
+    """
+    return {"models": engine.get_model_profile()}
+
+
+@app.get("/api/scheduler")
+async def scheduler_stats():
+    """
+    Cross-session turn queue metrics.
+
+    Returns:
+        Queue depth, wait times (avg/p95/max), model swaps and how many
+        turns were granted by the fairness bound rather than model affinity.
+    """
+    return engine.get_scheduler_stats()
+
+
+@app.get("/api/backends")
+async def list_backends():
+    """
+    Inference servers council work is routed to.
+
+    Returns:
+        Per server: name, URL, health, served and loaded models, and
+        request queue length.
+    """
+    return {"backends": engine.get_backends()}
+
+
+@app.get("/api/admission")
+async def admission_stats():
+    """
+    Council session admission metrics.
+
+    Returns:
+        Running and queued sessions, admitted/queued/rejected counts, and
+        time spent waiting for a slot (avg/p95/max).
+    """
+    return admission.stats()
+
+
+@app.get("/api/sessions")
+async def resumable_sessions():
+    """
+    Resumable WebSocket sessions.
+
+    Returns:
+        Sessions in the registry (running and detached), events buffered
+        for replay, and the buffer size and grace period.
+    """
+    return session_registry.stats()
+
+
+@app.get("/api/limits")
+async def request_limits():
+    """
+    Chat-completion concurrency limits and queue metrics.
+
+    Returns:
+        For the backend and each model: limit, in-flight and waiting
+        requests, and queue times (avg/p95/max).
+    """
+    return engine.get_request_limits()
 
 
 class ModelLoadRequest(BaseModel):
@@ -453,6 +948,23 @@ async def get_config():
     }
 
 
+def _session_problem(council_key: str, task: str) -> Optional[tuple[int, str]]:
+    """
+    Check a session request before running it.
+
+    Returns:
+        (HTTP status, message) describing what is wrong, or None if the
+        session can run.
+    """
+    if not task:
+        return 400, "Task cannot be empty."
+    if council_key not in config.councils:
+        return 404, f"Council '{council_key}' not found. Available: {list(config.councils.keys())}"
+    if not config.councils[council_key].moderator:
+        return 400, f"Council '{council_key}' has no moderator configured."
+    return None
+
+
 # =============================================================================
 # WebSocket Endpoint — Real-Time Council Sessions
 # =============================================================================
@@ -508,29 +1020,122 @@ async def council_websocket(websocket: WebSocket):
 
 async def _run_council_websocket_stable(websocket: WebSocket):
     """
-    Stable council endpoint.
-
-    This endpoint avoids token streaming and sends only full responses from each
-    agent/moderator turn. It is intentionally simpler and more reliable.
+    Council session endpoint.
+
+    Sessions run through ``CouncilEngine.run``. The ``delivery`` field of a
+    task message picks how agent text arrives: ``full`` sends only whole
+    turns (``agent_done``/``moderator_done``), ``stream`` sends every token
+    chunk, and ``coalesced`` merges consecutive chunks of a turn for up to
+    ``coalesce_ms`` or ``coalesce_bytes`` (query parameters, defaulting to
+    ``defaults.coalesce_interval_ms``/``coalesce_max_bytes``). Delivery
+    defaults to ``defaults.delivery``.
+
+    Several sessions can run at once over one connection. Client messages:
+        - ``{"type": "task", "session_id": "...", "council": ..., "task": ...,
+          "delivery": ...}`` starts a session (``session_id`` and
+          ``delivery`` are optional; an ID is assigned if omitted)
+        - ``{"type": "cancel", "session_id": "..."}`` cancels a session
+        - ``{"type": "sessions"}`` lists the connection's running sessions
+        - ``{"type": "resume", "session_id": "...", "resume_token": "...",
+          "last_seq": n}`` moves a session to this connection and replays
+          its events after ``n``; the token comes in the ``status`` event
+          that acknowledges the task
+
+    Every event carries the ``session_id`` it belongs to (empty for errors
+    not tied to a session) and, for session events, a per-session sequence
+    number ``seq``. Clients that request the ``council.compact.v1``
+    subprotocol receive events as compact binary frames instead of JSON
+    (see ``council.wire``). Sessions outlive their connection: if the client
+    goes away, a session keeps running (its events buffered) for
+    ``resume.grace_seconds`` so a reconnecting client can resume it, and is
+    cancelled after that, closing its in-flight completion requests to free
+    the backend.
     """
-    await websocket.accept()
-    logger.info("WebSocket client connected")
-
-    async def send_event(
+    # Coalescing can be tuned per connection, e.g. ?coalesce_ms=50
+    try:
+        flush_interval = float(
+            websocket.query_params.get("coalesce_ms", config.defaults.coalesce_interval_ms)
+        ) / 1000
+        coalesce_max_bytes = int(
+            websocket.query_params.get("coalesce_bytes", config.defaults.coalesce_max_bytes)
+        )
+    except ValueError:
+        await websocket.close(code=1008, reason="coalesce_ms and coalesce_bytes must be numbers")
+        return
+
+    # Clients that offer the compact subprotocol get binary frames
+    compact = COMPACT_SUBPROTOCOL in websocket.scope.get("subprotocols", [])
+    await websocket.accept(subprotocol=COMPACT_SUBPROTOCOL if compact else None)
+    sender = _EventSender(websocket, compact)
+    connected_websockets[websocket] = sender
+    logger.info(f"WebSocket client connected ({'compact' if compact else 'JSON'} protocol)")
+
+    def event_payload(
         event_type: str,
         content: str = "",
         agent: str = "",
         round_num: int = 0,
         metadata: dict[str, Any] | None = None,
-    ):
-        await websocket.send_json({
+    ) -> dict[str, Any]:
+        return {
             "type": event_type,
             "agent": agent,
             "round": round_num,
             "content": content,
             "timestamp": "",
             "metadata": metadata or {},
-        })
+        }
+
+    async def send_event(
+        event_type: str,
+        content: str = "",
+        agent: str = "",
+        round_num: int = 0,
+        metadata: dict[str, Any] | None = None,
+        session_id: str = "",
+    ):
+        await sender.send(
+            event_payload(event_type, content, agent, round_num, metadata), session_id
+        )
+
+    # Sessions started on or resumed by this connection, by session ID
+    sessions: dict[str, _SessionChannel] = {}
+
+    async def run_session(
+        channel: _SessionChannel,
+        council_key: str,
+        task: str,
+        temperature: float,
+        max_tokens: int,
+        debate_rounds: int,
+        model_overrides: dict[str, str],
+        delivery: DeliveryMode,
+    ):
+        async def report_queue_position(position: int):
+            await channel.publish(event_payload(
+                "status",
+                f"Waiting for a free session slot (position {position} in queue)",
+                metadata={"queue_position": position},
+            ))
+
+        try:
+            async with admission.admit(report_queue_position):
+                events = engine.run(
+                    council_key,
+                    task,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    debate_rounds=debate_rounds,
+                    model_overrides=model_overrides or None,
+                )
+                async for event in deliver(
+                    events, delivery, flush_interval, coalesce_max_bytes
+                ):
+                    await channel.publish(event.to_dict())
+        except SessionRejected as rejected:
+            await channel.publish(
+                event_payload("error", str(rejected), metadata={"reason": "server_busy"})
+            )
 
     try:
         while True:
@@ -541,198 +1146,275 @@ async def _run_council_websocket_stable(websocket: WebSocket):
                 await send_event("error", "Invalid JSON message")
                 continue
 
-            if message.get("type") != "task":
-                await send_event("error", "Unknown message type. Expected 'task'.")
+            message_type = message.get("type")
+            session_id = str(message.get("session_id") or "")
+
+            if message_type == "sessions":
+                running = [
+                    key for key, channel in sessions.items()
+                    if channel.running and channel.sender is sender
+                ]
+                await send_event(
+                    "status",
+                    f"{len(running)} session(s) running",
+                    metadata={"sessions": running},
+                )
                 continue
 
-            council_key = message.get("council", config.defaults.council)
-            task = message.get("task", "").strip()
-            settings = message.get("settings", {})
-            model_overrides = message.get("model_overrides", {})
+            if message_type == "cancel":
+                channel = sessions.get(session_id)
+                if channel is None or not channel.running:
+                    await send_event(
+                        "error", f"No running session '{session_id}'.", session_id=session_id
+                    )
+                    continue
+                channel.task.cancel()
+                await asyncio.gather(channel.task, return_exceptions=True)
+                logger.info(f"Session '{session_id}' cancelled by client")
+                await channel.publish(event_payload(
+                    "council_done", "Council session cancelled", metadata={"cancelled": True}
+                ))
+                continue
 
-            if not task:
-                await send_event("error", "Task cannot be empty.")
+            if message_type == "resume":
+                # Wrong tokens get the same answer as unknown sessions
+                channel = session_registry.claim(
+                    session_id, str(message.get("resume_token") or "")
+                )
+                if channel is None:
+                    await send_event(
+                        "error",
+                        f"Session '{session_id}' can't be resumed: it is unknown or has expired.",
+                        metadata={"reason": "session_expired"},
+                        session_id=session_id,
+                    )
+                    continue
+                try:
+                    last_seq = int(message.get("last_seq") or 0)
+                except (TypeError, ValueError):
+                    await send_event(
+                        "error", "last_seq must be a number.", session_id=session_id
+                    )
+                    continue
+                replayed, lost = await channel.attach(sender, last_seq)
+                sessions[session_id] = channel
+                logger.info(
+                    f"Session '{session_id}' resumed after seq {last_seq} "
+                    f"({replayed} replayed, {lost} lost)"
+                )
                 continue
 
-            if council_key not in config.councils:
+            if message_type != "task":
                 await send_event(
                     "error",
-                    f"Council '{council_key}' not found. Available: {list(config.councils.keys())}",
+                    "Unknown message type. Expected 'task', 'cancel', 'resume' or 'sessions'.",
+                    session_id=session_id,
                 )
                 continue
 
-            preset = config.councils[council_key]
-            if not preset.moderator:
-                await send_event("error", f"Council '{council_key}' has no moderator configured.")
+            session_id = session_id or uuid.uuid4().hex[:12]
+            if session_registry.get(session_id) is not None:
+                await send_event(
+                    "error", f"Session '{session_id}' already exists.", session_id=session_id
+                )
                 continue
 
+            council_key = message.get("council", config.defaults.council)
+            task = message.get("task", "").strip()
+            settings = message.get("settings", {})
+            model_overrides = message.get("model_overrides", {})
+
+            problem = _session_problem(council_key, task)
+            if problem:
+                await send_event("error", problem[1], session_id=session_id)
+                continue
+
+            preset = config.councils[council_key]
+
             temperature = settings.get("temperature", config.defaults.temperature)
             max_tokens = settings.get("max_tokens", config.defaults.max_tokens)
             debate_rounds = settings.get("debate_rounds", preset.debate_rounds)
+            try:
+                delivery = DeliveryMode(message.get("delivery") or config.defaults.delivery)
+            except ValueError:
+                await send_event(
+                    "error",
+                    f"Unknown delivery mode '{message.get('delivery')}'. "
+                    f"Expected one of {[m.value for m in DeliveryMode]}.",
+                    session_id=session_id,
+                )
+                continue
 
+            # Run the session as its own task so the socket stays readable
+            # (for more sessions, cancels and disconnects) while it generates
+            channel = session_registry.open(session_id)
+            channel.sender = sender
+            channel.task = asyncio.create_task(run_session(
+                channel, council_key, task, temperature, max_tokens,
+                debate_rounds, model_overrides, delivery,
+            ))
+            channel.task.add_done_callback(channel.finished)
+            sessions[session_id] = channel
+            # Goes out before the session's first event (it holds the sender
+            # lock first) and is not buffered, so replays never hand it on
             await send_event(
                 "status",
-                f"Starting {preset.name} ({preset.strategy.value} strategy)",
-                metadata={
-                    "council": council_key,
-                    "strategy": preset.strategy.value,
-                    "debate_rounds": debate_rounds,
-                },
+                f"Session '{session_id}' started",
+                metadata={"session_started": True, "resume_token": channel.resume_token},
+                session_id=session_id,
             )
 
-            try:
-                agents = engine._create_agents(preset.agents, model_overrides if model_overrides else None)
-                moderator = engine._create_moderator(preset.moderator, model_overrides if model_overrides else None)
+    except WebSocketDisconnect:
+        logger.info("WebSocket client disconnected")
+    except Exception as e:
+        logger.exception(f"WebSocket error: {e}")
+    finally:
+        connected_websockets.pop(websocket, None)
+        # Sessions keep running for a while in case the client comes back;
+        # unclaimed ones are cancelled when their grace period ends
+        for channel in sessions.values():
+            channel.detach(sender)
 
-                all_messages: list[dict[str, Any]] = []
+# =============================================================================
+# Streaming HTTP Endpoint — Council Sessions for Scripts and Proxies
+# =============================================================================
 
-                async def run_agent_turn(agent, round_num: int, messages: list[dict[str, str]]):
-                    await send_event(
-                        "model_loading",
-                        f"Loading model {agent.model_identifier}...",
-                        agent=agent.role,
-                        round_num=round_num,
-                        metadata={"model": agent.model_identifier},
-                    )
-                    await engine.client.ensure_model_loaded(agent.model_identifier)
-                    await send_event(
-                        "model_loaded",
-                        f"Model {agent.model_identifier} ready",
-                        agent=agent.role,
-                        round_num=round_num,
-                        metadata={"model": agent.model_identifier},
-                    )
+# Idle streams get a keepalive this often so proxies don't time them out
+# during long model loads
+STREAM_HEARTBEAT_SECONDS = 15.0
 
-                    await send_event(
-                        "agent_start",
-                        agent=agent.role,
-                        round_num=round_num,
-                        metadata={"model": agent.model_key},
-                    )
-                    response = await engine.client.chat_once(
-                        model_identifier=agent.model_identifier,
-                        messages=messages,
-                        temperature=temperature,
-                        max_tokens=max_tokens,
-                    )
-                    if not response.strip():
-                        response = "[No response text returned by model]"
 
-                    await send_event(
-                        "agent_done",
-                        content=response,
-                        agent=agent.role,
-                        round_num=round_num,
-                        metadata={"model": agent.model_key},
-                    )
-                    return response
-
-                if preset.strategy.value == "debate":
-                    for round_num in range(1, debate_rounds + 1):
-                        await send_event(
-                            "round_start",
-                            f"Round {round_num} of {debate_rounds}",
-                            round_num=round_num,
-                            metadata={"total_rounds": debate_rounds},
-                        )
-                        for agent in agents:
-                            history = all_messages if round_num > 1 else None
-                            messages = agent.build_messages(task=task, history=history, round_num=round_num)
-                            response = await run_agent_turn(agent, round_num, messages)
-                            all_messages.append({
-                                "role": agent.role,
-                                "content": response,
-                                "round": round_num,
-                            })
-                        await send_event("round_done", f"Round {round_num} complete", round_num=round_num)
-
-                elif preset.strategy.value == "pipeline":
-                    await send_event("round_start", "Pipeline processing", round_num=1)
-                    previous_output = ""
-                    for step_num, agent in enumerate(agents, 1):
-                        if step_num == 1:
-                            strategy_context = (
-                                f"You are step {step_num} of {len(agents)} in a pipeline. "
-                                "Create the initial solution."
-                            )
-                        else:
-                            previous_role = agents[step_num - 2].role
-                            strategy_context = (
-                                f"You are step {step_num} of {len(agents)} in a pipeline. "
-                                f"Build upon the previous output from {previous_role}.\n\n"
-                                f"Previous output:\n{previous_output}"
-                            )
-                        messages = agent.build_messages(
-                            task=task,
-                            round_num=1,
-                            strategy_context=strategy_context,
-                        )
-                        response = await run_agent_turn(agent, step_num, messages)
-                        previous_output = response
-                        all_messages.append({
-                            "role": agent.role,
-                            "content": response,
-                            "round": step_num,
-                        })
-                    await send_event("round_done", "Pipeline complete", round_num=1)
+class SessionRequest(BaseModel):
+    """Request body for a streamed council session (same fields as a WebSocket task)."""
+    task: str
+    council: Optional[str] = None
+    settings: dict[str, Any] = Field(default_factory=dict)
+    model_overrides: dict[str, str] = Field(default_factory=dict)
+    delivery: Optional[DeliveryMode] = None
+    coalesce_ms: Optional[float] = None
+    coalesce_bytes: Optional[int] = None
 
-                else:
-                    await send_event("round_start", "Collecting independent votes", round_num=1)
-                    for agent in agents:
-                        messages = agent.build_messages(task=task, history=None, round_num=1)
-                        response = await run_agent_turn(agent, 1, messages)
-                        all_messages.append({
-                            "role": agent.role,
-                            "content": response,
-                            "round": 1,
-                        })
-                    await send_event("round_done", "All votes collected", round_num=1)
-
-                await send_event("moderator_start", "Synthesizing...", agent="Moderator")
-                await send_event(
-                    "model_loading",
-                    f"Loading model {moderator.model_identifier}...",
-                    agent="Moderator",
-                    metadata={"model": moderator.model_identifier},
-                )
-                await engine.client.ensure_model_loaded(moderator.model_identifier)
-                await send_event(
-                    "model_loaded",
-                    f"Model {moderator.model_identifier} ready",
-                    agent="Moderator",
-                    metadata={"model": moderator.model_identifier},
-                )
 
-                moderator_messages = moderator.build_moderator_messages(
-                    task=task,
-                    all_messages=all_messages,
-                    strategy=preset.strategy.value,
-                )
-                moderator_response = await engine.client.chat_once(
-                    model_identifier=moderator.model_identifier,
-                    messages=moderator_messages,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                )
-                if not moderator_response.strip():
-                    moderator_response = "[No moderator response text returned]"
+@app.post("/api/sessions/stream")
+async def stream_session(
+    body: SessionRequest,
+    request: Request,
+    stream_format: Literal["sse", "ndjson"] = Query("sse", alias="format"),
+):
+    """
+    Run a council session and stream its events over plain HTTP.
 
-                await send_event(
-                    "moderator_done",
-                    content=moderator_response,
-                    agent="Moderator",
-                    metadata={"model": moderator.model_key},
-                )
-                await send_event("council_done", "Council session complete")
+    Streams the same events as ``/ws/council`` (each with a ``session_id``
+    and ``seq``, also the SSE event ID) as Server-Sent Events, or as
+    newline-delimited JSON with ``?format=ndjson`` (or ``Accept:
+    application/x-ndjson``). Closing the connection cancels the session.
 
-            except Exception as session_error:
-                logger.exception(f"Council session failed: {session_error}")
-                await send_event("error", f"Council session failed: {str(session_error)}")
+    Args:
+        body: The task, council and optional settings/delivery mode.
+        stream_format: The ``format`` query parameter, "sse" (default) or
+                       "ndjson"; anything else is rejected with a 422.
 
-    except WebSocketDisconnect:
-        logger.info("WebSocket client disconnected")
-    except Exception as e:
-        logger.exception(f"WebSocket error: {e}")
+    Returns:
+        A ``text/event-stream`` or ``application/x-ndjson`` streaming response.
+    """
+    council_key = body.council or config.defaults.council
+    task = body.task.strip()
+    problem = _session_problem(council_key, task)
+    if problem:
+        raise HTTPException(status_code=problem[0], detail=problem[1])
+
+    ndjson = (
+        stream_format == "ndjson"
+        or "application/x-ndjson" in request.headers.get("accept", "")
+    )
+
+    preset = config.councils[council_key]
+    settings = body.settings
+    session_id = uuid.uuid4().hex[:12]
+    delivery = body.delivery or config.defaults.delivery
+    flush_interval = (
+        body.coalesce_ms if body.coalesce_ms is not None
+        else config.defaults.coalesce_interval_ms
+    ) / 1000
+    coalesce_max_bytes = (
+        body.coalesce_bytes if body.coalesce_bytes is not None
+        else config.defaults.coalesce_max_bytes
+    )
+
+    # Events (or None at the end) from the session task to the response
+    outbox: asyncio.Queue[Optional[dict[str, Any]]] = asyncio.Queue()
+
+    async def report_queue_position(position: int):
+        await outbox.put({
+            "type": "status",
+            "agent": "",
+            "round": 0,
+            "content": f"Waiting for a free session slot (position {position} in queue)",
+            "timestamp": "",
+            "metadata": {"queue_position": position},
+        })
+
+    async def run_session():
+        try:
+            async with admission.admit(report_queue_position):
+                events = engine.run(
+                    council_key,
+                    task,
+                    temperature=settings.get("temperature", config.defaults.temperature),
+                    max_tokens=settings.get("max_tokens", config.defaults.max_tokens),
+                    debate_rounds=settings.get("debate_rounds", preset.debate_rounds),
+                    model_overrides=body.model_overrides or None,
+                )
+                async for event in deliver(
+                    events, delivery, flush_interval, coalesce_max_bytes
+                ):
+                    await outbox.put(event.to_dict())
+        except SessionRejected as rejected:
+            await outbox.put({
+                "type": "error",
+                "agent": "",
+                "round": 0,
+                "content": str(rejected),
+                "timestamp": "",
+                "metadata": {"reason": "server_busy"},
+            })
+        finally:
+            outbox.put_nowait(None)
+
+    def encode(payload: dict[str, Any], seq: int) -> str:
+        data = json.dumps({**payload, "session_id": session_id, "seq": seq})
+        if ndjson:
+            return data + "\n"
+        return f"id: {seq}\nevent: {payload['type']}\ndata: {data}\n\n"
+
+    async def stream():
+        session = asyncio.create_task(run_session())
+        seq = 0
+        try:
+            while True:
+                try:
+                    payload = await asyncio.wait_for(outbox.get(), STREAM_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield "\n" if ndjson else ": keepalive\n\n"
+                    continue
+                if payload is None:
+                    break
+                seq += 1
+                yield encode(payload, seq)
+        finally:
+            # Client gone (or done): stop the session and its generations
+            session.cancel()
+            await asyncio.gather(session, return_exceptions=True)
+
+    return StreamingResponse(
+        stream(),
+        media_type="application/x-ndjson" if ndjson else "text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+            "X-Session-Id": session_id,
+        },
+    )
 
 
 # =============================================================================
@@ -12,6 +12,15 @@ var state = {
   sessionStart:   null,
   timerInterval:  null,
   scores:         {},          // { agentName: { acc, comp, conc, tone } }
+  // How agent text arrives: 'coalesced' streams it; '?delivery=full' in the
+  // URL falls back to whole-turn cards only
+  delivery:       new URLSearchParams(location.search).get('delivery') || 'coalesced',
+  liveCards:      {},          // turn key → { card, text } while streaming
+  turnModels:     {},          // turn key → model, from agent_start
+  // The running session, resumed from lastSeq if the socket reconnects
+  sessionId:      null,
+  resumeToken:    null,
+  lastSeq:        0,
 };
 
 // Descriptions shown in the sidebar cards (from config key → description)
@@ -117,7 +126,7 @@ function selectCouncil(key) {
 function connectWs() {
   var protocol = location.protocol === 'https:' ? 'wss:' : 'ws:';
   state.ws = new WebSocket(protocol + '//' + location.host + '/ws/council');
-  state.ws.onopen    = function ()    { setConn(true); };
+  state.ws.onopen    = function ()    { setConn(true); resumeSession(); };
   state.ws.onclose   = function ()    { setConn(false); setTimeout(connectWs, 2000); };
   state.ws.onerror   = function ()    { setConn(false); };
   state.ws.onmessage = function (evt) {
@@ -125,6 +134,15 @@ function connectWs() {
   };
 }
 
+// After a reconnect, ask for the events of the running session we missed
+function resumeSession() {
+  if (!state.isRunning || !state.sessionId || !state.resumeToken) return;
+  state.ws.send(JSON.stringify({
+    type: 'resume', session_id: state.sessionId, resume_token: state.resumeToken,
+    last_seq: state.lastSeq,
+  }));
+}
+
 function setConn(ok) {
   var dot   = document.getElementById('connection-dot');
   var label = document.getElementById('conn-label');
@@ -157,9 +175,17 @@ function sendTask() {
   state.agentColors    = {};
   state.nextColorIndex = 1;
   state.scores         = {};
+  state.liveCards      = {};
+  state.turnModels     = {};
+  state.sessionId      = Math.random().toString(36).slice(2, 14);
+  state.resumeToken    = null;
+  state.lastSeq        = 0;
   addUserMessage(task);
 
-  state.ws.send(JSON.stringify({ type: 'task', council: state.selectedCouncil, task: task }));
+  state.ws.send(JSON.stringify({
+    type: 'task', session_id: state.sessionId, council: state.selectedCouncil,
+    task: task, delivery: state.delivery,
+  }));
 
   input.value = '';
   input.style.height = 'auto';
@@ -170,22 +196,42 @@ function sendTask() {
 
 /* ── Events ── */
 function handleEvent(e) {
+  // Session events are numbered; skip any seen before a reconnect
+  if (e.seq) {
+    if (e.session_id !== state.sessionId || e.seq <= state.lastSeq) return;
+    state.lastSeq = e.seq;
+  }
+
+  // The session's acknowledgement carries the token needed to resume it
+  if (e.type === 'status' && e.metadata && e.metadata.session_started) {
+    if (e.session_id === state.sessionId) state.resumeToken = e.metadata.resume_token;
+    return;
+  }
+
   if (e.type === 'status')
     return addStatus(e.content);
 
   if (e.type === 'round_start')
     return addRoundSeparator(e.round, e.metadata && e.metadata.total_rounds);
 
+  if (e.type === 'agent_start') {
+    state.turnModels[turnKey(e)] = e.metadata && e.metadata.model;
+    return;
+  }
+
+  if (e.type === 'agent_chunk' || e.type === 'moderator_chunk')
+    return appendChunk(e, e.type === 'moderator_chunk');
+
   if (e.type === 'agent_done') {
     var content = (e.content || '').trim() || '[No response]';
-    addAgentCard(e.agent, e.metadata && e.metadata.model, content, false);
+    finishCard(e, e.agent, content, false);
     recordScore(e.agent, content);
     return;
   }
 
   if (e.type === 'moderator_done') {
     var content = (e.content || '').trim() || '[No response]';
-    addAgentCard('Moderator', e.metadata && e.metadata.model, content, true);
+    finishCard(e, 'Moderator', content, true);
     return;
   }
 
@@ -294,6 +340,35 @@ function addAgentCard(role, model, content, isModerator) {
     '<div class="agent-card-footer">' + time + '</div>';
 
   appendMessage(card);
+  return card;
+}
+
+/* ── Streamed turns ── */
+function turnKey(e) {
+  var index = e.metadata && e.metadata.agent_index;
+  return [e.agent, e.round, index === undefined ? '' : index].join('|');
+}
+
+function appendChunk(e, isModerator) {
+  var key  = turnKey(e);
+  var live = state.liveCards[key];
+  if (!live) {
+    var role = isModerator ? 'Moderator' : e.agent;
+    live = state.liveCards[key] = {
+      card: addAgentCard(role, state.turnModels[key], '', isModerator),
+      text: '',
+    };
+  }
+  live.text += e.content || '';
+  live.card.querySelector('.agent-card-body').innerHTML = formatContent(live.text);
+}
+
+function finishCard(e, role, content, isModerator) {
+  var key  = turnKey(e);
+  var live = state.liveCards[key];
+  if (!live) return addAgentCard(role, e.metadata && e.metadata.model, content, isModerator);
+  live.card.querySelector('.agent-card-body').innerHTML = formatContent(content);
+  delete state.liveCards[key];
 }
 
 /* ── Scoreboard ── */
@@ -0,0 +1,146 @@
+"""
+BackendPool failover and hedging, against in-process fake servers.
+
+Each pool member is a real ``LMStudioClient`` whose HTTP traffic goes to an
+``httpx.MockTransport`` handler, so errors come from the same OpenAI client
+code paths as against a live LM Studio.
+"""
+
+import asyncio
+import json
+
+import httpx
+from openai import AsyncOpenAI
+
+from council.backends import Backend, BackendPool
+from council.lm_studio import LMStudioClient
+from council.profiler import TTFT_SECONDS, ModelProfiler
+
+MODEL = "qwen2.5-7b-instruct"
+MESSAGES = [{"role": "user", "content": "Hello"}]
+
+
+def _sse(text: str) -> bytes:
+    """A streamed chat completion that sends ``text`` one word at a time."""
+    first, *rest = text.split(" ")
+    events = [
+        {
+            "id": "chatcmpl-test",
+            "object": "chat.completion.chunk",
+            "created": 0,
+            "model": MODEL,
+            "choices": [{"index": 0, "delta": {"content": word}, "finish_reason": None}],
+        }
+        for word in [first, *(" " + word for word in rest)]
+    ]
+    body = "".join(f"data: {json.dumps(event)}\n\n" for event in events)
+    return (body + "data: [DONE]\n\n").encode()
+
+
+def _server(behaviour: str, text: str = "", delay: float = 0.0):
+    """A mock transport for one server: "ok", "error" (HTTP 500) or "dead"."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if behaviour == "dead":
+            raise httpx.ConnectError("connection refused", request=request)
+        if behaviour == "error":
+            return httpx.Response(500, json={"error": "model crashed"})
+        await asyncio.sleep(delay)
+        return httpx.Response(
+            200,
+            content=_sse(text),
+            headers={"content-type": "text/event-stream"},
+        )
+
+    return httpx.MockTransport(handler)
+
+
+def _backend(
+    name: str,
+    transport: httpx.MockTransport,
+    resident: bool = True,
+    profiler: ModelProfiler | None = None,
+) -> Backend:
+    client = LMStudioClient(f"http://{name}/v1", profiler=profiler)
+    client.openai_client = AsyncOpenAI(
+        base_url=f"http://{name}/v1",
+        api_key="lm-studio",
+        max_retries=0,
+        http_client=httpx.AsyncClient(transport=transport),
+    )
+    if resident:
+        client.residency.mark_loaded(MODEL)
+    return Backend(name, client)
+
+
+async def _collect(pool: BackendPool) -> str:
+    try:
+        return "".join([chunk async for chunk in pool.chat_stream(MODEL, MESSAGES)])
+    finally:
+        await pool.close()
+
+
+def _profiler(ttft: float, samples: int = 20) -> ModelProfiler:
+    profiler = ModelProfiler()
+    for _ in range(samples):
+        profiler.record_generation(MODEL, ttft_seconds=ttft, tokens=1, duration_seconds=ttft)
+    return profiler
+
+
+def test_fails_over_when_primary_returns_500():
+    pool = BackendPool([
+        _backend("box-a", _server("error")),
+        _backend("box-b", _server("ok", "hello from b")),
+    ])
+    assert asyncio.run(_collect(pool)) == "hello from b"
+
+
+def test_fails_over_when_primary_is_dead():
+    pool = BackendPool([
+        _backend("box-a", _server("dead")),
+        _backend("box-b", _server("ok", "hello from b")),
+    ])
+    assert asyncio.run(_collect(pool)) == "hello from b"
+
+
+def test_fast_primary_error_fails_over_before_hedge_delay():
+    pool = BackendPool(
+        [
+            _backend("box-a", _server("error")),
+            _backend("box-b", _server("ok", "hello from b")),
+        ],
+        profiler=_profiler(ttft=5.0),
+    )
+    assert asyncio.run(asyncio.wait_for(_collect(pool), timeout=2.0)) == "hello from b"
+
+
+def test_error_text_when_every_server_fails():
+    pool = BackendPool([
+        _backend("box-a", _server("error")),
+        _backend("box-b", _server("dead")),
+    ])
+    assert asyncio.run(_collect(pool)).startswith("\n\n[Error:")
+
+
+def test_hedges_to_resident_server_and_keeps_censored_ttft():
+    profiler = _profiler(ttft=0.05)
+    slow = _backend("box-a", _server("ok", "slow reply", delay=1.0), profiler=profiler)
+    fast = _backend("box-b", _server("ok", "fast reply"), profiler=profiler)
+    pool = BackendPool([slow, fast], profiler=profiler)
+    pool.route = lambda identifier: slow
+
+    assert asyncio.run(_collect(pool)) == "fast reply"
+    assert (fast.hedges_sent, fast.hedges_won) == (1, 1)
+    # The winner's TTFT plus the cancelled request's wait, which is at least
+    # the hedge delay
+    assert profiler.sample_count(MODEL, TTFT_SECONDS) == 22
+    assert profiler.percentile(MODEL, TTFT_SECONDS, 100) > 0.05
+
+
+def test_does_not_hedge_to_server_without_model_loaded():
+    slow = _backend("box-a", _server("ok", "slow reply", delay=0.3))
+    cold = _backend("box-b", _server("ok", "fast reply"), resident=False)
+    pool = BackendPool([slow, cold], profiler=_profiler(ttft=0.05))
+
+    assert asyncio.run(_collect(pool)) == "slow reply"
+    assert cold.hedges_sent == 0
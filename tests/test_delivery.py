@@ -0,0 +1,102 @@
+"""
+Coalesced delivery: merging, flushing, size caps and error propagation.
+"""
+
+import asyncio
+
+import pytest
+
+from council.delivery import deliver
+from council.models import ChunkEvent, CouncilEvent, DeliveryMode, EventType
+
+
+def _chunk(content: str, agent: str = "analyst", agent_index=None) -> ChunkEvent:
+    metadata = {"agent_index": agent_index} if agent_index is not None else None
+    return ChunkEvent(EventType.AGENT_CHUNK, agent, 1, content, metadata)
+
+
+async def _events(*events, delay: float = 0.0, error: Exception = None):
+    for event in events:
+        if delay:
+            await asyncio.sleep(delay)
+        yield event
+    if error is not None:
+        raise error
+
+
+def _coalesced(events, flush_interval: float = 0.05, max_bytes: int = 0) -> list:
+    async def main():
+        return [
+            event async for event in
+            deliver(events, DeliveryMode.COALESCED, flush_interval, max_bytes)
+        ]
+
+    return asyncio.run(main())
+
+
+def _summary(events) -> list[tuple[str, str]]:
+    return [(event.type.value, event.content) for event in events]
+
+
+def test_merges_consecutive_chunks_of_a_turn():
+    out = _coalesced(_events(_chunk("a"), _chunk("b"), _chunk("c")))
+    assert _summary(out) == [("agent_chunk", "abc")]
+
+
+def test_other_event_flushes_pending_merge_first():
+    done = CouncilEvent(type=EventType.AGENT_DONE, agent="analyst", round=1, content="ab")
+    out = _coalesced(
+        _events(_chunk("a"), _chunk("b"), done, _chunk("c")),
+        flush_interval=10.0,
+    )
+    assert _summary(out) == [
+        ("agent_chunk", "ab"),
+        ("agent_done", "ab"),
+        ("agent_chunk", "c"),
+    ]
+
+
+def test_max_bytes_caps_merged_events():
+    chunks = [_chunk("x" * 3) for _ in range(10)]
+    out = _coalesced(_events(*chunks), flush_interval=10.0, max_bytes=8)
+    sizes = [len(event.content) for event in out]
+    assert all(size <= 8 for size in sizes)
+    assert "".join(event.content for event in out) == "x" * 30
+    # A single chunk over the cap is still sent whole
+    out = _coalesced(_events(_chunk("y" * 20), _chunk("z")), max_bytes=8)
+    assert _summary(out) == [("agent_chunk", "y" * 20), ("agent_chunk", "z")]
+
+
+def test_parallel_turns_do_not_merge():
+    out = _coalesced(_events(
+        _chunk("a1", agent_index=0),
+        _chunk("b1", agent_index=1),
+        _chunk("b2", agent_index=1),
+        _chunk("a2", agent_index=0),
+    ))
+    assert [(e.content, e.metadata["agent_index"]) for e in out] == [
+        ("a1", 0), ("b1b2", 1), ("a2", 0)
+    ]
+
+
+def test_flush_interval_bounds_the_wait():
+    out = _coalesced(
+        _events(_chunk("a"), _chunk("b"), _chunk("c"), delay=0.03),
+        flush_interval=0.01,
+    )
+    assert _summary(out) == [("agent_chunk", c) for c in "abc"]
+
+
+def test_producer_exception_is_reraised_after_pending_events():
+    async def main():
+        received = []
+        with pytest.raises(RuntimeError, match="session failed"):
+            async for event in deliver(
+                _events(_chunk("a"), _chunk("b"), error=RuntimeError("session failed")),
+                DeliveryMode.COALESCED,
+                flush_interval=0.05,
+            ):
+                received.append(event.content)
+        return received
+
+    assert asyncio.run(main()) == ["ab"]
@@ -0,0 +1,51 @@
+"""
+The single-server and pool implementations of ``ResidencyView`` and
+``LimiterView`` offer the same members with the same parameters.
+"""
+
+import inspect
+
+import pytest
+
+from council.backends import Backend, BackendPool, PoolLimiter, PoolResidency
+from council.limiter import LimiterView, RequestLimiter
+from council.lm_studio import LMStudioClient, ModelResidencyManager, ResidencyView
+
+
+def _methods(protocol: type) -> list[str]:
+    return sorted(
+        name for name, value in vars(protocol).items()
+        if callable(value) and not name.startswith("_")
+    )
+
+
+def _parameters(cls: type, name: str) -> list[tuple[str, object]]:
+    signature = inspect.signature(inspect.getattr_static(cls, name))
+    return [(p.name, p.default) for p in signature.parameters.values()]
+
+
+@pytest.mark.parametrize(
+    "protocol, implementations",
+    [
+        (ResidencyView, [ModelResidencyManager, PoolResidency]),
+        (LimiterView, [RequestLimiter, PoolLimiter]),
+    ],
+)
+def test_methods_match_protocol(protocol, implementations):
+    for name in _methods(protocol):
+        expected = _parameters(protocol, name)
+        for cls in implementations:
+            assert name in dir(cls), f"{cls.__name__} lacks {name}()"
+            assert _parameters(cls, name) == expected, f"{cls.__name__}.{name}()"
+
+
+def test_clients_and_pools_provide_views():
+    client = LMStudioClient("http://lm/v1")
+    pool = BackendPool([
+        Backend("box-a", LMStudioClient("http://box-a/v1")),
+        Backend("box-b", LMStudioClient("http://box-b/v1")),
+    ])
+    # runtime_checkable also checks data members such as memory_budget_gb
+    for owner in (client, pool):
+        assert isinstance(owner.residency, ResidencyView)
+        assert isinstance(owner.limiter, LimiterView)
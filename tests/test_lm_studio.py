@@ -0,0 +1,249 @@
+"""
+LMStudioClient and ModelResidencyManager against an in-process fake LM Studio.
+
+``FakeLMStudio`` answers the model-management endpoints and streams chat
+completions through an ``httpx.MockTransport``, and records every load and
+unload with its time, so tests can check what happened and in which order.
+"""
+
+import asyncio
+import json
+import time
+
+import httpx
+from openai import AsyncOpenAI
+
+from council.lm_studio import LMStudioClient
+
+
+class FakeLMStudio:
+    """A scripted LM Studio server."""
+
+    def __init__(self, load_seconds: float = 0.0, token_seconds: float = 0.0):
+        self.load_seconds = load_seconds
+        self.token_seconds = token_seconds
+        self.loaded: set[str] = set()
+        # Loads that fail to connect before one succeeds
+        self.fail_loads = 0
+        # (time.monotonic(), operation, model)
+        self.calls: list[tuple[float, str, str]] = []
+
+    def ops(self, operation: str) -> list[str]:
+        return [model for _, op, model in self.calls if op == operation]
+
+    def at(self, operation: str, model: str) -> float:
+        return next(t for t, op, m in self.calls if op == operation and m == model)
+
+    async def _stream(self, model: str, tokens: int):
+        for n in range(tokens):
+            await asyncio.sleep(self.token_seconds)
+            chunk = {
+                "id": "chatcmpl-test",
+                "object": "chat.completion.chunk",
+                "created": 0,
+                "model": model,
+                "choices": [{"index": 0, "delta": {"content": f"t{n} "}, "finish_reason": None}],
+            }
+            yield f"data: {json.dumps(chunk)}\n\n".encode()
+        self.calls.append((time.monotonic(), "stream_done", model))
+        yield b"data: [DONE]\n\n"
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path == "/api/v0/models":
+            return httpx.Response(
+                200, json={"data": [{"id": m, "state": "loaded"} for m in self.loaded]}
+            )
+        if path == "/v1/models/load":
+            model = json.loads(request.content)["model"]
+            self.calls.append((time.monotonic(), "load", model))
+            await asyncio.sleep(self.load_seconds)
+            if self.fail_loads:
+                self.fail_loads -= 1
+                raise httpx.ConnectError("connection refused", request=request)
+            self.loaded.add(model)
+            return httpx.Response(200, json={})
+        if path == "/v1/models/unload":
+            model = json.loads(request.content)["model"]
+            self.calls.append((time.monotonic(), "unload", model))
+            self.loaded.discard(model)
+            return httpx.Response(200, json={})
+        if path == "/v1/chat/completions":
+            model = json.loads(request.content)["model"]
+            self.calls.append((time.monotonic(), "stream_start", model))
+            return httpx.Response(
+                200,
+                content=self._stream(model, tokens=5),
+                headers={"content-type": "text/event-stream"},
+            )
+        return httpx.Response(404)
+
+    def client(self, memory_budget_gb: float = 0.0, **models_gb: float) -> LMStudioClient:
+        transport = httpx.MockTransport(self.handle)
+        client = LMStudioClient("http://lm/v1", memory_budget_gb=memory_budget_gb)
+        client._http_client = httpx.AsyncClient(base_url="http://lm", transport=transport)
+        client.openai_client = AsyncOpenAI(
+            base_url="http://lm/v1",
+            api_key="lm-studio",
+            max_retries=0,
+            http_client=httpx.AsyncClient(transport=transport),
+        )
+        for identifier, gb in models_gb.items():
+            client.residency.register_model(identifier, memory_gb=gb)
+        return client
+
+
+MESSAGES = [{"role": "user", "content": "Hello"}]
+
+
+async def _generate(client: LMStudioClient, model: str) -> str:
+    return "".join([chunk async for chunk in client.chat_stream(model, MESSAGES)])
+
+
+# -----------------------------------------------------------------------------
+# Eviction never interrupts a completion
+# -----------------------------------------------------------------------------
+
+
+def test_eviction_waits_for_in_flight_completion():
+    async def main():
+        server = FakeLMStudio(token_seconds=0.05)
+        client = server.client(10.0, x=5.0, y=5.0, z=5.0)
+        await client.ensure_model_loaded("x")
+        await client.ensure_model_loaded("y")
+
+        # Session 1 generates on x; session 2 then needs z while keeping y,
+        # which only fits by evicting x
+        generating = asyncio.create_task(_generate(client, "x"))
+        await asyncio.sleep(0.05)
+        loaded = await client.ensure_model_loaded("z", protect=["y"])
+        output = await generating
+        await client.close()
+        return server, client, loaded, output
+
+    server, client, loaded, output = asyncio.run(main())
+    assert loaded
+    assert output.startswith("t0 ") and "[Error" not in output
+    assert server.at("unload", "x") >= server.at("stream_done", "x")
+    assert not client.residency.is_pinned("x")
+    assert set(client.residency.resident_identifiers()) == {"y", "z"}
+
+
+def test_two_sessions_keep_each_others_models():
+    async def main():
+        server = FakeLMStudio(token_seconds=0.02)
+        client = server.client(10.0, a=5.0, b=5.0, c=5.0)
+
+        async def session(model: str, start: float):
+            await asyncio.sleep(start)
+            await client.ensure_model_loaded(model)
+            return await _generate(client, model)
+
+        # c arrives while a and b are both generating and fills the budget
+        outputs = await asyncio.gather(
+            session("a", 0.0), session("b", 0.01), session("c", 0.03)
+        )
+        await client.close()
+        return server, outputs
+
+    server, outputs = asyncio.run(main())
+    assert all("[Error" not in output for output in outputs)
+    # a was evicted for c, but only once its completion had finished
+    assert server.ops("unload") == ["a"]
+    assert server.at("unload", "a") >= server.at("stream_done", "a")
+
+
+def test_fits_counts_pinned_models():
+    server = FakeLMStudio()
+    client = server.client(10.0, x=5.0, y=6.0)
+    client.residency.mark_loaded("x")
+    assert client.residency.plan_evictions("y") == ["x"]
+    with client.residency.pin("x"):
+        assert not client.residency.fits("y")
+        assert client.residency.plan_evictions("y") == []
+    assert client.residency.fits("y")
+
+
+# -----------------------------------------------------------------------------
+# Single-flight load/unload
+# -----------------------------------------------------------------------------
+
+
+def test_concurrent_ensure_loaded_issues_one_load():
+    async def main():
+        server = FakeLMStudio(load_seconds=0.05)
+        client = server.client()
+        results = await asyncio.gather(
+            *(client.ensure_model_loaded("x") for _ in range(5)),
+            *(client.load_model("x") for _ in range(3)),
+        )
+        await client.close()
+        return server, client, results
+
+    server, client, results = asyncio.run(main())
+    assert all(results)
+    assert server.ops("load") == ["x"]
+    assert client.residency.is_resident("x")
+
+
+def test_unload_requested_during_load_runs_after_it():
+    async def main():
+        server = FakeLMStudio(load_seconds=0.05)
+        client = server.client()
+        loading = asyncio.create_task(client.load_model("x"))
+        await asyncio.sleep(0.01)
+        unloaded = await client.unload_model("x")
+        loaded = await loading
+        await client.close()
+        return server, client, loaded, unloaded
+
+    server, client, loaded, unloaded = asyncio.run(main())
+    assert loaded and unloaded
+    assert [op for _, op, _ in server.calls] == ["load", "unload"]
+    assert not client.residency.is_resident("x")
+    assert "x" not in server.loaded
+
+
+def test_failed_load_is_retried_by_next_caller():
+    async def main():
+        server = FakeLMStudio(load_seconds=0.02)
+        server.fail_loads = 1
+        client = server.client()
+        first = await asyncio.gather(*(client.load_model("x") for _ in range(3)))
+        second = await client.ensure_model_loaded("x")
+        await client.close()
+        return server, client, first, second
+
+    server, client, first, second = asyncio.run(main())
+    # Callers that shared the failed request all saw the failure; the next
+    # caller issued a fresh request instead of reusing it
+    assert first == [False, False, False]
+    assert second
+    assert server.ops("load") == ["x", "x"]
+    assert client.residency.is_resident("x")
+
+
+def test_shared_op_exception_reaches_every_caller_once():
+    async def main():
+        client = FakeLMStudio().client()
+        attempts = []
+
+        async def flaky(identifier: str) -> bool:
+            attempts.append(identifier)
+            await asyncio.sleep(0.01)
+            if len(attempts) == 1:
+                raise RuntimeError("server went away")
+            return True
+
+        first = await asyncio.gather(
+            *(client._run_model_op("load", "x", flaky) for _ in range(2)),
+            return_exceptions=True,
+        )
+        second = await client._run_model_op("load", "x", flaky)
+        await client.close()
+        return attempts, first, second
+
+    attempts, first, second = asyncio.run(main())
+    assert all(isinstance(result, RuntimeError) for result in first)
+    assert second is True
+    assert attempts == ["x", "x"]
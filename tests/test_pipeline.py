@@ -0,0 +1,76 @@
+"""
+Overlapped pipeline stages and the cross-session turn queue.
+
+Runs ``PipelineStrategy`` against a fake client that streams canned
+paragraphs and counts how many completions are generating at once.
+"""
+
+import asyncio
+
+import pytest
+
+from council.agent import Agent
+from council.lm_studio import ModelResidencyManager
+from council.models import EventType, ExecutionMode
+from council.scheduling import ModelAffinityQueue
+from council.strategies.pipeline import PipelineStrategy
+
+# Five paragraphs: the first four form a stable prefix and the last is a
+# short enough tail for an early start on them to be kept
+PARAGRAPHS = ["x" * 99 + "\n\n"] * 5
+
+
+class FakeClient:
+    """Streams ``PARAGRAPHS`` for every model; all models are always loaded."""
+
+    def __init__(self):
+        self.residency = ModelResidencyManager(client=None)
+        self.active = 0
+        self.max_active = 0
+
+    async def ensure_model_loaded(self, identifier, protect=()):
+        self.residency.mark_loaded(identifier)
+        return True
+
+    async def chat_stream(self, model_identifier, messages, temperature, max_tokens):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            for paragraph in PARAGRAPHS:
+                await asyncio.sleep(0.01)
+                yield paragraph
+        finally:
+            self.active -= 1
+
+    async def chat_once(self, model_identifier, messages, temperature, max_tokens):
+        return "".join(PARAGRAPHS)
+
+
+def _run(max_concurrent_turns: int):
+    async def main():
+        client = FakeClient()
+        queue = ModelAffinityQueue(client.residency, max_concurrent=max_concurrent_turns)
+        strategy = PipelineStrategy(
+            client,
+            [Agent(role, f"model-{role}", f"model-{role}", "") for role in "abc"],
+            Agent("Moderator", "model-m", "model-m", ""),
+            turn_queue=queue,
+            execution_mode=ExecutionMode.OVERLAPPED,
+        )
+        events = [event async for event in strategy.execute("task")]
+        return client, queue, events[-1]
+
+    return asyncio.run(asyncio.wait_for(main(), timeout=5.0))
+
+
+@pytest.mark.parametrize("max_concurrent_turns", [1, 2])
+def test_early_start_holds_its_own_turn_slot(max_concurrent_turns):
+    client, queue, done = _run(max_concurrent_turns)
+
+    assert done.type == EventType.COUNCIL_DONE
+    # Never more completions at once than the queue grants turns
+    assert client.max_active == max_concurrent_turns
+    assert queue.stats()["running"] == []
+    if max_concurrent_turns > 1:
+        assert done.metadata["speculations_kept"] >= 1
+        assert done.metadata["overlapped_seconds"] > 0
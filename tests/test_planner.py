@@ -0,0 +1,59 @@
+"""
+CouncilPlanner against a single server and against a backend pool.
+
+Uses the repository's config.yaml; nothing here talks to a server.
+"""
+
+import logging
+from pathlib import Path
+
+import pytest
+
+from council.config import BackendConfig, load_config
+from council.engine import CouncilEngine
+
+CONFIG_PATH = Path(__file__).resolve().parent.parent / "config.yaml"
+
+
+def _engine(servers: int = 0, budget_gb: float = 12.0) -> CouncilEngine:
+    config = load_config(str(CONFIG_PATH))
+    config.profiling.enabled = False
+    config.lm_studio.memory_budget_gb = budget_gb
+    config.backends.servers = [
+        BackendConfig(name=f"box-{n}", base_url=f"http://box-{n}:1234/v1")
+        for n in range(servers)
+    ]
+    return CouncilEngine(config)
+
+
+@pytest.mark.parametrize("servers", [0, 2])
+def test_plans_every_council(servers):
+    engine = _engine(servers)
+    for key in engine.config.councils:
+        plan = engine.planner.plan(key)
+        assert plan["sequence"]
+        assert plan["loads"] >= len(set(plan["sequence"])) - plan["swaps"]
+
+
+def test_pool_predicts_resident_set_per_server():
+    engine = _engine(servers=2)
+    residency = engine.client.residency
+    identifiers = [
+        engine._resolve_model_identifier(key) for key in list(engine.config.models)[:3]
+    ]
+
+    predicted = residency.predict_resident(identifiers, [])
+
+    # Every model fits within its own server's budget; last used comes last
+    assert predicted[-1] == identifiers[-1]
+    assert set(predicted) <= set(identifiers)
+
+
+def test_log_all_survives_planner_errors(caplog):
+    engine = _engine(servers=2)
+    engine.planner.turn_sequence = lambda *args, **kwargs: 1 / 0
+
+    with caplog.at_level(logging.WARNING):
+        engine.planner.log_all()
+
+    assert "planning failed" in caplog.text
@@ -0,0 +1,69 @@
+"""
+ModelProfiler persistence: writes stay off the event loop and shutdown
+flushes the last samples.
+"""
+
+import asyncio
+import json
+import threading
+
+from council.profiler import TTFT_SECONDS, ModelProfiler
+
+MODEL = "qwen2.5-7b-instruct"
+
+
+def _watch_writes(profiler: ModelProfiler) -> list[int]:
+    """Record the thread of every file write."""
+    threads: list[int] = []
+    write = profiler._write
+
+    def watched(data):
+        threads.append(threading.get_ident())
+        return write(data)
+
+    profiler._write = watched
+    return threads
+
+
+def test_record_in_event_loop_writes_in_a_worker_thread(tmp_path):
+    path = tmp_path / "profile.json"
+    profiler = ModelProfiler(str(path))
+    threads = _watch_writes(profiler)
+
+    async def main():
+        profiler.record_ttft(MODEL, 0.5)
+        # Scheduled, not written inline
+        assert threads == []
+        await profiler._saving
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(main())
+    assert len(threads) == 1 and threads[0] != loop_thread
+    assert json.loads(path.read_text())["models"][MODEL][TTFT_SECONDS]["samples"] == [0.5]
+
+
+def test_flush_writes_samples_recorded_since_last_save(tmp_path):
+    path = tmp_path / "profile.json"
+    profiler = ModelProfiler(str(path))
+    threads = _watch_writes(profiler)
+
+    async def main():
+        profiler.record_ttft(MODEL, 0.5)
+        await profiler._saving
+        # Within the save interval: only kept in memory
+        profiler.record_ttft(MODEL, 0.7)
+        assert len(threads) == 1
+        await profiler.flush()
+        await profiler.flush()  # Nothing new to write
+
+    asyncio.run(main())
+    assert len(threads) == 2
+    reloaded = ModelProfiler(str(path))
+    assert reloaded.sample_count(MODEL, TTFT_SECONDS) == 2
+
+
+def test_save_without_event_loop_writes_inline(tmp_path):
+    path = tmp_path / "profile.json"
+    profiler = ModelProfiler(str(path))
+    profiler.record_load(MODEL, 8.4)
+    assert ModelProfiler(str(path)).expected(MODEL, "load_seconds") == 8.4
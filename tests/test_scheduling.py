@@ -0,0 +1,142 @@
+"""
+ModelAffinityQueue: model batching, the aging bound, cancellation and stats.
+"""
+
+import asyncio
+import time
+
+from council.lm_studio import ModelResidencyManager
+from council.scheduling import ModelAffinityQueue
+
+
+def _queue(resident=(), **kwargs) -> ModelAffinityQueue:
+    residency = ModelResidencyManager(client=None)
+    for identifier in resident:
+        residency.mark_loaded(identifier)
+    return ModelAffinityQueue(residency, **kwargs)
+
+
+async def _turn(queue: ModelAffinityQueue, model: str, seconds: float, log: list):
+    async with queue.turn(model):
+        log.append(model)
+        await asyncio.sleep(seconds)
+
+
+def test_batches_turns_on_the_model_in_use():
+    async def main():
+        queue = _queue(resident=["a"], max_concurrent=1)
+        log: list[str] = []
+        turns = [asyncio.create_task(_turn(queue, "a", 0.01, log))]
+        await asyncio.sleep(0)
+        for model in ["b", "a", "b", "a"]:
+            turns.append(asyncio.create_task(_turn(queue, model, 0.01, log)))
+        await asyncio.gather(*turns)
+        return queue, log
+
+    queue, log = asyncio.run(main())
+    assert log == ["a", "a", "a", "b", "b"]
+    stats = queue.stats()
+    assert stats["turns_granted"] == 5
+    # Only the switch to the cold model b costs a swap
+    assert stats["model_swaps"] == 1
+    assert stats["aged_grants"] == 0
+    assert stats["queue_depth"] == 0 and stats["running"] == []
+
+
+def test_cold_model_is_served_within_max_wait():
+    max_wait, turn_seconds = 0.1, 0.02
+
+    async def main():
+        queue = _queue(resident=["hot"], max_concurrent=1, max_wait_seconds=max_wait)
+        log: list[str] = []
+        stop = asyncio.Event()
+
+        async def hot_session():
+            while not stop.is_set():
+                await _turn(queue, "hot", turn_seconds, log)
+
+        # Several sessions looping on the warm model always have a turn
+        # waiting, which would starve "cold" without the aging bound
+        hot = asyncio.gather(*(hot_session() for _ in range(3)))
+        await asyncio.sleep(0.005)
+        started = time.monotonic()
+        await _turn(queue, "cold", 0, log)
+        waited = time.monotonic() - started
+        stop.set()
+        await hot
+        return queue, waited
+
+    queue, waited = asyncio.run(main())
+    # Aging is checked when a slot frees, so allow one turn past the bound
+    assert waited <= max_wait + turn_seconds + 0.05
+    assert queue.stats()["aged_grants"] >= 1
+
+
+def test_cancelled_waiter_gives_up_its_place():
+    async def main():
+        queue = _queue(max_concurrent=1)
+        log: list[str] = []
+        holder = asyncio.create_task(_turn(queue, "a", 0.05, log))
+        await asyncio.sleep(0)
+        cancelled = asyncio.create_task(_turn(queue, "b", 0.01, log))
+        waiting = asyncio.create_task(_turn(queue, "c", 0.01, log))
+        await asyncio.sleep(0.01)
+        assert queue.stats()["queue_depth"] == 2
+
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        depth_after_cancel = queue.stats()["queue_depth"]
+        await asyncio.gather(holder, waiting)
+        return queue, log, depth_after_cancel
+
+    queue, log, depth_after_cancel = asyncio.run(main())
+    assert depth_after_cancel == 1
+    assert log == ["a", "c"]
+    assert queue.stats()["running"] == []
+    assert queue.stats()["turns_granted"] == 2
+
+
+def test_waiter_cancelled_as_it_is_granted_releases_the_slot():
+    async def main():
+        queue = _queue(max_concurrent=1)
+        log: list[str] = []
+        release = asyncio.Event()
+
+        async def holder():
+            async with queue.turn("a"):
+                await release.wait()
+            # Leaving the turn granted "b"; cancel it before it gets to run
+            granted_then_cancelled.cancel()
+
+        holding = asyncio.create_task(holder())
+        await asyncio.sleep(0)
+        granted_then_cancelled = asyncio.create_task(_turn(queue, "b", 0.01, log))
+        later = asyncio.create_task(_turn(queue, "c", 0.01, log))
+        await asyncio.sleep(0)
+
+        release.set()
+        await holding
+        await asyncio.gather(granted_then_cancelled, return_exceptions=True)
+        await asyncio.wait_for(later, timeout=1.0)
+        return queue, log
+
+    queue, log = asyncio.run(main())
+    assert log == ["c"]
+    assert queue.stats()["running"] == []
+
+
+def test_stats_report_waits_and_concurrency():
+    async def main():
+        queue = _queue(max_concurrent=2, max_wait_seconds=5.0)
+        log: list[str] = []
+        await asyncio.gather(*(_turn(queue, "a", 0.02, log) for _ in range(4)))
+        return queue
+
+    stats = asyncio.run(main()).stats()
+    assert stats["max_concurrent"] == 2
+    assert stats["max_wait_seconds"] == 5.0
+    assert stats["turns_granted"] == 4
+    # Two turns start at once, two wait about one turn
+    assert stats["wait_seconds"]["max"] >= 0.015
+    assert 0 < stats["wait_seconds"]["avg"] < stats["wait_seconds"]["max"]
+    assert stats["wait_seconds"]["p95"] <= stats["wait_seconds"]["max"]
@@ -0,0 +1,73 @@
+"""
+Resumable WebSocket sessions: resume tokens and replay after a reconnect.
+
+Drives ``SessionRegistry`` and ``_SessionChannel`` directly with a fake
+socket; nothing here talks to a server.
+"""
+
+import asyncio
+
+import pytest
+
+from server import SessionRegistry, _EventSender
+
+
+class FakeWebSocket:
+    """Records what a connection was sent."""
+
+    def __init__(self):
+        self.sent: list[dict] = []
+
+    async def send_json(self, payload: dict):
+        self.sent.append(payload)
+
+
+def _replay(buffer_events: int, published: int, after_seq: int):
+    async def main():
+        registry = SessionRegistry(buffer_events, grace_seconds=60.0)
+        channel = registry.open("run-1")
+        # Published while detached, so only the buffer keeps them
+        for n in range(published):
+            await channel.publish({"type": "agent_chunk", "content": f"c{n}"})
+        websocket = FakeWebSocket()
+        replayed, lost = await channel.attach(_EventSender(websocket, compact=False), after_seq)
+        channel._cancel_expiry()
+        return replayed, lost, websocket.sent
+
+    return asyncio.run(main())
+
+
+@pytest.mark.parametrize(
+    "after_seq, replayed, lost",
+    [
+        (0, 3, 7),    # saw nothing: the first seven are gone
+        (2, 3, 5),    # saw 1-2: 3-7 are gone
+        (7, 3, 0),    # saw up to just before the oldest buffered event
+        (8, 2, 0),    # saw some of the buffer
+        (10, 0, 0),   # up to date
+    ],
+)
+def test_lost_counts_events_that_left_the_wrapped_buffer(after_seq, replayed, lost):
+    result = _replay(buffer_events=3, published=10, after_seq=after_seq)
+    assert result[:2] == (replayed, lost)
+
+    resumed, *events = result[2]
+    assert resumed["metadata"] == {"resumed": True, "replayed": replayed, "lost": lost}
+    assert [event["seq"] for event in events] == list(range(11 - replayed, 11))
+
+
+def test_nothing_lost_before_the_buffer_wraps():
+    replayed, lost, _ = _replay(buffer_events=10, published=4, after_seq=1)
+    assert (replayed, lost) == (3, 0)
+
+
+def test_resume_requires_the_sessions_token():
+    registry = SessionRegistry(buffer_events=10, grace_seconds=60.0)
+    channel = registry.open("run-1")
+    other = registry.open("run-2")
+
+    assert registry.claim("run-1", channel.resume_token) is channel
+    assert registry.claim("run-1", "") is None
+    assert registry.claim("run-1", other.resume_token) is None
+    assert registry.claim("run-3", channel.resume_token) is None
+    assert len(channel.resume_token) >= 32
@@ -0,0 +1,110 @@
+"""
+Compact wire protocol: encode → decode round trips and field limits.
+"""
+
+import pytest
+
+from council.models import EventType
+from council.wire import (
+    COMPRESS_MIN_BYTES,
+    DEFINE,
+    DEFINE_SESSION,
+    EVENT_CODES,
+    FLAG_COMPRESSED,
+    MAX_ROUND,
+    MAX_SEQ,
+    CompactDecoder,
+    CompactEncoder,
+)
+
+
+def _round_trip(encoder, decoder, event, session_id=""):
+    frames = encoder.encode(event, session_id=session_id)
+    decoded = [d for frame in frames if (d := decoder.decode(frame)) is not None]
+    assert len(decoded) == 1
+    return frames, decoded[0]
+
+
+def test_every_event_type_round_trips():
+    assert set(EVENT_CODES) == set(EventType)
+    encoder, decoder = CompactEncoder(), CompactDecoder()
+    for n, event_type in enumerate(EventType):
+        event = {
+            "type": event_type.value,
+            "agent": f"agent-{n % 3}",
+            "round": n,
+            "content": f"text for {event_type.value}",
+            "metadata": {"model": "qwen2.5-7b-instruct", "agent_index": n},
+            "seq": n,
+        }
+        _, decoded = _round_trip(encoder, decoder, event, session_id="run-1")
+        assert decoded == {**event, "session_id": "run-1"}
+
+
+def test_optional_parts_are_omitted():
+    encoder, decoder = CompactEncoder(), CompactDecoder()
+    _, decoded = _round_trip(encoder, decoder, {"type": "status"})
+    assert decoded == {
+        "type": "status", "session_id": "", "agent": "", "round": 0,
+        "content": "", "metadata": {},
+    }
+
+
+def test_long_content_is_compressed():
+    encoder, decoder = CompactEncoder(), CompactDecoder()
+    content = "The council agrees. " * (COMPRESS_MIN_BYTES // 10)
+    frames, decoded = _round_trip(
+        encoder, decoder, {"type": "agent_done", "agent": "analyst", "content": content}
+    )
+    event_frame = frames[-1]
+    assert event_frame[1] & FLAG_COMPRESSED
+    assert len(event_frame) < len(content)
+    assert decoded["content"] == content
+
+
+def test_seq_flag():
+    encoder, decoder = CompactEncoder(), CompactDecoder()
+    _, with_seq = _round_trip(encoder, decoder, {"type": "agent_chunk", "seq": MAX_SEQ})
+    _, without = _round_trip(encoder, decoder, {"type": "agent_chunk"})
+    assert with_seq["seq"] == MAX_SEQ
+    assert "seq" not in without
+
+
+def test_names_are_defined_once():
+    encoder = CompactEncoder()
+    first = encoder.encode({"type": "agent_chunk", "agent": "analyst"}, "run-1")
+    again = encoder.encode({"type": "agent_chunk", "agent": "analyst"}, "run-1")
+    assert [f[0] for f in first] == [DEFINE, DEFINE, EVENT_CODES[EventType.AGENT_CHUNK]]
+    assert len(again) == 1
+
+
+def test_refs_are_reused_once_max_refs_is_exceeded():
+    encoder, decoder = CompactEncoder(max_refs=2), CompactDecoder()
+    seen = []
+    for session_id in ["s1", "s2", "s1", "s3", "s1", "s2"]:
+        frames, decoded = _round_trip(
+            encoder, decoder, {"type": "status"}, session_id=session_id
+        )
+        defines = [f for f in frames if f[0] == DEFINE and f[1] == DEFINE_SESSION]
+        seen.append((decoded["session_id"], len(defines)))
+    # s3 takes over s2's ref (least recently used); s2 is defined again later
+    assert seen == [("s1", 1), ("s2", 1), ("s1", 0), ("s3", 1), ("s1", 0), ("s2", 1)]
+    assert len(encoder.refs[DEFINE_SESSION]) == 2
+    assert set(decoder.names[DEFINE_SESSION].values()) == {"s1", "s2"}
+
+
+@pytest.mark.parametrize(
+    "event",
+    [
+        {"type": "round_start", "round": MAX_ROUND + 1},
+        {"type": "round_start", "round": -1},
+        {"type": "agent_chunk", "seq": MAX_SEQ + 1},
+    ],
+)
+def test_out_of_range_fields_are_rejected_before_interning(event):
+    encoder = CompactEncoder()
+    with pytest.raises(ValueError):
+        encoder.encode({**event, "agent": "analyst"}, session_id="run-1")
+    # Nothing was interned, so the next event still defines its names
+    frames = encoder.encode({"type": "status", "agent": "analyst"}, session_id="run-1")
+    assert [f[0] for f in frames][:2] == [DEFINE, DEFINE]